@@ -0,0 +1,82 @@
+"""Aggregate queries over even squares without iterating.
+
+Counting or summing ``x**2`` over the even ``x`` of a range has a closed
+form, so ``count_evens`` and ``sum_even_squares`` answer in O(1) whatever
+the size of the range (bounds are half-open, like ``range(lo, hi)``).  The
+results are memoized, which helps when the bounds are huge and the
+big-integer arithmetic stops being free.
+
+For arbitrary stored sequences, ``EvenSquaresIndex`` builds prefix sums
+once and then answers the same queries over any slice in O(1).
+"""
+from functools import lru_cache
+from itertools import accumulate
+
+
+def _sum_squares_below(n):
+    # sum(k**2 for k in range(0, n)) as a polynomial, which also makes
+    # _sum_squares_below(b) - _sum_squares_below(a) right for negative a, b
+    return (n - 1) * n * (2 * n - 1) // 6
+
+
+@lru_cache(maxsize=4096)
+def count_evens(lo, hi):
+    """Number of even integers in ``range(lo, hi)``."""
+    if hi <= lo:
+        return 0
+    # Even x = 2k with lo <= 2k < hi  <=>  ceil(lo / 2) <= k < ceil(hi / 2)
+    return (hi + 1) // 2 - (lo + 1) // 2
+
+
+@lru_cache(maxsize=4096)
+def sum_evens(lo, hi):
+    """Sum of the even integers in ``range(lo, hi)``."""
+    if hi <= lo:
+        return 0
+    a, b = (lo + 1) // 2, (hi + 1) // 2
+    return (b - a) * (a + b - 1)    # 2 * sum(range(a, b))
+
+
+@lru_cache(maxsize=4096)
+def sum_even_squares(lo, hi):
+    """``sum(x**2 for x in range(lo, hi) if x % 2 == 0)`` in O(1)."""
+    if hi <= lo:
+        return 0
+    a, b = (lo + 1) // 2, (hi + 1) // 2
+    return 4 * (_sum_squares_below(b) - _sum_squares_below(a))
+
+
+class EvenSquaresIndex:
+    """Prefix sums over a stored sequence of integers.
+
+    Building the index is O(n); afterwards every query over a positional
+    slice ``values[start:stop]`` is O(1).
+    """
+
+    def __init__(self, values):
+        values = list(values)
+        self._count = [0, *accumulate(1 - (x & 1) for x in values)]
+        self._squares = [0, *accumulate(0 if x & 1 else x * x for x in values)]
+
+    def __len__(self):
+        return len(self._count) - 1
+
+    def _bounds(self, start, stop):
+        n = len(self._count) - 1
+        if stop is None:
+            stop = n
+        if 0 <= start <= stop <= n:
+            return start, stop
+        # Negative or out-of-range bounds: same meaning as slicing
+        start, stop, _ = slice(start, stop).indices(n)
+        return start, max(start, stop)
+
+    def count_evens(self, start=0, stop=None):
+        """Number of even values in ``values[start:stop]``."""
+        start, stop = self._bounds(start, stop)
+        return self._count[stop] - self._count[start]
+
+    def sum_even_squares(self, start=0, stop=None):
+        """Sum of the squares of the even values in ``values[start:stop]``."""
+        start, stop = self._bounds(start, stop)
+        return self._squares[stop] - self._squares[start]
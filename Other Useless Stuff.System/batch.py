@@ -0,0 +1,134 @@
+"""Batch versions of the ``functionsV2`` helpers.
+
+NumPy is optional: array inputs are computed in a single vectorized call
+when it is installed, and everything falls back to plain Python loops when
+it is not.  Streaming helpers work chunk by chunk so inputs larger than
+memory never have to be materialized.
+"""
+from itertools import chain, islice, starmap
+from operator import mul
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+# Pairs per chunk in the streaming helpers
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+
+def calculate_area_many(lengths, widths=1):
+    """Areas of many rectangles; ``widths`` broadcasts like ``calculate_area``.
+
+    ``lengths`` and ``widths`` may be NumPy arrays, sequences or scalars.
+    Returns an ndarray when NumPy is available, otherwise a list (or a
+    single area when both are scalars).
+    """
+    if np is not None:
+        return np.multiply(np.asarray(lengths), np.asarray(widths))
+
+    if _is_scalar(lengths) and _is_scalar(widths):
+        return lengths * widths
+    lengths, widths = _broadcast(lengths, widths, "lengths", "widths")
+    return list(map(mul, lengths, widths))
+
+
+def iter_area_chunks(pairs, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yield the areas of an iterable of ``(length, width)`` pairs, one chunk at a time.
+
+    Only ``chunk_size`` pairs are held in memory at once, so ``pairs`` can be
+    a generator over a file, an unbounded source or an ``(n, 2)`` array such
+    as a ``numpy.memmap``.  With NumPy, chunks built from Python pairs are
+    float64 arrays.
+    """
+    if np is not None and isinstance(pairs, np.ndarray):
+        for start in range(0, len(pairs), chunk_size):
+            block = pairs[start:start + chunk_size]
+            yield block[:, 0] * block[:, 1]
+        return
+
+    iterator = iter(pairs)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        if np is not None:
+            flat = np.fromiter(chain.from_iterable(chunk), np.float64, 2 * len(chunk))
+            yield flat[0::2] * flat[1::2]
+        else:
+            yield list(starmap(mul, chunk))
+
+
+def sum_areas(pairs, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Total area of an iterable of ``(length, width)`` pairs, streamed."""
+    return sum(sum(chunk) if np is None else chunk.sum()
+               for chunk in iter_area_chunks(pairs, chunk_size))
+
+
+def safe_divide_many(numerators, denominators):
+    """Element-wise ``divide`` over sequences or arrays, without raising.
+
+    Either argument may be a scalar and is broadcast against the other.
+    Returns ``(quotients, valid)``: entries whose divisor is zero or whose
+    operands are not numbers are marked False in ``valid`` and hold NaN
+    (NumPy) or None (pure Python) in ``quotients``.  Without NumPy, two
+    scalars give a scalar quotient and flag.
+    """
+    if np is not None:
+        a, a_ok = _numeric_array(numerators)
+        b, b_ok = _numeric_array(denominators)
+        valid = a_ok & b_ok & (b != 0)
+        quotients = np.full(np.broadcast(a, b).shape, np.nan)
+        np.divide(a, b, out=quotients, where=valid)
+        return quotients, valid
+
+    if _is_scalar(numerators) and _is_scalar(denominators):
+        quotients, valid = safe_divide_many([numerators], [denominators])
+        return quotients[0], valid[0]
+    numerators, denominators = _broadcast(numerators, denominators,
+                                          "numerators", "denominators")
+    quotients, valid = [], []
+    for a, b in zip(numerators, denominators):
+        try:
+            quotients.append(a / b)
+            valid.append(True)
+        except (ZeroDivisionError, TypeError):
+            quotients.append(None)
+            valid.append(False)
+    return quotients, valid
+
+
+def _is_scalar(value):
+    # Anything that is not a collection, including Decimal and Fraction;
+    # strings count as single values, as they do for NumPy
+    return isinstance(value, (str, bytes)) or not hasattr(value, "__iter__")
+
+
+def _broadcast(a, b, a_name, b_name):
+    """``a`` and ``b`` as equal-length lists, repeating a scalar on either side."""
+    if _is_scalar(a):
+        b = list(b)
+        return [a] * len(b), b
+    a = list(a)
+    if _is_scalar(b):
+        return a, [b] * len(a)
+    b = list(b)
+    if len(a) != len(b):
+        raise ValueError(f"got {len(a)} {a_name} but {len(b)} {b_name}")
+    return a, b
+
+
+def _numeric_array(values):
+    """Float64 view of ``values`` plus a mask of the entries that are numbers."""
+    array = np.asarray(values)
+    if array.dtype.kind in "biuf":
+        return array.astype(np.float64, copy=False), np.ones(array.shape, bool)
+    # Mixed or non-numeric input: check each element like ``divide`` would.
+    # Keep the original Python objects so "2" is not parsed as a number.
+    if not isinstance(values, np.ndarray):
+        array = np.asarray(values, dtype=object)
+    flat = array.ravel()
+    ok = np.fromiter((isinstance(v, (int, float, np.number)) for v in flat), bool, len(flat))
+    numbers = np.zeros(len(flat))
+    numbers[ok] = flat[ok].astype(np.float64)
+    return numbers.reshape(array.shape), ok.reshape(array.shape)
@@ -0,0 +1,2 @@
+"""Benchmarks for ``functionsV2``; run each one from the parent directory,
+e.g. ``python -m benchmarks.startup``."""
@@ -0,0 +1,41 @@
+"""Small helpers shared by the benchmark scripts."""
+import os
+import subprocess
+import sys
+import time
+
+# Directory that holds functionsV2.py
+MODULE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def best_of(func, repeat=5):
+    """Return the fastest wall time of ``repeat`` calls to ``func``."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_python(code, cwd=None, env=None, stdout=subprocess.DEVNULL, args=()):
+    """Run ``code`` in a fresh interpreter and return what it wrote to stderr."""
+    child_env = dict(os.environ)
+    child_env["PYTHONPATH"] = MODULE_DIR
+    child_env.update(env or {})
+    proc = subprocess.run(
+        [sys.executable, "-c", code, *args],
+        cwd=cwd, env=child_env, stdout=stdout, stderr=subprocess.PIPE,
+        text=True, check=True,
+    )
+    return proc.stderr
+
+
+def print_table(headers, rows):
+    """Print ``rows`` as a plain left-aligned text table."""
+    cells = [[str(c) for c in headers]] + [[str(c) for c in row] for row in rows]
+    widths = [max(len(row[i]) for row in cells) for i in range(len(headers))]
+    for n, row in enumerate(cells):
+        print("  ".join(c.ljust(w) for c, w in zip(row, widths)).rstrip())
+        if n == 0:
+            print("  ".join("-" * w for w in widths))
@@ -0,0 +1,73 @@
+"""Closed-form and prefix-sum aggregates: brute-force check and query latency.
+
+Every run first cross-checks ``count_evens``, ``sum_evens``,
+``sum_even_squares`` and ``EvenSquaresIndex`` against brute force on random
+ranges (negative bounds included) and exits non-zero on any mismatch.
+
+    python -m benchmarks.aggregates [--checks N] [--sizes 1000 1000000]
+"""
+import argparse
+import random
+import time
+
+from aggregates import EvenSquaresIndex, count_evens, sum_even_squares, sum_evens
+from benchmarks._util import print_table
+
+
+def check(n_checks, seed=0):
+    rng = random.Random(seed)
+    failures = 0
+    for _ in range(n_checks):
+        lo = rng.randint(-500, 500)
+        hi = lo + rng.randint(-5, 400)
+        evens = [x for x in range(lo, hi) if x % 2 == 0]
+        failures += count_evens(lo, hi) != len(evens)
+        failures += sum_evens(lo, hi) != sum(evens)
+        failures += sum_even_squares(lo, hi) != sum(x**2 for x in evens)
+
+        values = [rng.randint(-1000, 1000) for _ in range(rng.randint(0, 300))]
+        index = EvenSquaresIndex(values)
+        start, stop = sorted(rng.randint(-len(values) - 2, len(values) + 2) for _ in range(2))
+        part = [x for x in values[start:stop] if x % 2 == 0]
+        failures += index.count_evens(start, stop) != len(part)
+        failures += index.sum_even_squares(start, stop) != sum(x**2 for x in part)
+    return failures
+
+
+def per_call(func, calls):
+    start = time.perf_counter()
+    for _ in range(calls):
+        func()
+    return (time.perf_counter() - start) / calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--checks", type=int, default=2000)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 1_000_000])
+    args = parser.parse_args()
+
+    failures = check(args.checks)
+    print(f"brute-force check: {args.checks} random cases, {failures} mismatches")
+    if failures:
+        raise SystemExit(1)
+
+    rows = []
+    uncached = sum_even_squares.__wrapped__
+    for n in args.sizes:
+        values = list(range(n))
+        index = EvenSquaresIndex(values)
+        calls = max(3, 100_000 // n)
+        cases = [
+            ("brute force", lambda: sum(x**2 for x in range(n) if x % 2 == 0), calls),
+            ("closed form, uncached", lambda: uncached(0, n), 100_000),
+            ("closed form, memoized", lambda: sum_even_squares(0, n), 100_000),
+            ("prefix index query", lambda: index.sum_even_squares(0, n), 100_000),
+        ]
+        for label, func, calls in cases:
+            rows.append((n, label, f"{per_call(func, calls) * 1e9:,.0f}"))
+    print_table(("n", "method", "ns per query"), rows)
+
+
+if __name__ == "__main__":
+    main()
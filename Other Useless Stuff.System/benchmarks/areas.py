@@ -0,0 +1,51 @@
+"""``calculate_area_many`` against a list comprehension over ``calculate_area``.
+
+    python -m benchmarks.areas [--sizes 100000 1000000]
+"""
+import argparse
+import random
+
+import batch
+from batch import calculate_area_many, iter_area_chunks
+from benchmarks._util import best_of, print_table
+from functionsV2 import calculate_area
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    args = parser.parse_args()
+
+    print(f"numpy: {'yes' if batch.np is not None else 'no (pure Python fallback)'}")
+    rows = []
+    for n in args.sizes:
+        rng = random.Random(0)
+        lengths = [rng.uniform(1, 100) for _ in range(n)]
+        widths = [rng.uniform(1, 100) for _ in range(n)]
+        pairs = list(zip(lengths, widths))
+        if batch.np is not None:
+            lengths_arr, widths_arr = batch.np.asarray(lengths), batch.np.asarray(widths)
+        else:
+            lengths_arr, widths_arr = lengths, widths
+
+        scalar = best_of(lambda: [calculate_area(l, w) for l, w in pairs], repeat=3)
+        cases = [
+            ("scalar list comprehension", scalar),
+            ("calculate_area_many(arrays)",
+             best_of(lambda: calculate_area_many(lengths_arr, widths_arr), repeat=3)),
+            ("calculate_area_many(width=1)",
+             best_of(lambda: calculate_area_many(lengths_arr), repeat=3)),
+            ("iter_area_chunks(pairs)",
+             best_of(lambda: [c for c in iter_area_chunks(iter(pairs))], repeat=3)),
+        ]
+        if batch.np is not None:
+            pair_arr = batch.np.column_stack((lengths_arr, widths_arr))
+            cases.append(("iter_area_chunks((n, 2) array)",
+                          best_of(lambda: [c for c in iter_area_chunks(pair_arr)], repeat=3)))
+        for label, t in cases:
+            rows.append((n, label, f"{t * 1e3:.1f}", f"{scalar / t:.1f}x"))
+    print_table(("rectangles", "method", "ms", "vs scalar"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Write-then-read over many small files: sync loop against asyncio.
+
+    python -m benchmarks.async_files [--files 10000] [--concurrency 8 32 128]
+                                     [--fsync none|file|full]
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from async_file_handling import process_files
+from benchmarks._util import print_table
+from file_handling import FSYNC_FILE, FSYNC_FULL, FSYNC_NONE, write_then_read
+
+LINES = ["Hello, File World!\n", "This is line 2.\n", "And this is line 3.\n"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=10_000)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[8, 32, 128])
+    parser.add_argument("--fsync", choices=(FSYNC_NONE, FSYNC_FILE, FSYNC_FULL),
+                        default=FSYNC_NONE)
+    args = parser.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as work:
+        jobs = [(os.path.join(work, f"sample_data_{i}.txt"), LINES) for i in range(args.files)]
+
+        start = time.perf_counter()
+        expected = [write_then_read(path, lines, args.fsync) for path, lines in jobs]
+        sync = time.perf_counter() - start
+        rows.append(("sync", "-", f"{sync:.2f}", f"{args.files / sync:,.0f}", "1.0x"))
+
+        for limit in args.concurrency:
+            with ThreadPoolExecutor(max_workers=limit) as executor:
+                start = time.perf_counter()
+                results = asyncio.run(process_files(jobs, limit, args.fsync, executor))
+                elapsed = time.perf_counter() - start
+            assert results == expected
+            rows.append(("asyncio", limit, f"{elapsed:.2f}", f"{args.files / elapsed:,.0f}",
+                         f"{sync / elapsed:.1f}x"))
+    print_table(("mode", "concurrency", "seconds", "files/s", "speedup"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Memory of a ``BookTable`` against a list of ``Book`` objects (tracemalloc).
+
+    python -m benchmarks.book_table [--sizes 100000 1000000]
+"""
+import argparse
+import gc
+import random
+import tracemalloc
+
+from benchmarks._util import print_table
+from book_table import BookTable
+from functionsV2 import Book
+
+
+def records(n, seed=0):
+    rng = random.Random(seed)
+    n_authors = max(1, n // 20)
+    for i in range(n):
+        yield f"Title {i}", f"Author {rng.randrange(n_authors)}", rng.randint(50, 1200)
+
+
+def traced(build):
+    """Return (result, bytes still allocated, peak bytes) for ``build()``."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current, peak
+
+
+def build_list(n):
+    return [Book(title, author, pages) for title, author, pages in records(n)]
+
+
+def build_table(n):
+    table = BookTable()
+    for title, author, pages in records(n):
+        table.append(title, author, pages)
+    return table
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    args = parser.parse_args()
+
+    rows = []
+    for n in args.sizes:
+        for label, build in (("list[Book]", build_list), ("BookTable", build_table)):
+            result, current, peak = traced(lambda: build(n))
+            rows.append((n, label, f"{current / 2**20:.1f}", f"{peak / 2**20:.1f}",
+                         f"{current / n:.0f}"))
+            del result
+    print_table(("books", "container", "retained MiB", "peak MiB", "bytes/book"), rows)
+
+
+if __name__ == "__main__":
+    main()
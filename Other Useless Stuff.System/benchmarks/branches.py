@@ -0,0 +1,72 @@
+"""Routed and fan-out catalog queries as the number of library branches grows.
+
+    python -m benchmarks.branches [--books 200000] [--branches 1 4 16 64]
+
+The total number of books is fixed and spread over the branches, so routed
+queries touch a shrinking shard while fan-out queries visit every shard.
+In-memory ``Catalog`` lookups hold the GIL, so the thread-pool rows show
+the dispatch overhead; an executor pays off when shard queries block.
+"""
+import argparse
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks._util import best_of, print_table
+from benchmarks.catalog import make_books
+from branches import Library, LibraryNetwork
+
+
+def make_network(books, branches):
+    network = LibraryNetwork(Library(f"Branch {i}") for i in range(branches))
+    names = [library.name for library in network]
+    for i, book in enumerate(books):
+        network.add(names[i % branches], book)
+    return network, names
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--books", type=int, default=200_000)
+    parser.add_argument("--branches", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    books = make_books(args.books)
+    rng = random.Random(1)
+    picks = [rng.randrange(args.books) for _ in range(args.queries)]
+    titles = [books[i].title for i in picks]
+    authors = [books[i].author for i in picks]
+
+    rows = []
+    with ThreadPoolExecutor(args.threads) as executor:
+        for branches in args.branches:
+            build = best_of(lambda: make_network(books, branches), repeat=1)
+            network, names = make_network(books, branches)
+            homes = [names[i % branches] for i in picks]
+            network.pages_between(0, 0)   # sort every pages index outside the timings
+
+            cases = {
+                "routed title": lambda: [network.by_title(t, libraries=[home])
+                                         for t, home in zip(titles, homes)],
+                "fan-out title": lambda: [network.by_title(t) for t in titles],
+                "fan-out title, threads": lambda: [network.by_title(t, executor=executor)
+                                                   for t in titles],
+                "fan-out author": lambda: [network.by_author(a) for a in authors],
+                "fan-out pages 200-210": lambda: [network.pages_between(200, 210)
+                                                  for _ in range(10)],
+                "fan-out pages, threads": lambda: [network.pages_between(200, 210,
+                                                                         executor=executor)
+                                                   for _ in range(10)],
+            }
+            for name, run in cases.items():
+                per_query = 10 if "pages" in name else args.queries
+                seconds = best_of(run, repeat=3) / per_query
+                rows.append((branches, name, f"{seconds * 1e6:.1f}"))
+            rows.append((branches, "build network", f"{build * 1e3:.0f} ms"))
+
+    print_table(("branches", "query", "us per query"), rows)
+
+
+if __name__ == "__main__":
+    main()
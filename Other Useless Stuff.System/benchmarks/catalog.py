@@ -0,0 +1,63 @@
+"""Catalog index lookups against a linear scan over a list of ``Book``.
+
+    python -m benchmarks.catalog [--sizes 10000 100000 1000000]
+"""
+import argparse
+import random
+
+from benchmarks._util import best_of, print_table
+from catalog import Catalog
+from functionsV2 import Book
+
+
+def make_books(n, seed=0):
+    rng = random.Random(seed)
+    authors = [f"Author {i}" for i in range(max(1, n // 20))]
+    return [Book(f"Title {i}", rng.choice(authors), rng.randint(50, 1200))
+            for i in range(n)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--queries", type=int, default=50)
+    args = parser.parse_args()
+
+    rows = []
+    for n in args.sizes:
+        books = make_books(n)
+        rng = random.Random(1)
+        titles = [f"Title {rng.randrange(n)}" for _ in range(args.queries)]
+        authors = [books[rng.randrange(n)].author for _ in range(args.queries)]
+
+        build = best_of(lambda: Catalog(books), repeat=1)
+        catalog = Catalog(books)
+        catalog.pages_between(0, 0)  # sort the pages index outside the timings
+
+        cases = {
+            "title": (
+                lambda: [catalog.by_title(t) for t in titles],
+                lambda: [[b for b in books if b.title == t] for t in titles],
+            ),
+            "author": (
+                lambda: [catalog.by_author(a) for a in authors],
+                lambda: [[b for b in books if b.author == a] for a in authors],
+            ),
+            "pages 200-400": (
+                lambda: catalog.pages_between(200, 400),
+                lambda: [b for b in books if 200 <= b.pages <= 400],
+            ),
+        }
+        for name, (indexed, scan) in cases.items():
+            per_query = args.queries if name != "pages 200-400" else 1
+            t_index = best_of(indexed, repeat=3) / per_query
+            t_scan = best_of(scan, repeat=1) / per_query
+            rows.append((n, name, f"{t_index * 1e6:.1f}", f"{t_scan * 1e6:.1f}",
+                         f"{t_scan / t_index:.0f}x"))
+        rows.append((n, "build catalog", f"{build * 1e3:.0f} ms", "", ""))
+
+    print_table(("books", "query", "catalog us", "scan us", "speedup"), rows)
+
+
+if __name__ == "__main__":
+    main()
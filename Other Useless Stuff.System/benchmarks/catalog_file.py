@@ -0,0 +1,104 @@
+"""Saving and loading a catalog: ``catalog_file`` against pickle and JSON.
+
+"open" is the time before the first book can be read; for pickle and JSON
+that means loading everything.  "by position" and "by title" read single
+books from the already-open file.
+
+    python -m benchmarks.catalog_file [--books 1000000]
+"""
+import argparse
+import json
+import os
+import pickle
+import random
+import tempfile
+import time
+
+from benchmarks._util import best_of, print_table
+from catalog_file import CatalogFile, save_catalog
+from functionsV2 import Book
+
+
+def make_books(n, seed=0):
+    rng = random.Random(seed)
+    books = [Book(f"Title {i}", f"Author {rng.randrange(max(1, n // 20))}",
+                  rng.randint(50, 1200)) for i in range(n)]
+    for book in rng.sample(books, n // 10):
+        book.check_out()
+    return books
+
+
+def save_pickle(path, books):
+    with open(path, "wb") as file:
+        pickle.dump(books, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def load_pickle(path):
+    with open(path, "rb") as file:
+        return pickle.load(file)
+
+
+def save_json(path, books):
+    with open(path, "w") as file:
+        json.dump([[b.title, b.author, b.pages, b.is_checked_out] for b in books], file)
+
+
+def load_json(path):
+    with open(path) as file:
+        books = []
+        for title, author, pages, checked_out in json.load(file):
+            book = Book(title, author, pages)
+            book.is_checked_out = checked_out
+            books.append(book)
+        return books
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--books", type=int, default=1_000_000)
+    parser.add_argument("--lookups", type=int, default=10_000)
+    args = parser.parse_args()
+
+    books = make_books(args.books)
+    rng = random.Random(1)
+    positions = [rng.randrange(args.books) for _ in range(args.lookups)]
+    titles = [f"Title {p}" for p in positions]
+
+    rows = []
+    with tempfile.TemporaryDirectory() as work:
+        for label, save, load in (("pickle", save_pickle, load_pickle),
+                                  ("json", save_json, load_json)):
+            path = os.path.join(work, f"catalog.{label}")
+            _, t_save = timed(lambda: save(path, books))
+            loaded, t_load = timed(lambda: load(path))
+            assert loaded[positions[0]].book_info() == books[positions[0]].book_info()
+            rows.append((label, f"{os.path.getsize(path) / 2**20:.1f}", f"{t_save:.2f}",
+                         f"{t_load:.2f}", f"{t_load:.2f}", "-", "-"))
+            del loaded
+
+        path = os.path.join(work, "catalog.bin")
+        _, t_save = timed(lambda: save_catalog(path, books))
+        catalog, t_open = timed(lambda: CatalogFile(path))
+        _, t_all = timed(lambda: list(catalog))
+        t_pos = best_of(lambda: [catalog[p] for p in positions], 1) / args.lookups
+        t_title = best_of(lambda: [catalog.find_title(t) for t in titles], 1) / args.lookups
+        assert all(catalog[p].book_info() == books[p].book_info() for p in positions[:100])
+        assert catalog.find_title(titles[0])[0].pages == books[positions[0]].pages
+        catalog.close()
+        rows.append(("catalog_file", f"{os.path.getsize(path) / 2**20:.1f}", f"{t_save:.2f}",
+                     f"{t_open * 1e3:.3f} ms", f"{t_all:.2f}",
+                     f"{t_pos * 1e6:.1f} us", f"{t_title * 1e6:.1f} us"))
+
+    print(f"{args.books:,} books")
+    print_table(("format", "MiB", "save s", "open", "load all s", "by position", "by title"),
+                rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""Stress test and throughput of ``CheckoutService`` under threads and processes.
+
+Every worker races over the same books.  In the "claim" phase nobody returns
+anything, so each book must be won exactly once.  In the "churn" phase workers
+check out, hold and return books in a loop while an independent ``held``
+array records the current holder.  A worker that finds a book already held
+right after a successful checkout, or whose own return is refused, has caught
+a double checkout.
+
+    python -m benchmarks.checkout [--books N] [--threads N] [--processes M]
+"""
+import argparse
+import multiprocessing
+import random
+import threading
+import time
+
+from benchmarks._util import print_table
+from catalog import Catalog
+from checkout import CheckoutService
+from functionsV2 import Book
+
+
+def claim(service, book_ids, worker, batch):
+    ids = list(book_ids)
+    random.Random(worker).shuffle(ids)
+    won = []
+    for start in range(0, len(ids), batch):
+        won.extend(service.check_out_many(ids[start:start + batch]))
+    return won
+
+
+def churn(service, book_ids, worker, rounds, held):
+    rng = random.Random(worker)
+    me = worker + 1
+    checkouts = violations = 0
+    for _ in range(rounds):
+        book_id = rng.choice(book_ids)
+        if service.check_out(book_id):
+            checkouts += 1
+            if held[book_id]:
+                violations += 1
+            held[book_id] = me
+            if held[book_id] != me:
+                violations += 1
+            held[book_id] = 0
+            # Only the holder returns, so this fails if someone else also
+            # "checked out" the book and returned it first
+            if not service.return_book(book_id):
+                violations += 1
+    return checkouts, violations
+
+
+def run_threads(service, book_ids, workers, func, *args):
+    results = [None] * workers
+
+    def target(n):
+        results[n] = func(service, book_ids, n, *args)
+
+    threads = [threading.Thread(target=target, args=(n,)) for n in range(workers)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results, time.perf_counter() - start
+
+
+def run_processes(service, book_ids, workers, func, *args):
+    ctx = multiprocessing.get_context("fork")
+    queue = ctx.Queue()
+
+    def target(n):
+        queue.put((n, func(service, book_ids, n, *args)))
+
+    procs = [ctx.Process(target=target, args=(n,)) for n in range(workers)]
+    start = time.perf_counter()
+    for p in procs:
+        p.start()
+    results = dict(queue.get() for _ in procs)
+    for p in procs:
+        p.join()
+    return [results[n] for n in range(workers)], time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--books", type=int, default=10_000)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument("--rounds", type=int, default=50_000)
+    parser.add_argument("--batch", type=int, default=64)
+    args = parser.parse_args()
+
+    rows = []
+    failures = 0
+    for mode, workers in (("threads", args.threads), ("processes", args.processes)):
+        catalog = Catalog(Book(f"Title {i}", "Author", 100) for i in range(args.books))
+        book_ids = list(range(args.books))
+        if mode == "threads":
+            service, runner = CheckoutService(catalog), run_threads
+            held = [0] * args.books
+        else:
+            service, runner = CheckoutService.shared(catalog), run_processes
+            held = multiprocessing.RawArray("i", args.books)
+
+        won, elapsed = runner(service, book_ids, workers, claim, args.batch)
+        wins = sorted(book_id for ids in won for book_id in ids)
+        claim_ok = wins == book_ids
+        rows.append((mode, workers, "claim", len(wins), f"{len(wins) / elapsed:,.0f}",
+                     "ok" if claim_ok else "DOUBLE CHECKOUT"))
+        service.return_many(book_ids)
+
+        results, elapsed = runner(service, book_ids, workers, churn, args.rounds, held)
+        checkouts = sum(c for c, _ in results)
+        violations = sum(v for _, v in results)
+        leftover = sum(service.is_checked_out(i) for i in book_ids)
+        churn_ok = violations == 0 and leftover == 0
+        rows.append((mode, workers, "churn", checkouts, f"{checkouts / elapsed:,.0f}",
+                     "ok" if churn_ok else f"{violations} violations, {leftover} left out"))
+        failures += (not claim_ok) + (not churn_ok)
+
+    print_table(("mode", "workers", "phase", "checkouts", "checkouts/s", "result"), rows)
+    raise SystemExit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Throughput and peak memory of the ``file_handling`` read strategies.
+
+Each strategy scans the file (counting newlines) in a fresh interpreter so
+its peak RSS is measured on its own.  ``read()`` is the whole-file baseline
+the demo section used.  Files are generated in a temporary directory.
+
+    python -m benchmarks.file_reading [--sizes-mb 1 64 512 2048]
+"""
+import argparse
+import os
+import tempfile
+
+from benchmarks._util import print_table, run_python
+
+SCAN = """
+import resource, sys, time
+from file_handling import iter_blocks, iter_lines
+path, strategy = sys.argv[1], sys.argv[2]
+start = time.perf_counter()
+if strategy == "lines":
+    count = sum(1 for _ in iter_lines(path))
+else:
+    count = sum(bytes(block).count(b"\\n") if isinstance(block, memoryview)
+                else block.count(b"\\n") for block in iter_blocks(path, strategy))
+elapsed = time.perf_counter() - start
+sys.stderr.write(f"{elapsed} {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss} {count}\\n")
+"""
+
+STRATEGIES = ("read", "lines", "chunks", "mmap")
+
+
+def write_file(path, size):
+    line = b"The quick brown fox jumps over the lazy dog, line of sample data.\n"
+    block = line * ((1 << 20) // len(line))
+    with open(path, "wb") as file:
+        # Whole blocks only, so the file ends on a complete line
+        for _ in range(max(1, round(size / len(block)))):
+            file.write(block)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes-mb", type=int, nargs="+", default=[1, 64, 512])
+    args = parser.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as work:
+        for size_mb in args.sizes_mb:
+            path = os.path.join(work, f"data_{size_mb}mb.txt")
+            write_file(path, size_mb << 20)
+            counts = set()
+            for strategy in STRATEGIES:
+                elapsed, peak_kb, count = run_python(SCAN, args=[path, strategy]).split()
+                counts.add(count)
+                rows.append((size_mb, strategy, f"{size_mb / float(elapsed):,.0f}",
+                             f"{int(peak_kb) / 1024:.1f}"))
+            assert len(counts) == 1, f"strategies disagree on line count: {counts}"
+            os.remove(path)
+    print_table(("file MB", "strategy", "MB/s", "peak RSS MiB"), rows)
+
+
+if __name__ == "__main__":
+    main()
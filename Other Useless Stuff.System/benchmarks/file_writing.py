@@ -0,0 +1,56 @@
+"""Throughput of ``write_lines`` against per-line ``file.write`` calls.
+
+    python -m benchmarks.file_writing [--lines N] [--dir /dev/shm]
+
+Pass a tmpfs ``--dir`` to measure the write path without the disk.
+"""
+import argparse
+import os
+import tempfile
+
+from benchmarks._util import best_of, print_table
+from file_handling import FSYNC_FILE, FSYNC_FULL, FSYNC_NONE, write_lines
+
+
+def per_line_write(path, lines):
+    # What the demo section did: one write() per line, in place
+    with open(path, "w") as file:
+        for line in lines:
+            file.write(line)
+
+
+def plain_writelines(path, lines):
+    with open(path, "w") as file:
+        file.writelines(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=2_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--dir", default=None, help="where to write (default: system temp)")
+    args = parser.parse_args()
+
+    lines = [f"record {i}: the quick brown fox jumps over the lazy dog\n"
+             for i in range(args.lines)]
+    megabytes = sum(map(len, lines)) / 2**20
+    cases = [
+        ("per-line write()", per_line_write),
+        ("writelines()", plain_writelines),
+        ("write_lines fsync=none", lambda p, l: write_lines(p, l, fsync=FSYNC_NONE)),
+        ("write_lines fsync=file", lambda p, l: write_lines(p, l, fsync=FSYNC_FILE)),
+        ("write_lines fsync=full", lambda p, l: write_lines(p, l, fsync=FSYNC_FULL)),
+    ]
+    rows = []
+    with tempfile.TemporaryDirectory(dir=args.dir) as work:
+        path = os.path.join(work, "sample_data.txt")
+        for label, write in cases:
+            t = best_of(lambda: write(path, lines), args.repeat)
+            rows.append((label, f"{args.lines / t / 1e6:.2f}", f"{megabytes / t:,.0f}",
+                         f"{t * 1e3:.0f}"))
+    print(f"{args.lines:,} lines, {megabytes:.0f} MB")
+    print_table(("method", "M lines/s", "MB/s", "ms"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Hold queue throughput when many patrons wait on few books.
+
+Every book starts lent out and collects a long queue of holds; returns then
+hand each book down its queue until everyone has had it.  The baseline
+keeps each queue as a plain list and scans it for the best hold on every
+return.
+
+    python -m benchmarks.holds [--books 100] [--holds 1000000]
+"""
+import argparse
+import random
+import time
+
+from benchmarks._util import print_table
+from catalog import Catalog
+from functionsV2 import Book
+from holds import HoldQueues
+
+
+def make_service(books):
+    catalog = Catalog(Book(f"Title {i}", "Author", 100) for i in range(books))
+    service = HoldQueues(catalog)
+    for book_id in range(books):
+        service.request(book_id, "first borrower")
+    return service
+
+
+def rate(rows, name, count, func):
+    start = time.perf_counter()
+    func()
+    seconds = time.perf_counter() - start
+    rows.append((name, count, f"{seconds:.2f}", f"{count / seconds:,.0f}"))
+
+
+def drain(service, books):
+    handed = 0
+    for book_id in range(books):
+        while service.return_book(book_id) is not None:
+            handed += 1
+    return handed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--books", type=int, default=100)
+    parser.add_argument("--holds", type=int, default=1_000_000)
+    parser.add_argument("--baseline-returns", type=int, default=2_000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    holds = [(rng.randrange(args.books), f"patron {i}", rng.randrange(5))
+             for i in range(args.holds)]
+    per_book = args.holds // args.books
+    rows = []
+
+    service = make_service(args.books)
+    rate(rows, "place_hold, one at a time", len(holds),
+         lambda: [service.place_hold(*hold) for hold in holds])
+    rate(rows, "return_book hand-offs", len(holds), lambda: drain(service, args.books))
+
+    service = make_service(args.books)
+    rate(rows, "place_holds, bulk", len(holds), lambda: service.place_holds(holds))
+    cancelled = holds[::4]
+    rate(rows, "cancel_hold", len(cancelled),
+         lambda: [service.cancel_hold(book_id, patron) for book_id, patron, _ in cancelled])
+    rate(rows, "hand-offs, 25% cancelled", len(holds) - len(cancelled),
+         lambda: drain(service, args.books))
+
+    # Baseline: list queues scanned for the best (priority, arrival) on each return
+    queues = {}
+    for sequence, (book_id, patron, priority) in enumerate(holds):
+        queues.setdefault(book_id, []).append((-priority, sequence, patron))
+    returns = args.baseline_returns
+
+    def scan_hand_offs():
+        for n in range(returns):
+            queue = queues[n % args.books]
+            best = min(range(len(queue)), key=queue.__getitem__)
+            queue[best] = queue[-1]
+            queue.pop()
+
+    rate(rows, "list-scan hand-offs (baseline)", returns, scan_hand_offs)
+
+    print(f"{args.books} books, {args.holds} holds (about {per_book} per book)")
+    print_table(("operation", "count", "s", "ops/s"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Checkout journal: event append rate, recovery time and compaction.
+
+    python -m benchmarks.journal [--books 100000] [--events 1000000]
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from benchmarks._util import print_table
+from functionsV2 import Book
+from journal import JOURNAL, CheckoutJournal
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--books", type=int, default=100_000)
+    parser.add_argument("--events", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    picks = [rng.randrange(args.books) for _ in range(args.events)]
+    rows = []
+    with tempfile.TemporaryDirectory() as work:
+        start = time.perf_counter()
+        store = CheckoutJournal(work, (Book(f"Title {i}", f"Author {i % 500}", 100 + i % 900)
+                                       for i in range(args.books)))
+        rows.append(("create + first snapshot", f"{time.perf_counter() - start:.2f} s"))
+
+        start = time.perf_counter()
+        for book_id in picks:
+            # Every pick flips the book, so every pick is one journal event
+            if not store.check_out(book_id):
+                store.return_book(book_id)
+        store.flush()
+        elapsed = time.perf_counter() - start
+        rows.append(("append", f"{args.events / elapsed:,.0f} events/s"))
+        rows.append(("journal size", f"{os.path.getsize(os.path.join(work, JOURNAL)) / 2**20:.1f} MiB"))
+        expected = [book.is_checked_out for book in store.catalog]
+        store.close()
+
+        start = time.perf_counter()
+        store = CheckoutJournal(work)
+        elapsed = time.perf_counter() - start
+        assert store.pending_events == args.events
+        assert [book.is_checked_out for book in store.catalog] == expected
+        rows.append((f"recover (snapshot + {args.events:,} events)", f"{elapsed:.2f} s"))
+
+        start = time.perf_counter()
+        store.compact()
+        rows.append(("compact", f"{time.perf_counter() - start:.2f} s"))
+        store.close()
+
+        start = time.perf_counter()
+        store = CheckoutJournal(work)
+        elapsed = time.perf_counter() - start
+        assert [book.is_checked_out for book in store.catalog] == expected
+        store.close()
+        rows.append(("recover after compaction", f"{elapsed:.2f} s"))
+
+    print(f"{args.books:,} books, {args.events:,} events")
+    print_table(("step", "result"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Loans with due dates: heap operations at 10^6 outstanding loans, and
+how late the asyncio watcher fires overdue callbacks.
+
+    python -m benchmarks.loans [--loans 1000000]
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from benchmarks._util import print_table
+from catalog import Catalog
+from functionsV2 import Book
+from loans import Loans
+
+
+def timed(rows, name, count, func):
+    start = time.perf_counter()
+    result = func()
+    seconds = time.perf_counter() - start
+    rows.append((name, count, f"{seconds * 1e3:.0f}", f"{seconds / count * 1e6:.2f}"))
+    return result
+
+
+async def watcher_lateness(loans, count, spread):
+    """Lateness (s) of the callbacks for ``count`` loans due within ``spread`` s."""
+    lateness = []
+    loans.on_overdue(lambda book_id, due: lateness.append(time.time() - due))
+    task = asyncio.create_task(loans.watch())
+    await asyncio.sleep(0)
+    start = time.time()
+    rng = random.Random(2)
+    for book_id in range(count):
+        loans.check_out(book_id, due=start + rng.uniform(0.05, spread))
+    while len(lateness) < count:
+        await asyncio.sleep(0.05)
+    task.cancel()
+    return lateness
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--loans", type=int, default=1_000_000)
+    parser.add_argument("--watched", type=int, default=10_000)
+    args = parser.parse_args()
+
+    n = args.loans
+    catalog = Catalog(Book(f"Title {i}", f"Author {i % 500}", 100) for i in range(n))
+    now = [0.0]
+    loans = Loans(catalog, clock=lambda: now[0])
+    day = 24 * 3600
+    rng = random.Random(0)
+    dues = [rng.uniform(0, 30 * day) for _ in range(n)]
+
+    rows = []
+    timed(rows, "check_out", n, lambda: [loans.check_out(i, due) for i, due in enumerate(dues)])
+    timed(rows, "next_due", 100_000, lambda: [loans.next_due() for _ in range(100_000)])
+    sample = rng.sample(range(n), min(n, 100_000))
+    timed(rows, "renew", len(sample), lambda: [loans.renew(i, dues[i] + day) for i in sample])
+    timed(rows, "return_book", len(sample), lambda: [loans.return_book(i) for i in sample])
+    timed(rows, "check_out again", len(sample),
+          lambda: [loans.check_out(i, dues[i]) for i in sample])
+
+    for days in (1, 2, 10):
+        now[0] = days * day
+        start = time.perf_counter()
+        found = loans.collect()
+        seconds = time.perf_counter() - start
+        rows.append((f"collect() to day {days}", found, f"{seconds * 1e3:.0f}",
+                     f"{seconds / max(found, 1) * 1e6:.2f}"))
+        start = time.perf_counter()
+        late = loans.overdue()
+        seconds = time.perf_counter() - start
+        rows.append((f"overdue() list at day {days}", len(late), f"{seconds * 1e3:.0f}",
+                     f"{seconds / max(len(late), 1) * 1e6:.2f}"))
+
+    scan_now = now[0]
+    timed(rows, "scan of every loan at day 10", n,
+          lambda: [i for i, due in enumerate(dues) if due <= scan_now])
+
+    bulk = Loans(Catalog(Book(f"Title {i}", "A", 100) for i in range(n)), clock=lambda: 0.0)
+    timed(rows, "check_out_many (one heapify)", n, lambda: bulk.check_out_many(range(n)))
+
+    print_table(("operation", "count", "total ms", "us each"), rows)
+
+    watched = Loans(Catalog(Book(f"Title {i}", "A", 100) for i in range(args.watched)))
+    lateness = asyncio.run(watcher_lateness(watched, args.watched, spread=2.0))
+    print(f"\nwatch(): {len(lateness)} callbacks over 2 s, late by "
+          f"median {statistics.median(lateness) * 1e3:.2f} ms, max {max(lateness) * 1e3:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
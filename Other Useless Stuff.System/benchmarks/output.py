@@ -0,0 +1,77 @@
+"""Demo runtime with stdout sent to a pipe, for each output mode.
+
+"script" rows time ``python -m functionsV2`` end to end with stdout piped,
+both with the default block-buffered stdout and with ``python -u``.  The
+"in-process" rows repeat ``main()`` with stdout replaced by a line-buffered
+pipe (what a terminal gets), so interpreter startup does not hide the cost
+of the writes.
+
+    python -m benchmarks.output [--repeat N] [--runs N]
+"""
+import argparse
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import functionsV2
+from benchmarks._util import MODULE_DIR, best_of, print_table
+
+MODES = {"unbuffered print": ["--unbuffered"], "OutputSink": [], "quiet": ["--quiet"]}
+
+
+def script_time(interpreter_flags, mode_flags, cwd, repeat):
+    cmd = [sys.executable, *interpreter_flags, "-m", "functionsV2", *mode_flags]
+    env = dict(os.environ, PYTHONPATH=MODULE_DIR)
+    env.pop("PYTHONUNBUFFERED", None)  # "-u" is opted into per case
+    return best_of(lambda: subprocess.run(cmd, cwd=cwd, env=env, stdout=subprocess.PIPE,
+                                          check=True), repeat)
+
+
+def in_process_time(mode_flags, runs):
+    read_fd, write_fd = os.pipe()
+    drain = threading.Thread(target=lambda: _drain(read_fd), daemon=True)
+    drain.start()
+    pipe = io.TextIOWrapper(os.fdopen(write_fd, "wb", buffering=0), line_buffering=True)
+    saved = sys.stdout
+    sys.stdout = pipe
+    try:
+        start = time.perf_counter()
+        for _ in range(runs):
+            functionsV2.main(mode_flags)
+        elapsed = time.perf_counter() - start
+    finally:
+        sys.stdout = saved
+        pipe.close()
+    drain.join()
+    return elapsed / runs
+
+
+def _drain(fd):
+    with os.fdopen(fd, "rb") as reader:
+        while reader.read(1 << 16):
+            pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10, help="script runs per case")
+    parser.add_argument("--runs", type=int, default=500, help="in-process main() calls per case")
+    args = parser.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as work:
+        for label, flags in MODES.items():
+            rows.append(("script", label, f"{script_time([], flags, work, args.repeat) * 1e3:.2f}"))
+            rows.append(("script -u", label, f"{script_time(['-u'], flags, work, args.repeat) * 1e3:.2f}"))
+        os.chdir(work)  # section 8 writes sample_data.txt into the cwd
+        for label, flags in MODES.items():
+            rows.append(("in-process", label, f"{in_process_time(flags, args.runs) * 1e3:.3f}"))
+    print_table(("run", "mode", "ms per run"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""PersonStore bitmap queries against scanning a list of person dicts.
+
+    python -m benchmarks.people [--people 1000000] [--queries 20]
+"""
+import argparse
+import random
+import time
+import tracemalloc
+
+from benchmarks._util import best_of, print_table
+from people import PersonStore
+
+HOBBIES = ["reading", "hiking", "coding", "chess", "cooking", "cycling", "painting",
+           "gardening", "running", "swimming", "music", "photography", "gaming",
+           "knitting", "climbing", "birding", "sailing", "pottery", "dancing", "yoga"]
+JOBS = ["Developer", "Teacher", "Nurse", "Engineer", "Designer", "Chef", "Pilot", None]
+
+
+def make_people(n, seed=0):
+    rng = random.Random(seed)
+    cities = [f"City {i}" for i in range(500)]
+    weights = [1 / (rank + 1) for rank in range(len(cities))]
+    people = []
+    for i in range(n):
+        person = {
+            "name": f"Person {i}",
+            "age": rng.randint(18, 90),
+            "city": rng.choices(cities, weights)[0],
+            "hobbies": rng.sample(HOBBIES, rng.randint(0, 4)),
+        }
+        job = rng.choice(JOBS)
+        if job is not None:
+            person["job"] = job
+        people.append(person)
+    return people
+
+
+def traced(build):
+    """Result of ``build()`` and the memory it allocated (MiB)."""
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size / 2**20
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--people", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=20)
+    args = parser.parse_args()
+
+    people, dicts_mib = traced(lambda: make_people(args.people))
+    start = time.perf_counter()
+    store = PersonStore(people)
+    build = time.perf_counter() - start
+    _, store_mib = traced(lambda: PersonStore(people))
+
+    rng = random.Random(1)
+    cities = [rng.choice(store.values("city")) for _ in range(args.queries)]
+    pairs = [rng.sample(HOBBIES, 2) for _ in range(args.queries)]
+
+    cases = {
+        "city AND hobby": (
+            lambda: [store.where(city=c, hobbies=h).ids() for c, (h, _) in zip(cities, pairs)],
+            lambda: [[i for i, p in enumerate(people) if p["city"] == c and h in p["hobbies"]]
+                     for c, (h, _) in zip(cities, pairs)],
+        ),
+        "city AND (hobby OR hobby)": (
+            lambda: [store.where(city=c, hobbies=tuple(h)).ids() for c, h in zip(cities, pairs)],
+            lambda: [[i for i, p in enumerate(people) if p["city"] == c
+                      and (h[0] in p["hobbies"] or h[1] in p["hobbies"])]
+                     for c, h in zip(cities, pairs)],
+        ),
+        "hobby AND hobby, count": (
+            lambda: [len(store.match("hobbies", a) & store.match("hobbies", b)) for a, b in pairs],
+            lambda: [sum(1 for p in people if a in p["hobbies"] and b in p["hobbies"])
+                     for a, b in pairs],
+        ),
+        "age 30 AND job, count": (
+            lambda: [len(store.where(age=30, job="Nurse")) for _ in pairs],
+            lambda: [sum(1 for p in people if p["age"] == 30 and p.get("job") == "Nurse")
+                     for _ in pairs],
+        ),
+    }
+    first_bitmaps = best_of(cases["city AND hobby"][0], repeat=1) / args.queries
+    rows = []
+    for name, (indexed, scan) in cases.items():
+        assert indexed() == scan()
+        t_index = best_of(indexed, repeat=3) / args.queries
+        t_scan = best_of(scan, repeat=1) / args.queries
+        rows.append((name, f"{t_index * 1e3:.2f}", f"{t_scan * 1e3:.1f}",
+                     f"{t_scan / t_index:.0f}x"))
+
+    print(f"{args.people} people: store built in {build:.1f} s, "
+          f"{store_mib:.0f} MiB vs {dicts_mib:.0f} MiB as dicts; "
+          f"first query with cold bitmaps {first_bitmaps * 1e3:.1f} ms")
+    print_table(("query", "store ms", "scan ms", "speedup"), rows)
+
+
+if __name__ == "__main__":
+    main()
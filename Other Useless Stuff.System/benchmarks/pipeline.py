@@ -0,0 +1,74 @@
+"""Sum of even squares: list comprehension against the lazy ``Pipeline``.
+
+Time is measured without tracing; peak memory is a separate run under
+tracemalloc.  The list comprehension materializes every square, so at
+10^8 it needs several GB -- it is skipped above ``--max-list``.
+
+    python -m benchmarks.pipeline [--sizes 1000000 10000000 100000000]
+"""
+import argparse
+import time
+import tracemalloc
+
+import pipeline
+from benchmarks._util import print_table
+from pipeline import Pipeline, even_squares, is_even, square
+
+
+def list_comprehension(n):
+    return sum([x**2 for x in range(n) if x % 2 == 0])
+
+
+def lazy_python(n):
+    # Plain Python callables have no array kernel, so this never fuses
+    return Pipeline(range(n)).filter(lambda x: x % 2 == 0).map(lambda x: x**2).sum()
+
+
+def lazy_builtin_stages(n):
+    return Pipeline(iter(range(n))).filter(is_even).map(square).sum()
+
+
+def lazy_fused(n):
+    return even_squares(range(n)).sum()
+
+
+def measure(func, n):
+    start = time.perf_counter()
+    result = func(n)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    func(n)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10**6, 10**7])
+    parser.add_argument("--max-list", type=int, default=10**7,
+                        help="largest n to run the list comprehension on")
+    args = parser.parse_args()
+
+    cases = [("list comprehension", list_comprehension),
+             ("Pipeline, lambdas", lazy_python),
+             ("Pipeline, is_even/square", lazy_builtin_stages)]
+    if pipeline.np is not None:
+        cases.append(("Pipeline, fused NumPy", lazy_fused))
+
+    rows = []
+    for n in args.sizes:
+        results = set()
+        for label, func in cases:
+            if func is list_comprehension and n > args.max_list:
+                rows.append((n, label, "skipped", ""))
+                continue
+            result, elapsed, peak = measure(func, n)
+            results.add(result)
+            rows.append((n, label, f"{elapsed:.3f}", f"{peak / 2**20:.2f}"))
+        assert len(results) == 1, results
+    print_table(("n", "method", "seconds", "peak MiB"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Rendering catalog listings: cached ``book_info`` and ``render_catalog``.
+
+Each "request" renders the whole listing once; between requests a few
+books change checkout state, which invalidates only their cached lines.
+
+    python -m benchmarks.render [--books 5000] [--requests 200]
+"""
+import argparse
+import random
+import time
+
+from benchmarks._util import print_table
+from catalog import render_catalog
+from functionsV2 import Book
+
+
+def uncached_loop(books):
+    # What every request paid before: format each line, join at the end
+    lines = []
+    for book in books:
+        lines.append(book._format_info())
+    return "\n".join(lines)
+
+
+def cached_loop(books):
+    lines = []
+    for book in books:
+        lines.append(book.book_info())
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--books", type=int, default=5_000)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--changes", type=int, default=10,
+                        help="books whose checkout state flips between requests")
+    args = parser.parse_args()
+
+    rows = []
+    for label, render in (("book_info loop, uncached", uncached_loop),
+                          ("book_info loop, cached", cached_loop),
+                          ("render_catalog", render_catalog)):
+        rng = random.Random(0)
+        books = [Book(f"Title {i}", f"Author {i % 300}", rng.randint(50, 1200))
+                 for i in range(args.books)]
+        start = time.perf_counter()
+        for _ in range(args.requests):
+            for book in rng.sample(books, args.changes):
+                book.is_checked_out = not book.is_checked_out
+            listing = render(books)
+        elapsed = time.perf_counter() - start
+        assert listing == uncached_loop(books)
+        rows.append((label, f"{elapsed / args.requests * 1e3:.2f}"))
+    print(f"{args.books:,} books, {args.changes} state changes per request")
+    print_table(("method", "ms per listing"), rows)
+
+
+if __name__ == "__main__":
+    main()
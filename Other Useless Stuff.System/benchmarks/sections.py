@@ -0,0 +1,47 @@
+"""Wall-clock time of ``run_sections``: serial against thread and process pools.
+
+Pools are created (and warmed up) outside the timed region, so the numbers
+show the per-run cost of fanning the sections out, not pool startup.
+
+    python -m benchmarks.sections [--jobs 2 4 8] [--repeat N]
+"""
+import argparse
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import functionsV2
+from benchmarks._util import best_of, print_table
+
+# Prints the current time, so its text differs between runs
+CLOCK_SECTIONS = {"section_external_modules"}
+
+
+def comparable(results):
+    """``run_sections`` results with the text of clock-dependent sections dropped."""
+    return [(name, None if name in CLOCK_SECTIONS else text) for name, text in results]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, nargs="+", default=[2, 4, os.cpu_count() or 1])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as work:
+        os.chdir(work)  # section 8 writes sample_data.txt into the cwd
+        expected = comparable(functionsV2.run_sections())
+        serial = best_of(functionsV2.run_sections, args.repeat)
+        rows = [("serial", 1, f"{serial * 1e3:.2f}", "1.00x")]
+        for label, pool in (("threads", ThreadPoolExecutor), ("processes", ProcessPoolExecutor)):
+            for jobs in sorted(set(args.jobs)):
+                with pool(max_workers=jobs) as executor:
+                    assert comparable(functionsV2.run_sections(executor=executor)) == expected
+                    t = best_of(lambda: functionsV2.run_sections(executor=executor), args.repeat)
+                rows.append((label, jobs, f"{t * 1e3:.2f}", f"{serial / t:.2f}x"))
+    print(f"CPUs: {os.cpu_count()}")
+    print_table(("mode", "workers", "ms per run", "speedup"), rows)
+
+
+if __name__ == "__main__":
+    main()
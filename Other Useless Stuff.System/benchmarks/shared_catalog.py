@@ -0,0 +1,115 @@
+"""Per-worker memory and attach time: SharedCatalog against pickled Book lists.
+
+Each worker is a fresh (spawned) process that gets the catalog, sums the
+page counts of every book, reads some titles and checks out a few books.
+Workers start together but take turns for the timed part, so the timings
+are not skewed by how many cores the machine has.
+Memory is read from /proc/self/smaps_rollup, so this benchmark needs Linux.
+"Private" memory is what the worker does not share with any other process.
+
+    python -m benchmarks.shared_catalog [--books 200000] [--workers 16]
+"""
+import argparse
+import multiprocessing
+import pickle
+import time
+
+from benchmarks._util import print_table
+from benchmarks.catalog import make_books
+from shared_catalog import SharedCatalog
+
+
+def memory_kib():
+    """(RSS, private) memory of this process in KiB."""
+    fields = {}
+    with open("/proc/self/smaps_rollup") as file:
+        for line in file:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                fields[parts[0].rstrip(":")] = int(parts[1])
+    return fields["Rss"], fields["Private_Clean"] + fields["Private_Dirty"]
+
+
+def worker(worker_id, source, turn, results):
+    turn.acquire()
+    rss, private = memory_kib()
+    start = time.perf_counter()
+    if isinstance(source, bytes):
+        books = pickle.loads(source)
+        attached = time.perf_counter()
+        total = sum(book.pages for book in books)
+        titles = [books[i].title for i in range(worker_id, len(books), 997)]
+        checked = sum(not book.is_checked_out and book.check_out() is not None
+                      for book in books[worker_id::4001])
+    else:
+        catalog = SharedCatalog.attach(*source)
+        attached = time.perf_counter()
+        total = sum(catalog.page_counts())
+        titles = [catalog.title(i) for i in range(worker_id, len(catalog), 997)]
+        checked = sum(catalog.check_out(i) for i in range(worker_id, len(catalog), 4001))
+    done = time.perf_counter()
+    turn.release()
+    rss_after, private_after = memory_kib()
+    results.put((attached - start, done - attached, rss_after - rss,
+                 private_after - private, total, len(titles), checked))
+    if not isinstance(source, bytes):
+        catalog.close()
+
+
+def run(context, source, workers):
+    results = context.Queue()
+    turn = context.Lock()
+    processes = [context.Process(target=worker, args=(n, source, turn, results))
+                 for n in range(workers)]
+    for process in processes:
+        process.start()
+    rows = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--books", type=int, default=200_000)
+    parser.add_argument("--workers", type=int, default=16)
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context("spawn")
+    books = make_books(args.books)
+
+    start = time.perf_counter()
+    payload = pickle.dumps(books, protocol=pickle.HIGHEST_PROTOCOL)
+    pickled = time.perf_counter() - start
+    start = time.perf_counter()
+    catalog = SharedCatalog.publish(books, context=context)
+    published = time.perf_counter() - start
+
+    table = []
+    with catalog:
+        for name, prepare, source in (
+            ("pickled Book list", pickled, payload),
+            ("SharedCatalog", published, (catalog.name, catalog._locks, catalog._tracker)),
+        ):
+            rows = run(context, source, args.workers)
+            assert len({row[4] for row in rows}) == 1   # every worker saw the same pages
+            n = len(rows)
+            table.append((
+                name,
+                f"{prepare * 1e3:.0f}",
+                f"{sum(r[0] for r in rows) / n * 1e3:.2f}",
+                f"{sum(r[1] for r in rows) / n * 1e3:.0f}",
+                f"{sum(r[2] for r in rows) / n / 1024:.1f}",
+                f"{sum(r[3] for r in rows) / n / 1024:.1f}",
+                f"{sum(r[3] for r in rows) / 1024:.0f}",
+            ))
+        checked_out = sum(catalog.is_checked_out(i) for i in range(len(catalog)))
+
+    print(f"{args.books} books, {args.workers} spawned workers; "
+          f"{checked_out} books checked out through shared state")
+    print_table(("catalog", "prepare ms", "attach ms", "work ms", "RSS MiB/worker",
+                 "private MiB/worker", "private MiB total"), table)
+
+
+if __name__ == "__main__":
+    main()
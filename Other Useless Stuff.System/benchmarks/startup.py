@@ -0,0 +1,115 @@
+"""Startup cost of ``import functionsV2``: import time and peak RSS.
+
+Compares the current module with the pre-refactor script checked out from
+git, which repeated every section eight times and ran them all on import.
+
+It also checks, with ``-X importtime``, that importing the module does not
+load anything that is only needed by the demo sections or ``main()``
+(``math``, ``datetime``, ...), and exits non-zero if it does.
+
+    python -m benchmarks.startup [--baseline-rev REV] [--repeat N] [--check-only]
+"""
+import argparse
+import os
+import py_compile
+import subprocess
+import tempfile
+
+from benchmarks._util import MODULE_DIR, print_table, run_python
+
+PROBE = """
+import resource, sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+sys.stderr.write(f"{{elapsed}} {{peak_kb}}\\n")
+"""
+
+
+# Modules the sections and main() import on first use; ``import functionsV2``
+# must not load them
+DEFERRED_MODULES = (
+    "math", "datetime", "argparse", "json", "concurrent.futures", "file_handling",
+    "instrument", "tracemalloc", "cProfile",
+)
+
+
+def imported_modules(statement):
+    """Names of the modules ``-X importtime`` reports while running ``statement``."""
+    report = run_python(statement, env={"PYTHONPROFILEIMPORTTIME": "1"})
+    return {line.rsplit("|", 1)[1].strip()
+            for line in report.splitlines() if line.startswith("import time:")} - {"imported package"}
+
+
+def check_deferred_imports():
+    """Return the deferred modules that ``import functionsV2`` loads eagerly."""
+    loaded = imported_modules("import functionsV2") - imported_modules("pass")
+    return sorted(set(DEFERRED_MODULES) & loaded)
+
+
+def root_revision():
+    out = subprocess.run(
+        ["git", "rev-list", "--max-parents=0", "HEAD"],
+        cwd=MODULE_DIR, capture_output=True, text=True, check=True,
+    )
+    return out.stdout.split()[0]
+
+
+def measure(statement, cwd, pythonpath, repeat):
+    """Best import time (s) and lowest peak RSS (KiB) over fresh interpreters."""
+    times, peaks = [], []
+    for _ in range(repeat):
+        elapsed, peak_kb = run_python(
+            PROBE.format(statement=statement), cwd=cwd,
+            env={"PYTHONPATH": pythonpath},
+        ).split()
+        times.append(float(elapsed))
+        peaks.append(int(peak_kb))
+    return min(times), min(peaks)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--baseline-rev", default=None,
+                        help="git revision of the old script (default: root commit)")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--check-only", action="store_true",
+                        help="only run the -X importtime check")
+    args = parser.parse_args()
+
+    eager = check_deferred_imports()
+    print(f"-X importtime check: {'FAILED, loaded ' + ', '.join(eager) if eager else 'ok'}")
+    if eager:
+        raise SystemExit(1)
+    if args.check_only:
+        return
+
+    rev = args.baseline_rev or root_revision()
+    baseline = subprocess.run(
+        ["git", "show", f"{rev}:./functionsV2.py"],
+        cwd=MODULE_DIR, capture_output=True, check=True,
+    ).stdout
+
+    with tempfile.TemporaryDirectory() as old_dir, tempfile.TemporaryDirectory() as work:
+        old_path = os.path.join(old_dir, "functionsV2.py")
+        with open(old_path, "wb") as f:
+            f.write(baseline)
+        # Time the import from cached bytecode, not the compile
+        for path in (old_path, os.path.join(MODULE_DIR, "functionsV2.py")):
+            py_compile.compile(path)
+        cases = [
+            ("bare interpreter", "pass", MODULE_DIR),
+            (f"functionsV2 @ {rev[:10]}", "import functionsV2", old_dir),
+            ("functionsV2 (current)", "import functionsV2", MODULE_DIR),
+        ]
+        rows = []
+        for label, statement, path in cases:
+            elapsed, peak_kb = measure(statement, work, path, args.repeat)
+            rows.append((label, f"{elapsed * 1e3:.2f}", f"{peak_kb / 1024:.1f}"))
+
+    print_table(("case", "import ms", "peak RSS MiB"), rows)
+
+
+if __name__ == "__main__":
+    main()
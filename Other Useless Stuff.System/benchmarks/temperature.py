@@ -0,0 +1,69 @@
+"""Temperature banding: TemperatureBands against the section 4 if/elif chain.
+
+    python -m benchmarks.temperature [--readings 1000000]
+"""
+import argparse
+import random
+
+from benchmarks._util import best_of, print_table
+from temperature import TemperatureBands, np
+
+
+def classify_chain(temperature):
+    # The if/elif/else of functionsV2.section_control_flow
+    if temperature > 30:
+        return "hot"
+    elif 20 <= temperature <= 30:
+        return "perfect"
+    else:
+        return "chilly"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--readings", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    readings = [round(rng.gauss(22, 9), 1) for _ in range(args.readings)]
+    bands = TemperatureBands()
+
+    def chain_counts():
+        counts = {"chilly": 0, "perfect": 0, "hot": 0}
+        for reading in readings:
+            counts[classify_chain(reading)] += 1
+        return counts
+
+    def bucket(data):
+        bands.reset()
+        bands.bucket(data)
+        return bands.totals()
+
+    def stream():
+        bands.reset()
+        for _ in bands.stream(iter(readings)):
+            pass
+        return bands.totals()
+
+    cases = [
+        ("if/elif chain per reading", chain_counts),
+        ("classify() per reading", lambda: [bands.classify(r) for r in readings]),
+        ("bucket(list)", lambda: bucket(readings)),
+        ("stream(iterator)", stream),
+    ]
+    if np is not None:
+        array = np.array(readings)
+        cases.append(("bucket(ndarray)", lambda: bucket(array)))
+
+    assert chain_counts() == bucket(readings) == stream()
+    times = [(name, best_of(run, repeat=3)) for name, run in cases]
+    baseline = times[0][1]
+    rows = [(name, f"{seconds * 1e3:.1f}", f"{args.readings / seconds / 1e6:.1f}",
+             f"{baseline / seconds:.1f}x") for name, seconds in times]
+
+    print(f"{args.readings} readings, NumPy {'on' if np is not None else 'off'}")
+    print_table(("method", "ms", "M readings/s", "vs chain"), rows)
+
+
+if __name__ == "__main__":
+    main()
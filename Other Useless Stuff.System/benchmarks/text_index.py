@@ -0,0 +1,80 @@
+"""Full-text query latency on a synthetic catalog, against a substring scan.
+
+    python -m benchmarks.text_index [--books 1000000] [--queries 200]
+"""
+import argparse
+import random
+import time
+
+from benchmarks._util import best_of, print_table
+from functionsV2 import Book
+from text_index import TextIndex, tokenize
+
+
+def make_books(n, seed=0):
+    """Titles of 2-5 words drawn with a skewed (Zipf-like) distribution."""
+    rng = random.Random(seed)
+    syllables = ["ka", "lo", "mi", "ne", "ru", "sa", "te", "vo", "zi", "dé", "an", "or"]
+    words = list(dict.fromkeys("".join(rng.choices(syllables, k=rng.randint(2, 4)))
+                               for _ in range(30_000)))
+    weights = [1 / (rank + 1) for rank in range(len(words))]
+    firsts = [w.title() for w in words[:2_000]]
+    lasts = [w.title() for w in words[2_000:12_000]]
+    return [Book(" ".join(rng.choices(words, weights, k=rng.randint(2, 5))).capitalize(),
+                 f"{rng.choice(firsts)} {rng.choice(lasts)}", rng.randint(50, 1200))
+            for _ in range(n)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--books", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("-k", type=int, default=10)
+    args = parser.parse_args()
+
+    books = make_books(args.books)
+    start = time.perf_counter()
+    index = TextIndex(enumerate(books))
+    build = time.perf_counter() - start
+    index.prefix("a")   # build the sorted vocabulary outside the timings
+
+    rng = random.Random(1)
+    samples = [books[rng.randrange(args.books)] for _ in range(args.queries)]
+    one_word = [rng.choice(tokenize(b.title)) for b in samples]
+    rare = [tokenize(b.author)[-1] for b in samples]
+    two_words = [" ".join(tokenize(b.title)[:2]) for b in samples]
+    typed = [f"{b.author.split()[0]} {tokenize(b.author)[-1][:3]}" for b in samples]
+    k = args.k
+
+    cases = {
+        "one title word": lambda: [index.search(q, k) for q in one_word],
+        "one author surname": lambda: [index.search(q, k) for q in rare],
+        "two title words": lambda: [index.search(q, k) for q in two_words],
+        "prefix search": lambda: [index.search(q, k, prefix=True) for q in typed],
+        "completions (3 chars)": lambda: [index.prefix(q[:3], limit=10) for q in rare],
+    }
+    rows = []
+    for name, run in cases.items():
+        seconds = best_of(run, repeat=3) / args.queries
+        rows.append((name, f"{seconds * 1e3:.3f}"))
+
+    scan_queries = rare[:5]
+    scan = best_of(lambda: [[b for b in books if q in b.author.lower()]
+                            for q in scan_queries], repeat=1) / len(scan_queries)
+    rows.append(("substring scan (author)", f"{scan * 1e3:.3f}"))
+
+    extra = make_books(10_000, seed=2)
+    start = time.perf_counter()
+    for i, book in enumerate(extra, args.books):
+        index.add(i, book)
+    for i in range(args.books, args.books + len(extra)):
+        index.remove(i)
+    churn = (time.perf_counter() - start) / (2 * len(extra))
+    rows.append(("add or remove one book", f"{churn * 1e3:.3f}"))
+
+    print(f"{args.books} books indexed in {build:.1f} s")
+    print_table(("query", "ms per query"), rows)
+
+
+if __name__ == "__main__":
+    main()
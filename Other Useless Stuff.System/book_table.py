@@ -0,0 +1,146 @@
+"""Column-oriented storage for very large collections of books.
+
+``BookTable`` keeps one column per ``Book`` field instead of one object per
+book: titles are packed as UTF-8 into one buffer with an offsets array,
+authors (few distinct values) are dictionary-encoded, page counts live in an
+``array('I')`` and checkout status in a bitset.
+Indexing the table returns a ``BookRow``, a two-slot view that behaves like
+a ``Book``.
+"""
+from array import array
+
+from functionsV2 import Book
+
+
+class BookTable:
+    def __init__(self, books=()):
+        self._title_data = bytearray()
+        self._title_offsets = array("Q", [0])  # row i is data[off[i]:off[i + 1]]
+        self._author_names = []   # code -> author
+        self._author_codes = {}   # author -> code
+        self._authors = array("I")
+        self._pages = array("I")
+        self._checked_out = bytearray()  # one bit per row
+        self.extend(books)
+
+    def __len__(self):
+        return len(self._pages)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self._pages)
+        if not 0 <= index < len(self._pages):
+            raise IndexError("book table index out of range")
+        return BookRow(self, index)
+
+    def __iter__(self):
+        for index in range(len(self._pages)):
+            yield BookRow(self, index)
+
+    def append(self, title, author, pages, is_checked_out=False):
+        """Add a row and return its index."""
+        index = len(self._pages)
+        self._title_data += title.encode()
+        self._title_offsets.append(len(self._title_data))
+        self._authors.append(self._encode_author(author))
+        self._pages.append(pages)
+        if index % 8 == 0:
+            self._checked_out.append(0)
+        if is_checked_out:
+            self.set_checked_out(index, True)
+        return index
+
+    def append_book(self, book):
+        """Copy ``book`` (a ``Book`` or ``BookRow``) into a new row."""
+        return self.append(book.title, book.author, book.pages, book.is_checked_out)
+
+    def extend(self, books):
+        """Append every book in ``books``."""
+        for book in books:
+            self.append_book(book)
+
+    # Column access by row index (0 <= index < len(table))
+    def title(self, index):
+        offsets = self._title_offsets
+        return self._title_data[offsets[index]:offsets[index + 1]].decode()
+
+    def author(self, index):
+        return self._author_names[self._authors[index]]
+
+    def pages(self, index):
+        return self._pages[index]
+
+    def is_checked_out(self, index):
+        return bool(self._checked_out[index >> 3] & (1 << (index & 7)))
+
+    def set_checked_out(self, index, value):
+        if value:
+            self._checked_out[index >> 3] |= 1 << (index & 7)
+        else:
+            self._checked_out[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+
+    def _encode_author(self, author):
+        code = self._author_codes.get(author)
+        if code is None:
+            code = self._author_codes[author] = len(self._author_names)
+            self._author_names.append(author)
+        return code
+
+
+class BookRow:
+    """A ``Book``-compatible view of one row of a ``BookTable``."""
+
+    __slots__ = ("_table", "_index")
+
+    library_name = Book.library_name
+
+    def __init__(self, table, index):
+        self._table = table
+        self._index = index
+
+    @property
+    def title(self):
+        return self._table.title(self._index)
+
+    @property
+    def author(self):
+        return self._table.author(self._index)
+
+    @property
+    def pages(self):
+        return self._table.pages(self._index)
+
+    @property
+    def is_checked_out(self):
+        return self._table.is_checked_out(self._index)
+
+    @is_checked_out.setter
+    def is_checked_out(self, value):
+        self._table.set_checked_out(self._index, value)
+
+    # Same behaviour as the Book methods, reading through the properties
+    # (rows are short-lived views, so book_info is not cached here)
+    def check_out(self):
+        table = self._table
+        if hasattr(table, "check_out"):
+            # A table shared between workers (SharedCatalog) tests and sets
+            # the flag under its own lock
+            available = table.check_out(self._index)
+        else:
+            available = not table.is_checked_out(self._index)
+            if available:
+                table.set_checked_out(self._index, True)
+        if available:
+            return f"'{self.title}' has been checked out."
+        return f"Sorry, '{self.title}' is already checked out."
+
+    book_info = Book._format_info
+
+    def to_book(self):
+        """Materialize this row as a standalone ``Book``."""
+        book = Book(self.title, self.author, self.pages)
+        book.is_checked_out = self.is_checked_out
+        return book
+
+    def __repr__(self):
+        return f"BookRow({self.title!r}, {self.author!r}, {self.pages})"
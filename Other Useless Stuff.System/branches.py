@@ -0,0 +1,131 @@
+"""Library branches, each owning its own catalog shard.
+
+A ``Library`` is one branch with its own catalog.  Adding a ``Book`` to it
+sets the book's ``library_name`` to the branch (books in no branch report
+the class-wide default), so ``LibraryNetwork.library_of(book)`` is one dict
+lookup.  A ``LibraryNetwork`` routes a query that names a branch to that shard only,
+and fans a network-wide query out over every shard (concurrently when given
+a ``concurrent.futures`` executor, like ``functionsV2.run_sections``) and
+merges the results.
+"""
+from heapq import merge
+
+from catalog import Catalog
+
+
+class BranchCatalog(Catalog):
+    """``Catalog`` of the branch ``name`` that can also look books up by object.
+
+    Books added to it get ``library_name = name``; a book belongs to the
+    branch it was added to last.
+    """
+
+    def __init__(self, name, books=()):
+        self.name = name
+        self._ids = {}   # Book -> its id in this branch
+        super().__init__(books)
+
+    def add(self, book):
+        book_id = super().add(book)
+        self._ids[book] = book_id
+        book.library_name = self.name
+        return book_id
+
+    def remove(self, book_id):
+        book = super().remove(book_id)
+        if self._ids.get(book) == book_id:
+            del self._ids[book]
+            if book.library_name == self.name:
+                book.library_name = None   # back to the class-wide default
+        return book
+
+    def contains_book(self, book):
+        """Whether the ``Book`` object ``book`` (not just its title) is here."""
+        return book in self._ids
+
+    def id_of(self, book):
+        """Id of ``book`` in this branch; raises ``KeyError`` if it is not here."""
+        return self._ids[book]
+
+
+class Library:
+    def __init__(self, name, books=()):
+        self.name = name
+        self.catalog = BranchCatalog(name, books)
+
+    def __len__(self):
+        return len(self.catalog)
+
+    def __repr__(self):
+        return f"Library({self.name!r}, {len(self.catalog)} books)"
+
+
+class LibraryNetwork:
+    def __init__(self, libraries=()):
+        self._libraries = {}
+        for library in libraries:
+            self.add_library(library)
+
+    def __len__(self):
+        return sum(len(library) for library in self._libraries.values())
+
+    def __iter__(self):
+        return iter(self._libraries.values())
+
+    def add_library(self, library):
+        """Add a ``Library`` (or create an empty one from a name) and return it."""
+        if isinstance(library, str):
+            library = Library(library)
+        if library.name in self._libraries:
+            raise ValueError(f"duplicate library name: {library.name!r}")
+        self._libraries[library.name] = library
+        return library
+
+    def library(self, name):
+        """The branch called ``name``; raises ``KeyError`` if unknown."""
+        return self._libraries[name]
+
+    # Routed operations: one shard
+    def add(self, library_name, book):
+        """Add ``book`` to a branch and return its id in that branch."""
+        return self._libraries[library_name].catalog.add(book)
+
+    def get(self, library_name, book_id):
+        return self._libraries[library_name].catalog.get(book_id)
+
+    def library_of(self, book):
+        """The branch ``book`` was added to; raises ``KeyError`` if none."""
+        library = self._libraries.get(book.library_name)
+        if library is None or not library.catalog.contains_book(book):
+            raise KeyError(f"{book.title!r} is not in any branch of this network")
+        return library
+
+    # Fan-out queries: every shard, or the branches named in ``libraries``
+    def by_title(self, title, libraries=None, executor=None):
+        """``[(library name, Book), ...]`` for every exact title match."""
+        return self._fan_out(lambda c: c.by_title(title), libraries, executor)
+
+    def by_author(self, author, libraries=None, executor=None):
+        """``[(library name, Book), ...]`` for every exact author match."""
+        return self._fan_out(lambda c: c.by_author(author), libraries, executor)
+
+    def pages_between(self, low, high, libraries=None, executor=None):
+        """Like ``Catalog.pages_between`` across branches, still ordered by pages."""
+        per_shard = self._query(lambda c: c.pages_between(low, high), libraries, executor)
+        tagged = [[(name, book) for book in books] for name, books in per_shard]
+        return list(merge(*tagged, key=lambda pair: pair[1].pages))
+
+    def _fan_out(self, query, libraries, executor):
+        return [(name, book) for name, books in self._query(query, libraries, executor)
+                for book in books]
+
+    def _query(self, query, libraries, executor):
+        shards = (self._libraries.values() if libraries is None
+                  else [self._libraries[name] for name in libraries])
+
+        def run(library):
+            return library.name, query(library.catalog)
+
+        if executor is None:
+            return [run(library) for library in shards]
+        return list(executor.map(run, shards))
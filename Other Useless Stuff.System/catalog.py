@@ -0,0 +1,116 @@
+"""Indexed container of ``Book`` objects.
+
+Books get an integer id when they are added.  Exact title and author lookups
+go through hash indexes, and page-count range queries use a sorted index, so
+nothing has to scan the whole collection.
+"""
+from bisect import bisect_left, bisect_right
+
+
+class Catalog:
+    def __init__(self, books=()):
+        self._books = {}          # book id -> Book
+        self._next_id = 0
+        self._by_title = {}       # title -> [book id, ...]
+        self._by_author = {}      # author -> [book id, ...]
+        # book id -> (title, author, pages) it was indexed under; Book fields
+        # can be reassigned later, so removal cannot go by their current values
+        self._keys = {}
+        # Sorted (pages, book id, Book) triples.  Bulk loads append unsorted and the
+        # index is re-sorted once, on the next range query.
+        self._by_pages = []
+        self._pages_sorted = True
+        self.extend(books)
+
+    def __len__(self):
+        return len(self._books)
+
+    def __iter__(self):
+        return iter(self._books.values())
+
+    def __contains__(self, book_id):
+        return book_id in self._books
+
+    def items(self):
+        """Iterate over ``(book id, Book)`` pairs."""
+        return self._books.items()
+
+    def add(self, book):
+        """Add ``book`` and return its id."""
+        book_id = self._next_id
+        self._next_id += 1
+        self._books[book_id] = book
+        title, author, pages = self._keys[book_id] = (book.title, book.author, book.pages)
+        self._by_title.setdefault(title, []).append(book_id)
+        self._by_author.setdefault(author, []).append(book_id)
+        entry = (pages, book_id, book)
+        if self._pages_sorted and self._by_pages and entry[:2] < self._by_pages[-1][:2]:
+            self._pages_sorted = False
+        self._by_pages.append(entry)
+        return book_id
+
+    def extend(self, books):
+        """Add every book in ``books`` and return their ids."""
+        return [self.add(book) for book in books]
+
+    def get(self, book_id):
+        """Return the book with ``book_id``; raises ``KeyError`` if unknown."""
+        return self._books[book_id]
+
+    def remove(self, book_id):
+        """Remove and return the book with ``book_id``."""
+        title, author, pages = self._keys[book_id]
+        self._sort_pages()
+        position = bisect_left(self._by_pages, (pages, book_id))
+        assert self._by_pages[position][1] == book_id, "pages index out of sync"
+        del self._by_pages[position]
+        del self._keys[book_id]
+        _discard(self._by_title, title, book_id)
+        _discard(self._by_author, author, book_id)
+        return self._books.pop(book_id)
+
+    def by_title(self, title):
+        """Books whose title is exactly ``title``."""
+        return [self._books[i] for i in self._by_title.get(title, ())]
+
+    def by_author(self, author):
+        """Books whose author is exactly ``author``."""
+        return [self._books[i] for i in self._by_author.get(author, ())]
+
+    def ids_by_title(self, title):
+        """Ids of the books whose title is exactly ``title``."""
+        return list(self._by_title.get(title, ()))
+
+    def ids_by_author(self, author):
+        """Ids of the books whose author is exactly ``author``."""
+        return list(self._by_author.get(author, ()))
+
+    def pages_between(self, low, high):
+        """Books with ``low <= pages <= high``, ordered by page count."""
+        self._sort_pages()
+        index = self._by_pages
+        start = bisect_left(index, (low,))
+        # (high, inf) sorts after every (high, book id, Book) entry
+        stop = bisect_right(index, (high, float("inf")))
+        return [book for _, _, book in index[start:stop]]
+
+    def render(self, sep="\n"):
+        """``render_catalog`` over every book in the catalog."""
+        return render_catalog(self._books.values(), sep)
+
+    def _sort_pages(self):
+        if not self._pages_sorted:
+            self._by_pages.sort()
+            self._pages_sorted = True
+
+
+def _discard(index, key, book_id):
+    ids = index[key]
+    ids.remove(book_id)
+    if not ids:
+        del index[key]
+
+
+def render_catalog(books, sep="\n"):
+    """All ``book_info()`` lines of ``books`` joined into one string."""
+    return sep.join([book.book_info() for book in books])
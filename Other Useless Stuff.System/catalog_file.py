@@ -0,0 +1,158 @@
+"""Compact on-disk format for collections of ``Book`` objects.
+
+Layout (all integers little-endian)::
+
+    header        magic, version, record count and the section offsets
+    records       one fixed-width struct per book:
+                  title id, author id, pages (uint32), checked-out flag (uint8)
+    string index  uint64 offsets into the string data, one per string + 1
+    string data   UTF-8 titles and authors, each distinct string stored once
+    title index   uint32 record numbers sorted by title
+
+``save_catalog`` writes a file; ``CatalogFile`` memory-maps one and decodes
+only what is asked for, so opening is O(1) and a book can be read by
+position (fixed-width records) or found by title (binary search over the
+title index) without loading the rest.
+"""
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+
+from file_handling import FSYNC_NONE, atomic_write
+from functionsV2 import Book
+
+MAGIC = b"BOOKCAT\0"
+VERSION = 1
+HEADER = struct.Struct("<8sIIQQQQQ")
+RECORD = struct.Struct("<IIIB")
+
+
+def save_catalog(path, books, fsync=FSYNC_NONE):
+    """Write ``books`` (``Book`` objects or compatible rows) to ``path``.
+
+    The file goes through ``file_handling.atomic_write``, so a reader never
+    sees a partial catalog, an existing file keeps its permissions and
+    ``fsync`` is one of its ``FSYNC_*`` policies.  Returns the number of
+    books.
+    """
+    string_ids = {}
+    strings = []
+    titles = []
+    records = bytearray()
+    pack = RECORD.pack
+    for book in books:
+        ids = []
+        for text in (book.title, book.author):
+            string_id = string_ids.get(text)
+            if string_id is None:
+                string_id = string_ids[text] = len(strings)
+                strings.append(text)
+            ids.append(string_id)
+        titles.append(book.title)
+        records += pack(ids[0], ids[1], book.pages, book.is_checked_out)
+
+    encoded = [text.encode() for text in strings]
+    offsets = [0]
+    for data in encoded:
+        offsets.append(offsets[-1] + len(data))
+    title_order = sorted(range(len(titles)), key=titles.__getitem__)
+
+    records_pos = HEADER.size
+    string_index_pos = records_pos + len(records)
+    string_data_pos = string_index_pos + 8 * len(offsets)
+    title_index_pos = string_data_pos + offsets[-1]
+    header = HEADER.pack(MAGIC, VERSION, len(titles), len(strings), records_pos,
+                         string_index_pos, string_data_pos, title_index_pos)
+
+    with atomic_write(path, fsync) as file:
+        file.write(header)
+        file.write(records)
+        file.write(_little_endian(array("Q", offsets)))
+        file.write(b"".join(encoded))
+        file.write(_little_endian(array("I", title_order)))
+    return len(titles)
+
+
+class CatalogFile:
+    """Read-only, memory-mapped view of a file written by ``save_catalog``."""
+
+    def __init__(self, path):
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, self._count, n_strings, self._records_pos,
+         string_index_pos, self._string_data_pos, title_index_pos) = HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != VERSION:
+            self._map.close()
+            raise ValueError(f"{path!r} is not a version {VERSION} catalog file")
+        view = memoryview(self._map)
+        self._string_offsets = _native(view[string_index_pos:self._string_data_pos], "Q")
+        self._title_index = _native(view[title_index_pos:title_index_pos + 4 * self._count], "I")
+        self._views = [v for v in (view, self._string_offsets, self._title_index)
+                       if isinstance(v, memoryview)]
+
+    def close(self):
+        for view in reversed(self._views):
+            view.release()
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("catalog file index out of range")
+        title_id, author_id, pages, checked_out = self._record(index)
+        book = Book(self._string(title_id), self._string(author_id), pages)
+        book.is_checked_out = bool(checked_out)
+        return book
+
+    def __iter__(self):
+        for index in range(self._count):
+            yield self[index]
+
+    def title(self, index):
+        """Title of record ``index`` without building a ``Book``."""
+        return self._string(self._record(index)[0])
+
+    def find_title(self, title):
+        """Books whose title is exactly ``title`` (O(log n) string reads)."""
+        order = self._title_index
+        position = bisect_left(order, title, key=self.title)
+        found = []
+        while position < len(order) and self.title(order[position]) == title:
+            found.append(self[order[position]])
+            position += 1
+        return found
+
+    def _record(self, index):
+        return RECORD.unpack_from(self._map, self._records_pos + index * RECORD.size)
+
+    def _string(self, string_id):
+        start = self._string_data_pos + self._string_offsets[string_id]
+        end = self._string_data_pos + self._string_offsets[string_id + 1]
+        return self._map[start:end].decode()
+
+
+def _little_endian(values):
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values.tobytes()
+
+
+def _native(view, typecode):
+    """Zero-copy typed view of a little-endian section (a copy on big-endian hosts)."""
+    if sys.byteorder == "little":
+        return view.cast(typecode)
+    values = array(typecode, view.tobytes())
+    values.byteswap()
+    return values
@@ -0,0 +1,93 @@
+"""Thread-safe checkouts for the books in a ``Catalog``.
+
+``Book.check_out`` reads then writes ``is_checked_out`` without a lock, so
+two threads can both "succeed" on the same book.  ``CheckoutService`` guards
+that read-then-write with a fixed pool of striped locks: book ``i`` is
+protected by ``locks[i % stripes]``, so unrelated books rarely contend and
+memory does not grow with the catalog.
+
+For several processes, ``CheckoutService.shared`` keeps the flags in a shared
+``RawArray`` guarded by ``multiprocessing`` locks; workers forked after it is
+created all see the same state.
+"""
+import threading
+
+
+class CheckoutService:
+    def __init__(self, catalog, stripes=64, lock_factory=threading.Lock, flags=None):
+        self._catalog = catalog
+        self._locks = [lock_factory() for _ in range(stripes)]
+        # Optional per-id flag store shared between processes; when None the
+        # Book objects themselves hold the state.
+        self._flags = flags
+
+    @classmethod
+    def shared(cls, catalog, stripes=64):
+        """Service whose state is shared with forked worker processes.
+
+        Book ids must be ``0 .. len(catalog) - 1``, as in a freshly filled
+        ``Catalog``.
+        """
+        import multiprocessing
+
+        flags = multiprocessing.RawArray("b", len(catalog))
+        for book_id, book in catalog.items():
+            flags[book_id] = book.is_checked_out
+        return cls(catalog, stripes, multiprocessing.Lock, flags)
+
+    def _lock(self, book_id):
+        return self._locks[book_id % len(self._locks)]
+
+    def is_checked_out(self, book_id):
+        if self._flags is not None:
+            return bool(self._flags[book_id])
+        return self._catalog.get(book_id).is_checked_out
+
+    def _set(self, book_id, value):
+        if self._flags is not None:
+            self._flags[book_id] = value
+        self._catalog.get(book_id).is_checked_out = value
+
+    def check_out(self, book_id):
+        """Check out one book; return True if this call checked it out."""
+        with self._lock(book_id):
+            if self.is_checked_out(book_id):
+                return False
+            self._set(book_id, True)
+            return True
+
+    def return_book(self, book_id):
+        """Return one book; return True if it was checked out."""
+        with self._lock(book_id):
+            if not self.is_checked_out(book_id):
+                return False
+            self._set(book_id, False)
+            return True
+
+    def check_out_many(self, book_ids):
+        """Check out every available book in ``book_ids``.
+
+        Returns the ids this call checked out.  Ids are grouped by stripe so
+        each lock is taken once per batch, and only one lock is held at a
+        time.
+        """
+        return self._apply_many(book_ids, True)
+
+    def return_many(self, book_ids):
+        """Return every checked-out book in ``book_ids``; returns their ids."""
+        return self._apply_many(book_ids, False)
+
+    def _apply_many(self, book_ids, value):
+        stripes = len(self._locks)
+        groups = {}
+        for book_id in book_ids:
+            groups.setdefault(book_id % stripes, []).append(book_id)
+
+        changed = []
+        for stripe, ids in groups.items():
+            with self._locks[stripe]:
+                for book_id in ids:
+                    if self.is_checked_out(book_id) != value:
+                        self._set(book_id, value)
+                        changed.append(book_id)
+        return changed
@@ -0,0 +1,203 @@
+"""Reusable file helpers grown out of the "File Handling" demo section.
+
+Reading a whole file with ``read()`` needs as much memory as the file is
+large.  These helpers stream instead:
+
+* ``iter_lines`` yields decoded lines one at a time;
+* ``iter_chunks`` fills one reusable ``bytearray`` with ``readinto`` and
+  yields views of it, so a scan allocates nothing per chunk;
+* ``map_file`` memory-maps the file for random access;
+* ``iter_blocks`` scans a file with a strategy picked from its size.
+
+On the writing side, ``write_lines`` joins lines into large writes through
+``atomic_write``, which writes a temporary file and renames it over the
+target, so readers never see a partially written file.
+
+For a sequential scan, ``readinto`` chunks run as fast as ``mmap`` while
+keeping memory flat (touched mmap pages count towards RSS), so ``mmap`` is
+only chosen when asked for; see ``benchmarks/file_reading.py``.
+"""
+import mmap
+import os
+import tempfile
+from contextlib import contextmanager
+from itertools import islice
+
+# Files up to this size are simply read whole
+SMALL_FILE = 1 << 20
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+def iter_lines(path, encoding="utf-8"):
+    """Yield the lines of a text file, newline included."""
+    with open(path, "r", encoding=encoding) as file:
+        yield from file
+
+
+def iter_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yield ``memoryview`` chunks of a binary file.
+
+    Every chunk views the same buffer, which is overwritten by the next
+    read: copy it (``bytes(chunk)``) if it has to outlive the iteration.
+    """
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    with open(path, "rb", buffering=0) as file:
+        while True:
+            n = file.readinto(buffer)
+            if not n:
+                return
+            yield view[:n]
+
+
+@contextmanager
+def map_file(path):
+    """Memory-map ``path`` read-only for random access.
+
+    Yields an ``mmap`` (or ``b""`` for an empty file, which cannot be mapped).
+    """
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+def choose_strategy(size):
+    """Name of the read strategy ``iter_blocks`` uses for a file of ``size`` bytes."""
+    return "read" if size <= SMALL_FILE else "chunks"
+
+
+def iter_blocks(path, strategy=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yield the contents of a binary file as bytes-like blocks.
+
+    ``strategy`` is ``"read"``, ``"chunks"`` or ``"mmap"``; by default it is
+    chosen from the file size with ``choose_strategy``.  Blocks are only
+    valid until the next one is produced.
+    """
+    if strategy is None:
+        strategy = choose_strategy(os.path.getsize(path))
+    if strategy == "read":
+        with open(path, "rb") as file:
+            data = file.read()
+        if data:
+            yield data
+    elif strategy == "chunks":
+        yield from iter_chunks(path, chunk_size)
+    elif strategy == "mmap":
+        with map_file(path) as mapped:
+            if mapped and hasattr(mmap, "MADV_SEQUENTIAL"):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            # Slicing copies each block out of the mapping, so no view of
+            # the mmap outlives it
+            for start in range(0, len(mapped), chunk_size):
+                yield mapped[start:start + chunk_size]
+    else:
+        raise ValueError(f"unknown read strategy: {strategy!r}")
+
+
+# fsync policies for write_lines and atomic_write
+FSYNC_NONE = "none"   # leave flushing to the OS
+FSYNC_FILE = "file"   # data is on disk before the rename
+FSYNC_FULL = "full"   # ... and so is the rename itself (directory fsync)
+# Lines joined into each write() call
+DEFAULT_BATCH_LINES = 4096
+
+
+def write_lines(path, lines, fsync=FSYNC_NONE, encoding="utf-8",
+                batch_lines=DEFAULT_BATCH_LINES):
+    """Atomically replace ``path`` with ``lines``.
+
+    Like ``writelines``, no newlines are added.  Lines are joined and
+    encoded ``batch_lines`` at a time, skipping the per-call overhead of a
+    text-mode ``write``, and written through ``atomic_write``.  Returns the
+    number of lines written.
+    """
+    count = 0
+    with atomic_write(path, fsync) as file:
+        iterator = iter(lines)
+        while True:
+            batch = list(islice(iterator, batch_lines))
+            if not batch:
+                break
+            file.write("".join(batch).encode(encoding))
+            count += len(batch)
+    return count
+
+
+@contextmanager
+def atomic_write(path, fsync=FSYNC_NONE):
+    """Write ``path`` through a binary file that only replaces it on success.
+
+    The file is a temporary one in the same directory, ``os.replace``-d
+    over ``path`` when the block exits cleanly; on any error it is removed
+    and ``path`` is left untouched.  An existing ``path`` keeps its
+    permissions; a new one gets the usual ``0o666`` less the umask.
+    """
+    if fsync not in (FSYNC_NONE, FSYNC_FILE, FSYNC_FULL):
+        raise ValueError(f"unknown fsync policy: {fsync!r}")
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = _create_temp(path, directory)
+    try:
+        with open(fd, "wb") as file:
+            yield file
+            if fsync != FSYNC_NONE:
+                file.flush()
+                os.fsync(file.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    if fsync == FSYNC_FULL:
+        fsync_directory(directory)
+
+
+def fsync_directory(directory):
+    """Flush ``directory``'s entries (such as a rename into it) to disk."""
+    dir_fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+def write_then_read(path, lines, fsync=FSYNC_NONE):
+    """The demo section's flow: write ``lines`` to ``path``, then read it back."""
+    write_lines(path, lines, fsync)
+    with open(path, "r", encoding="utf-8") as file:
+        return file.read()
+
+
+def _create_temp(path, directory):
+    """Open a new temporary file next to ``path``; returns ``(fd, tmp path)``.
+
+    Replacing an existing file copies its permissions onto ``mkstemp``'s
+    0600 file.  Otherwise the file is created with mode 0o666 and the
+    kernel applies the umask, which is never read or changed here: doing so
+    would briefly change it for every thread in the process.
+    """
+    prefix = f".{os.path.basename(path)}."
+    try:
+        mode = os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        mode = None
+    if mode is not None:
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=prefix, suffix=".tmp")
+        try:
+            os.chmod(tmp_path, mode)
+        except BaseException:
+            os.close(fd)
+            os.unlink(tmp_path)
+            raise
+        return fd, tmp_path
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    while True:
+        tmp_path = os.path.join(directory, f"{prefix}{os.urandom(6).hex()}.tmp")
+        try:
+            return os.open(tmp_path, flags, 0o666), tmp_path
+        except FileExistsError:
+            continue
@@ -1,541 +1,134 @@
 # ==============================
 # A COMPREHENSIVE PYTHON EXAMPLE
 # ==============================
+"""A comprehensive Python example.
 
-# 1. VARIABLES AND BASIC DATA TYPES
-print("=== 1. Variables and Basic Types ===")
-name = "Alice"          # String
-age = 30                # Integer
-height = 1.75           # Float
-is_programmer = True    # Boolean
-favorite_language = None # NoneType
-
-print(f"Name: {name}, Type: {type(name)}")
-print(f"Age: {age}, Type: {type(age)}")
-print(f"Height: {height}, Type: {type(height)}")
-print(f"Is Programmer: {is_programmer}, Type: {type(is_programmer)}")
-print(f"Favorite Language: {favorite_language}, Type: {type(favorite_language)}")
-print()
-
-# 2. LISTS AND TUPLES
-print("=== 2. Lists and Tuples ===")
-# List - Mutable
-fruits_list = ["apple", "banana", "cherry"]
-fruits_list.append("orange")
-fruits_list[0] = "avocado"
-print("List (mutable):", fruits_list)
-
-# Tuple - Immutable
-fruits_tuple = ("apple", "banana", "cherry")
-# fruits_tuple[0] = "avocado" # This would cause an error!
-print("Tuple (immutable):", fruits_tuple)
-print()
-
-# 3. DICTIONARIES
-print("=== 3. Dictionaries ===")
-person = {
-    "name": "Bob",
-    "age": 25,
-    "city": "New York",
-    "hobbies": ["reading", "hiking", "coding"]
-}
-print("Original dict:", person)
-person["job"] = "Developer" # Add a new key-value pair
-print("Age from dict:", person["age"])
-print("Updated dict:", person)
-print()
-
-# 4. CONTROL FLOW (if/elif/else)
-print("=== 4. Control Flow ===")
-temperature = 18
-if temperature > 30:
-    print("It's hot outside. Stay hydrated!")
-elif 20 <= temperature <= 30:
-    print("It's a perfect day!")
-else:
-    print("It's a bit chilly. Bring a jacket.")
-print()
+Importing this module only defines ``calculate_area``, ``divide``,
+``safe_divide`` and ``Book``; the demo sections run when ``main()`` is
+called, e.g. with ``python -m functionsV2`` from this directory.
+"""
+import sys
 
-# 5. LOOPS (for and while)
-print("=== 5. Loops ===")
-print("For loop over list:")
-for index, fruit in enumerate(fruits_list): # enumerate gives index and value
-    print(f"  {index}: {fruit}")
-
-print("\nWhile loop:")
-countdown = 3
-while countdown > 0:
-    print(f"  Countdown: {countdown}")
-    countdown -= 1
-print("  Blast off!")
-print()
 
 # 6. FUNCTIONS
-print("=== 6. Functions ===")
 def calculate_area(length, width=1):
     """Calculates the area of a rectangle or square."""
     area = length * width
     return area
 
-# Using the function
-square_area = calculate_area(5)
-rectangle_area = calculate_area(4, 6)
-print(f"Area of square (side 5): {square_area}")
-print(f"Area of rectangle (4x6): {rectangle_area}")
-print()
-
-# 7. LIST COMPREHENSIONS
-print("=== 7. List Comprehensions ===")
-numbers = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
-# Create a list of squares for even numbers only
-even_squares = [x**2 for x in numbers if x % 2 == 0]
-print("Original numbers:", numbers)
-print("Squares of evens:", even_squares)
-print()
-
-# 8. FILE HANDLING
-print("=== 8. File Handling ===")
-filename = "sample_data.txt"
-# Write to a file
-try:
-    with open(filename, 'w') as file:
-        file.write("Hello, File World!\n")
-        file.write("This is line 2.\n")
-        file.write("And this is line 3.\n")
-    print(f"Successfully wrote to {filename}")
-
-    # Read from the same file
-    with open(filename, 'r') as file:
-        content = file.read()
-    print(f"Contents of {filename}:")
-    print(content)
-
-except IOError as e:
-    print(f"An error occurred with the file: {e}")
-print()
 
 # 9. ERROR HANDLING
-print("=== 9. Error Handling ===")
-def safe_divide(a, b):
-    try:
-        result = a / b
-        print(f"{a} / {b} = {result}")
-    except ZeroDivisionError:
-        print("Error: You can't divide by zero!")
-    except TypeError:
-        print("Error: Please provide numbers!")
-    else:
-        print("Division performed successfully!")
-    finally:
-        print("This 'finally' block always runs.\n")
-
-# Test the function
-safe_divide(10, 2)
-safe_divide(10, 0)
-safe_divide(10, 'a') # This will cause a TypeError
-print()
-
-# 10. CLASSES AND OBJECTS (OOP)
-print("=== 10. Classes and Objects ===")
-class Book:
-    # Class Attribute (shared by all instances)
-    library_name = "Python Public Library"
-
-    # Constructor
-    def __init__(self, title, author, pages):
-        # Instance Attributes (unique to each object)
-        self.title = title
-        self.author = author
-        self.pages = pages
-        self.is_checked_out = False
+def divide(a, b):
+    """Divide without printing or raising.
 
-    # Instance Method
-    def check_out(self):
-        if not self.is_checked_out:
-            self.is_checked_out = True
-            return f"'{self.title}' has been checked out."
-        else:
-            return f"Sorry, '{self.title}' is already checked out."
-
-    # Another Method
-    def book_info(self):
-        status = "Checked Out" if self.is_checked_out else "Available"
-        return f"'{self.title}' by {self.author}. {self.pages} pages. Status: {status}"
-
-# Create objects (instances of the Book class)
-book1 = Book("The Pythonic Way", "A. Developer", 350)
-book2 = Book("Data Science Essentials", "B. Analyst", 275)
-
-# Use the objects and their methods
-print(book1.book_info())
-print(book2.check_out())
-print(book2.check_out()) # Try to check it out again
-print(f"Both books are at the {Book.library_name}")
-print()
-
-# 11. USING EXTERNAL MODULES
-print("=== 11. Using External Modules ===")
-# We'll simulate common imports. (Uncomment the real imports to use them)
-# import math
-# from datetime import datetime
-
-# Simulating the output without actually importing
-print("Simulating module usage:")
-print("math.sqrt(16) would return: 4.0")
-#print(math.sqrqt(16)) # Uncomment this if you have the math module
-print("Current datetime would be:", "2023-10-27 14:30:00") 
-#print(datetime.now()) # Uncomment this if you want the real time
-
-print("\n" + "="*50)
-print("Program finished successfully!")
-
-
-# ==============================
-# A COMPREHENSIVE PYTHON EXAMPLE
-# ==============================
-
-# 1. VARIABLES AND BASIC DATA TYPES
-print("=== 1. Variables and Basic Types ===")
-name = "Alice"          # String
-age = 30                # Integer
-height = 1.75           # Float
-is_programmer = True    # Boolean
-favorite_language = None # NoneType
-
-print(f"Name: {name}, Type: {type(name)}")
-print(f"Age: {age}, Type: {type(age)}")
-print(f"Height: {height}, Type: {type(height)}")
-print(f"Is Programmer: {is_programmer}, Type: {type(is_programmer)}")
-print(f"Favorite Language: {favorite_language}, Type: {type(favorite_language)}")
-print()
-
-# 2. LISTS AND TUPLES
-print("=== 2. Lists and Tuples ===")
-# List - Mutable
-fruits_list = ["apple", "banana", "cherry"]
-fruits_list.append("orange")
-fruits_list[0] = "avocado"
-print("List (mutable):", fruits_list)
-
-# Tuple - Immutable
-fruits_tuple = ("apple", "banana", "cherry")
-# fruits_tuple[0] = "avocado" # This would cause an error!
-print("Tuple (immutable):", fruits_tuple)
-print()
-
-# 3. DICTIONARIES
-print("=== 3. Dictionaries ===")
-person = {
-    "name": "Bob",
-    "age": 25,
-    "city": "New York",
-    "hobbies": ["reading", "hiking", "coding"]
-}
-print("Original dict:", person)
-person["job"] = "Developer" # Add a new key-value pair
-print("Age from dict:", person["age"])
-print("Updated dict:", person)
-print()
-
-# 4. CONTROL FLOW (if/elif/else)
-print("=== 4. Control Flow ===")
-temperature = 18
-if temperature > 30:
-    print("It's hot outside. Stay hydrated!")
-elif 20 <= temperature <= 30:
-    print("It's a perfect day!")
-else:
-    print("It's a bit chilly. Bring a jacket.")
-print()
-
-# 5. LOOPS (for and while)
-print("=== 5. Loops ===")
-print("For loop over list:")
-for index, fruit in enumerate(fruits_list): # enumerate gives index and value
-    print(f"  {index}: {fruit}")
-
-print("\nWhile loop:")
-countdown = 3
-while countdown > 0:
-    print(f"  Countdown: {countdown}")
-    countdown -= 1
-print("  Blast off!")
-print()
-
-# 6. FUNCTIONS
-print("=== 6. Functions ===")
-def calculate_area(length, width=1):
-    """Calculates the area of a rectangle or square."""
-    area = length * width
-    return area
-
-# Using the function
-square_area = calculate_area(5)
-rectangle_area = calculate_area(4, 6)
-print(f"Area of square (side 5): {square_area}")
-print(f"Area of rectangle (4x6): {rectangle_area}")
-print()
+    Returns ``(result, None)`` on success, or ``(None, error)`` where
+    ``error`` is the ``ZeroDivisionError`` or ``TypeError`` that was caught.
+    """
+    try:
+        return a / b, None
+    except (ZeroDivisionError, TypeError) as error:
+        return None, error
 
-# 7. LIST COMPREHENSIONS
-print("=== 7. List Comprehensions ===")
-numbers = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
-# Create a list of squares for even numbers only
-even_squares = [x**2 for x in numbers if x % 2 == 0]
-print("Original numbers:", numbers)
-print("Squares of evens:", even_squares)
-print()
 
-# 8. FILE HANDLING
-print("=== 8. File Handling ===")
-filename = "sample_data.txt"
-# Write to a file
-try:
-    with open(filename, 'w') as file:
-        file.write("Hello, File World!\n")
-        file.write("This is line 2.\n")
-        file.write("And this is line 3.\n")
-    print(f"Successfully wrote to {filename}")
-
-    # Read from the same file
-    with open(filename, 'r') as file:
-        content = file.read()
-    print(f"Contents of {filename}:")
-    print(content)
-
-except IOError as e:
-    print(f"An error occurred with the file: {e}")
-print()
+def safe_divide(a, b, out=print):
+    """Printing demo wrapper around ``divide``; returns the result or None.
 
-# 9. ERROR HANDLING
-print("=== 9. Error Handling ===")
-def safe_divide(a, b):
+    ``out`` is called like ``print`` for every line of output.
+    """
+    result, error = divide(a, b)
     try:
-        result = a / b
-        print(f"{a} / {b} = {result}")
-    except ZeroDivisionError:
-        print("Error: You can't divide by zero!")
-    except TypeError:
-        print("Error: Please provide numbers!")
-    else:
-        print("Division performed successfully!")
+        if isinstance(error, ZeroDivisionError):
+            out("Error: You can't divide by zero!")
+        elif isinstance(error, TypeError):
+            out("Error: Please provide numbers!")
+        else:
+            out(f"{a} / {b} = {result}")
+            out("Division performed successfully!")
     finally:
-        print("This 'finally' block always runs.\n")
+        out("This 'finally' block always runs.\n")
+    return result
 
-# Test the function
-safe_divide(10, 2)
-safe_divide(10, 0)
-safe_divide(10, 'a') # This will cause a TypeError
-print()
 
 # 10. CLASSES AND OBJECTS (OOP)
-print("=== 10. Classes and Objects ===")
-class Book:
-    # Class Attribute (shared by all instances)
-    library_name = "Python Public Library"
-
-    # Constructor
-    def __init__(self, title, author, pages):
-        # Instance Attributes (unique to each object)
-        self.title = title
-        self.author = author
-        self.pages = pages
-        self.is_checked_out = False
-
-    # Instance Method
-    def check_out(self):
-        if not self.is_checked_out:
-            self.is_checked_out = True
-            return f"'{self.title}' has been checked out."
-        else:
-            return f"Sorry, '{self.title}' is already checked out."
-
-    # Another Method
-    def book_info(self):
-        status = "Checked Out" if self.is_checked_out else "Available"
-        return f"'{self.title}' by {self.author}. {self.pages} pages. Status: {status}"
-
-# Create objects (instances of the Book class)
-book1 = Book("The Pythonic Way", "A. Developer", 350)
-book2 = Book("Data Science Essentials", "B. Analyst", 275)
-
-# Use the objects and their methods
-print(book1.book_info())
-print(book2.check_out())
-print(book2.check_out()) # Try to check it out again
-print(f"Both books are at the {Book.library_name}")
-print()
-
-# 11. USING EXTERNAL MODULES
-print("=== 11. Using External Modules ===")
-# We'll simulate common imports. (Uncomment the real imports to use them)
-# import math
-# from datetime import datetime
+class _LibraryName:
+    """``Book.library_name``: the class-wide default, unless the book's own
+    branch has been set (``branches.Library`` does that when it adds one)."""
 
-# Simulating the output without actually importing
-print("Simulating module usage:")
-print("math.sqrt(16) would return: 4.0")
-#print(math.sqrqt(16)) # Uncomment this if you have the math module
-print("Current datetime would be:", "2023-10-27 14:30:00") 
-#print(datetime.now()) # Uncomment this if you want the real time
+    def __init__(self, default):
+        self.default = default
 
-print("\n" + "="*50)
-print("Program finished successfully!")
+    def __get__(self, book, owner=None):
+        if book is None or book._library_name is None:
+            return self.default
+        return book._library_name
 
+    def __set__(self, book, name):
+        book._library_name = name
 
-# ==============================
-# A COMPREHENSIVE PYTHON EXAMPLE
-# ==============================
-
-# 1. VARIABLES AND BASIC DATA TYPES
-print("=== 1. Variables and Basic Types ===")
-name = "Alice"          # String
-age = 30                # Integer
-height = 1.75           # Float
-is_programmer = True    # Boolean
-favorite_language = None # NoneType
-
-print(f"Name: {name}, Type: {type(name)}")
-print(f"Age: {age}, Type: {type(age)}")
-print(f"Height: {height}, Type: {type(height)}")
-print(f"Is Programmer: {is_programmer}, Type: {type(is_programmer)}")
-print(f"Favorite Language: {favorite_language}, Type: {type(favorite_language)}")
-print()
-
-# 2. LISTS AND TUPLES
-print("=== 2. Lists and Tuples ===")
-# List - Mutable
-fruits_list = ["apple", "banana", "cherry"]
-fruits_list.append("orange")
-fruits_list[0] = "avocado"
-print("List (mutable):", fruits_list)
-
-# Tuple - Immutable
-fruits_tuple = ("apple", "banana", "cherry")
-# fruits_tuple[0] = "avocado" # This would cause an error!
-print("Tuple (immutable):", fruits_tuple)
-print()
-
-# 3. DICTIONARIES
-print("=== 3. Dictionaries ===")
-person = {
-    "name": "Bob",
-    "age": 25,
-    "city": "New York",
-    "hobbies": ["reading", "hiking", "coding"]
-}
-print("Original dict:", person)
-person["job"] = "Developer" # Add a new key-value pair
-print("Age from dict:", person["age"])
-print("Updated dict:", person)
-print()
 
-# 4. CONTROL FLOW (if/elif/else)
-print("=== 4. Control Flow ===")
-temperature = 18
-if temperature > 30:
-    print("It's hot outside. Stay hydrated!")
-elif 20 <= temperature <= 30:
-    print("It's a perfect day!")
-else:
-    print("It's a bit chilly. Bring a jacket.")
-print()
-
-# 5. LOOPS (for and while)
-print("=== 5. Loops ===")
-print("For loop over list:")
-for index, fruit in enumerate(fruits_list): # enumerate gives index and value
-    print(f"  {index}: {fruit}")
-
-print("\nWhile loop:")
-countdown = 3
-while countdown > 0:
-    print(f"  Countdown: {countdown}")
-    countdown -= 1
-print("  Blast off!")
-print()
-
-# 6. FUNCTIONS
-print("=== 6. Functions ===")
-def calculate_area(length, width=1):
-    """Calculates the area of a rectangle or square."""
-    area = length * width
-    return area
-
-# Using the function
-square_area = calculate_area(5)
-rectangle_area = calculate_area(4, 6)
-print(f"Area of square (side 5): {square_area}")
-print(f"Area of rectangle (4x6): {rectangle_area}")
-print()
-
-# 7. LIST COMPREHENSIONS
-print("=== 7. List Comprehensions ===")
-numbers = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
-# Create a list of squares for even numbers only
-even_squares = [x**2 for x in numbers if x % 2 == 0]
-print("Original numbers:", numbers)
-print("Squares of evens:", even_squares)
-print()
-
-# 8. FILE HANDLING
-print("=== 8. File Handling ===")
-filename = "sample_data.txt"
-# Write to a file
-try:
-    with open(filename, 'w') as file:
-        file.write("Hello, File World!\n")
-        file.write("This is line 2.\n")
-        file.write("And this is line 3.\n")
-    print(f"Successfully wrote to {filename}")
-
-    # Read from the same file
-    with open(filename, 'r') as file:
-        content = file.read()
-    print(f"Contents of {filename}:")
-    print(content)
-
-except IOError as e:
-    print(f"An error occurred with the file: {e}")
-print()
-
-# 9. ERROR HANDLING
-print("=== 9. Error Handling ===")
-def safe_divide(a, b):
-    try:
-        result = a / b
-        print(f"{a} / {b} = {result}")
-    except ZeroDivisionError:
-        print("Error: You can't divide by zero!")
-    except TypeError:
-        print("Error: Please provide numbers!")
-    else:
-        print("Division performed successfully!")
-    finally:
-        print("This 'finally' block always runs.\n")
-
-# Test the function
-safe_divide(10, 2)
-safe_divide(10, 0)
-safe_divide(10, 'a') # This will cause a TypeError
-print()
-
-# 10. CLASSES AND OBJECTS (OOP)
-print("=== 10. Classes and Objects ===")
 class Book:
-    # Class Attribute (shared by all instances)
-    library_name = "Python Public Library"
+    # Class Attribute (shared by all instances, unless a branch is set)
+    library_name = _LibraryName("Python Public Library")
+
+    # No per-instance __dict__: large catalogs hold many Book objects.
+    # Every field book_info() shows is a property whose setter bumps
+    # _version.  _info caches book_info() as (the version read before
+    # formatting, text), so a change racing the fill leaves an entry whose
+    # version no longer matches, and the next read formats again.
+    __slots__ = ("_title", "_author", "_pages", "_checked_out", "_version", "_info",
+                 "_library_name")
 
     # Constructor
     def __init__(self, title, author, pages):
         # Instance Attributes (unique to each object)
-        self.title = title
-        self.author = author
-        self.pages = pages
-        self.is_checked_out = False
+        self._title = title
+        self._author = author
+        self._pages = pages
+        self._checked_out = False
+        self._version = 0
+        self._info = None
+        self._library_name = None
+
+    @property
+    def title(self):
+        return self._title
+
+    @title.setter
+    def title(self, value):
+        self._title = value
+        self._version += 1
+
+    @property
+    def author(self):
+        return self._author
+
+    @author.setter
+    def author(self, value):
+        self._author = value
+        self._version += 1
+
+    @property
+    def pages(self):
+        return self._pages
+
+    @pages.setter
+    def pages(self, value):
+        self._pages = value
+        self._version += 1
+
+    @property
+    def is_checked_out(self):
+        return self._checked_out
+
+    @is_checked_out.setter
+    def is_checked_out(self, value):
+        if value != self._checked_out:
+            self._checked_out = value
+            self._version += 1
 
     # Instance Method
     def check_out(self):
-        if not self.is_checked_out:
+        if not self._checked_out:
             self.is_checked_out = True
             return f"'{self.title}' has been checked out."
         else:
@@ -543,991 +136,335 @@ class Book:
 
     # Another Method
     def book_info(self):
+        info = self._info
+        version = self._version
+        if info is None or info[0] != version:
+            info = self._info = (version, self._format_info())
+        return info[1]
+
+    def _format_info(self):
         status = "Checked Out" if self.is_checked_out else "Available"
         return f"'{self.title}' by {self.author}. {self.pages} pages. Status: {status}"
 
-# Create objects (instances of the Book class)
-book1 = Book("The Pythonic Way", "A. Developer", 350)
-book2 = Book("Data Science Essentials", "B. Analyst", 275)
-
-# Use the objects and their methods
-print(book1.book_info())
-print(book2.check_out())
-print(book2.check_out()) # Try to check it out again
-print(f"Both books are at the {Book.library_name}")
-print()
-
-# 11. USING EXTERNAL MODULES
-print("=== 11. Using External Modules ===")
-# We'll simulate common imports. (Uncomment the real imports to use them)
-# import math
-# from datetime import datetime
-
-# Simulating the output without actually importing
-print("Simulating module usage:")
-print("math.sqrt(16) would return: 4.0")
-#print(math.sqrqt(16)) # Uncomment this if you have the math module
-print("Current datetime would be:", "2023-10-27 14:30:00") 
-#print(datetime.now()) # Uncomment this if you want the real time
-
-print("\n" + "="*50)
-print("Program finished successfully!")
-
 
 # ==============================
-# A COMPREHENSIVE PYTHON EXAMPLE
+# DEMO SECTIONS
 # ==============================
+# Every section takes ``out``, called like ``print`` for each line, so the
+# caller decides where the output goes.
 
-# 1. VARIABLES AND BASIC DATA TYPES
-print("=== 1. Variables and Basic Types ===")
-name = "Alice"          # String
-age = 30                # Integer
-height = 1.75           # Float
-is_programmer = True    # Boolean
-favorite_language = None # NoneType
-
-print(f"Name: {name}, Type: {type(name)}")
-print(f"Age: {age}, Type: {type(age)}")
-print(f"Height: {height}, Type: {type(height)}")
-print(f"Is Programmer: {is_programmer}, Type: {type(is_programmer)}")
-print(f"Favorite Language: {favorite_language}, Type: {type(favorite_language)}")
-print()
+class OutputSink:
+    """``print``-compatible collector that writes everything in one call.
 
-# 2. LISTS AND TUPLES
-print("=== 2. Lists and Tuples ===")
-# List - Mutable
-fruits_list = ["apple", "banana", "cherry"]
-fruits_list.append("orange")
-fruits_list[0] = "avocado"
-print("List (mutable):", fruits_list)
-
-# Tuple - Immutable
-fruits_tuple = ("apple", "banana", "cherry")
-# fruits_tuple[0] = "avocado" # This would cause an error!
-print("Tuple (immutable):", fruits_tuple)
-print()
+    Lines accumulate in memory until ``flush()`` writes them to ``stream``
+    (``sys.stdout`` by default) with a single ``write``.  With
+    ``quiet=True`` every line is dropped.
+    """
 
-# 3. DICTIONARIES
-print("=== 3. Dictionaries ===")
-person = {
-    "name": "Bob",
-    "age": 25,
-    "city": "New York",
-    "hobbies": ["reading", "hiking", "coding"]
-}
-print("Original dict:", person)
-person["job"] = "Developer" # Add a new key-value pair
-print("Age from dict:", person["age"])
-print("Updated dict:", person)
-print()
+    def __init__(self, stream=None, quiet=False):
+        self.stream = stream
+        self.quiet = quiet
+        self._parts = []
 
-# 4. CONTROL FLOW (if/elif/else)
-print("=== 4. Control Flow ===")
-temperature = 18
-if temperature > 30:
-    print("It's hot outside. Stay hydrated!")
-elif 20 <= temperature <= 30:
-    print("It's a perfect day!")
-else:
-    print("It's a bit chilly. Bring a jacket.")
-print()
+    def __call__(self, *args, sep=" ", end="\n"):
+        if not self.quiet:
+            self._parts.append(sep.join([str(arg) for arg in args]) + end)
 
-# 5. LOOPS (for and while)
-print("=== 5. Loops ===")
-print("For loop over list:")
-for index, fruit in enumerate(fruits_list): # enumerate gives index and value
-    print(f"  {index}: {fruit}")
-
-print("\nWhile loop:")
-countdown = 3
-while countdown > 0:
-    print(f"  Countdown: {countdown}")
-    countdown -= 1
-print("  Blast off!")
-print()
+    def getvalue(self):
+        """Everything collected since the last flush, as one string."""
+        return "".join(self._parts)
 
-# 6. FUNCTIONS
-print("=== 6. Functions ===")
-def calculate_area(length, width=1):
-    """Calculates the area of a rectangle or square."""
-    area = length * width
-    return area
-
-# Using the function
-square_area = calculate_area(5)
-rectangle_area = calculate_area(4, 6)
-print(f"Area of square (side 5): {square_area}")
-print(f"Area of rectangle (4x6): {rectangle_area}")
-print()
-
-# 7. LIST COMPREHENSIONS
-print("=== 7. List Comprehensions ===")
-numbers = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
-# Create a list of squares for even numbers only
-even_squares = [x**2 for x in numbers if x % 2 == 0]
-print("Original numbers:", numbers)
-print("Squares of evens:", even_squares)
-print()
-
-# 8. FILE HANDLING
-print("=== 8. File Handling ===")
-filename = "sample_data.txt"
-# Write to a file
-try:
-    with open(filename, 'w') as file:
-        file.write("Hello, File World!\n")
-        file.write("This is line 2.\n")
-        file.write("And this is line 3.\n")
-    print(f"Successfully wrote to {filename}")
-
-    # Read from the same file
-    with open(filename, 'r') as file:
-        content = file.read()
-    print(f"Contents of {filename}:")
-    print(content)
-
-except IOError as e:
-    print(f"An error occurred with the file: {e}")
-print()
-
-# 9. ERROR HANDLING
-print("=== 9. Error Handling ===")
-def safe_divide(a, b):
-    try:
-        result = a / b
-        print(f"{a} / {b} = {result}")
-    except ZeroDivisionError:
-        print("Error: You can't divide by zero!")
-    except TypeError:
-        print("Error: Please provide numbers!")
-    else:
-        print("Division performed successfully!")
-    finally:
-        print("This 'finally' block always runs.\n")
-
-# Test the function
-safe_divide(10, 2)
-safe_divide(10, 0)
-safe_divide(10, 'a') # This will cause a TypeError
-print()
-
-# 10. CLASSES AND OBJECTS (OOP)
-print("=== 10. Classes and Objects ===")
-class Book:
-    # Class Attribute (shared by all instances)
-    library_name = "Python Public Library"
-
-    # Constructor
-    def __init__(self, title, author, pages):
-        # Instance Attributes (unique to each object)
-        self.title = title
-        self.author = author
-        self.pages = pages
-        self.is_checked_out = False
-
-    # Instance Method
-    def check_out(self):
-        if not self.is_checked_out:
-            self.is_checked_out = True
-            return f"'{self.title}' has been checked out."
-        else:
-            return f"Sorry, '{self.title}' is already checked out."
-
-    # Another Method
-    def book_info(self):
-        status = "Checked Out" if self.is_checked_out else "Available"
-        return f"'{self.title}' by {self.author}. {self.pages} pages. Status: {status}"
+    def flush(self):
+        if self._parts:
+            stream = self.stream or sys.stdout
+            stream.write(self.getvalue())
+            stream.flush()
+            self._parts.clear()
 
-# Create objects (instances of the Book class)
-book1 = Book("The Pythonic Way", "A. Developer", 350)
-book2 = Book("Data Science Essentials", "B. Analyst", 275)
 
-# Use the objects and their methods
-print(book1.book_info())
-print(book2.check_out())
-print(book2.check_out()) # Try to check it out again
-print(f"Both books are at the {Book.library_name}")
-print()
+# Registry of demo sections, in the order they run
+SECTIONS = []
 
-# 11. USING EXTERNAL MODULES
-print("=== 11. Using External Modules ===")
-# We'll simulate common imports. (Uncomment the real imports to use them)
-# import math
-# from datetime import datetime
 
-# Simulating the output without actually importing
-print("Simulating module usage:")
-print("math.sqrt(16) would return: 4.0")
-#print(math.sqrqt(16)) # Uncomment this if you have the math module
-print("Current datetime would be:", "2023-10-27 14:30:00") 
-#print(datetime.now()) # Uncomment this if you want the real time
+def demo_section(func):
+    """Register ``func`` as the next demo section."""
+    SECTIONS.append(func)
+    return func
 
-print("\n" + "="*50)
-print("Program finished successfully!")
 
+def _fruits_list():
+    # List - Mutable
+    fruits_list = ["apple", "banana", "cherry"]
+    fruits_list.append("orange")
+    fruits_list[0] = "avocado"
+    return fruits_list
 
-# ==============================
-# A COMPREHENSIVE PYTHON EXAMPLE
-# ==============================
 
 # 1. VARIABLES AND BASIC DATA TYPES
-print("=== 1. Variables and Basic Types ===")
-name = "Alice"          # String
-age = 30                # Integer
-height = 1.75           # Float
-is_programmer = True    # Boolean
-favorite_language = None # NoneType
-
-print(f"Name: {name}, Type: {type(name)}")
-print(f"Age: {age}, Type: {type(age)}")
-print(f"Height: {height}, Type: {type(height)}")
-print(f"Is Programmer: {is_programmer}, Type: {type(is_programmer)}")
-print(f"Favorite Language: {favorite_language}, Type: {type(favorite_language)}")
-print()
+@demo_section
+def section_variables(out=print):
+    out("=== 1. Variables and Basic Types ===")
+    name = "Alice"          # String
+    age = 30                # Integer
+    height = 1.75           # Float
+    is_programmer = True    # Boolean
+    favorite_language = None # NoneType
+
+    out(f"Name: {name}, Type: {type(name)}")
+    out(f"Age: {age}, Type: {type(age)}")
+    out(f"Height: {height}, Type: {type(height)}")
+    out(f"Is Programmer: {is_programmer}, Type: {type(is_programmer)}")
+    out(f"Favorite Language: {favorite_language}, Type: {type(favorite_language)}")
+    out()
 
-# 2. LISTS AND TUPLES
-print("=== 2. Lists and Tuples ===")
-# List - Mutable
-fruits_list = ["apple", "banana", "cherry"]
-fruits_list.append("orange")
-fruits_list[0] = "avocado"
-print("List (mutable):", fruits_list)
-
-# Tuple - Immutable
-fruits_tuple = ("apple", "banana", "cherry")
-# fruits_tuple[0] = "avocado" # This would cause an error!
-print("Tuple (immutable):", fruits_tuple)
-print()
-
-# 3. DICTIONARIES
-print("=== 3. Dictionaries ===")
-person = {
-    "name": "Bob",
-    "age": 25,
-    "city": "New York",
-    "hobbies": ["reading", "hiking", "coding"]
-}
-print("Original dict:", person)
-person["job"] = "Developer" # Add a new key-value pair
-print("Age from dict:", person["age"])
-print("Updated dict:", person)
-print()
-
-# 4. CONTROL FLOW (if/elif/else)
-print("=== 4. Control Flow ===")
-temperature = 18
-if temperature > 30:
-    print("It's hot outside. Stay hydrated!")
-elif 20 <= temperature <= 30:
-    print("It's a perfect day!")
-else:
-    print("It's a bit chilly. Bring a jacket.")
-print()
 
-# 5. LOOPS (for and while)
-print("=== 5. Loops ===")
-print("For loop over list:")
-for index, fruit in enumerate(fruits_list): # enumerate gives index and value
-    print(f"  {index}: {fruit}")
-
-print("\nWhile loop:")
-countdown = 3
-while countdown > 0:
-    print(f"  Countdown: {countdown}")
-    countdown -= 1
-print("  Blast off!")
-print()
+# 2. LISTS AND TUPLES
+@demo_section
+def section_lists_and_tuples(out=print):
+    out("=== 2. Lists and Tuples ===")
+    fruits_list = _fruits_list()
+    out("List (mutable):", fruits_list)
 
-# 6. FUNCTIONS
-print("=== 6. Functions ===")
-def calculate_area(length, width=1):
-    """Calculates the area of a rectangle or square."""
-    area = length * width
-    return area
+    # Tuple - Immutable
+    fruits_tuple = ("apple", "banana", "cherry")
+    # fruits_tuple[0] = "avocado" # This would cause an error!
+    out("Tuple (immutable):", fruits_tuple)
+    out()
 
-# Using the function
-square_area = calculate_area(5)
-rectangle_area = calculate_area(4, 6)
-print(f"Area of square (side 5): {square_area}")
-print(f"Area of rectangle (4x6): {rectangle_area}")
-print()
 
-# 7. LIST COMPREHENSIONS
-print("=== 7. List Comprehensions ===")
-numbers = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
-# Create a list of squares for even numbers only
-even_squares = [x**2 for x in numbers if x % 2 == 0]
-print("Original numbers:", numbers)
-print("Squares of evens:", even_squares)
-print()
+# 3. DICTIONARIES
+@demo_section
+def section_dictionaries(out=print):
+    out("=== 3. Dictionaries ===")
+    person = {
+        "name": "Bob",
+        "age": 25,
+        "city": "New York",
+        "hobbies": ["reading", "hiking", "coding"]
+    }
+    out("Original dict:", person)
+    person["job"] = "Developer" # Add a new key-value pair
+    out("Age from dict:", person["age"])
+    out("Updated dict:", person)
+    out()
 
-# 8. FILE HANDLING
-print("=== 8. File Handling ===")
-filename = "sample_data.txt"
-# Write to a file
-try:
-    with open(filename, 'w') as file:
-        file.write("Hello, File World!\n")
-        file.write("This is line 2.\n")
-        file.write("And this is line 3.\n")
-    print(f"Successfully wrote to {filename}")
-
-    # Read from the same file
-    with open(filename, 'r') as file:
-        content = file.read()
-    print(f"Contents of {filename}:")
-    print(content)
-
-except IOError as e:
-    print(f"An error occurred with the file: {e}")
-print()
 
-# 9. ERROR HANDLING
-print("=== 9. Error Handling ===")
-def safe_divide(a, b):
-    try:
-        result = a / b
-        print(f"{a} / {b} = {result}")
-    except ZeroDivisionError:
-        print("Error: You can't divide by zero!")
-    except TypeError:
-        print("Error: Please provide numbers!")
+# 4. CONTROL FLOW (if/elif/else)
+@demo_section
+def section_control_flow(out=print):
+    out("=== 4. Control Flow ===")
+    temperature = 18
+    if temperature > 30:
+        out("It's hot outside. Stay hydrated!")
+    elif 20 <= temperature <= 30:
+        out("It's a perfect day!")
     else:
-        print("Division performed successfully!")
-    finally:
-        print("This 'finally' block always runs.\n")
-
-# Test the function
-safe_divide(10, 2)
-safe_divide(10, 0)
-safe_divide(10, 'a') # This will cause a TypeError
-print()
+        out("It's a bit chilly. Bring a jacket.")
+    out()
 
-# 10. CLASSES AND OBJECTS (OOP)
-print("=== 10. Classes and Objects ===")
-class Book:
-    # Class Attribute (shared by all instances)
-    library_name = "Python Public Library"
-
-    # Constructor
-    def __init__(self, title, author, pages):
-        # Instance Attributes (unique to each object)
-        self.title = title
-        self.author = author
-        self.pages = pages
-        self.is_checked_out = False
-
-    # Instance Method
-    def check_out(self):
-        if not self.is_checked_out:
-            self.is_checked_out = True
-            return f"'{self.title}' has been checked out."
-        else:
-            return f"Sorry, '{self.title}' is already checked out."
-
-    # Another Method
-    def book_info(self):
-        status = "Checked Out" if self.is_checked_out else "Available"
-        return f"'{self.title}' by {self.author}. {self.pages} pages. Status: {status}"
-
-# Create objects (instances of the Book class)
-book1 = Book("The Pythonic Way", "A. Developer", 350)
-book2 = Book("Data Science Essentials", "B. Analyst", 275)
-
-# Use the objects and their methods
-print(book1.book_info())
-print(book2.check_out())
-print(book2.check_out()) # Try to check it out again
-print(f"Both books are at the {Book.library_name}")
-print()
-
-# 11. USING EXTERNAL MODULES
-print("=== 11. Using External Modules ===")
-# We'll simulate common imports. (Uncomment the real imports to use them)
-# import math
-# from datetime import datetime
-
-# Simulating the output without actually importing
-print("Simulating module usage:")
-print("math.sqrt(16) would return: 4.0")
-#print(math.sqrqt(16)) # Uncomment this if you have the math module
-print("Current datetime would be:", "2023-10-27 14:30:00") 
-#print(datetime.now()) # Uncomment this if you want the real time
-
-print("\n" + "="*50)
-print("Program finished successfully!")
-
-
-# ==============================
-# A COMPREHENSIVE PYTHON EXAMPLE
-# ==============================
-
-# 1. VARIABLES AND BASIC DATA TYPES
-print("=== 1. Variables and Basic Types ===")
-name = "Alice"          # String
-age = 30                # Integer
-height = 1.75           # Float
-is_programmer = True    # Boolean
-favorite_language = None # NoneType
-
-print(f"Name: {name}, Type: {type(name)}")
-print(f"Age: {age}, Type: {type(age)}")
-print(f"Height: {height}, Type: {type(height)}")
-print(f"Is Programmer: {is_programmer}, Type: {type(is_programmer)}")
-print(f"Favorite Language: {favorite_language}, Type: {type(favorite_language)}")
-print()
-
-# 2. LISTS AND TUPLES
-print("=== 2. Lists and Tuples ===")
-# List - Mutable
-fruits_list = ["apple", "banana", "cherry"]
-fruits_list.append("orange")
-fruits_list[0] = "avocado"
-print("List (mutable):", fruits_list)
-
-# Tuple - Immutable
-fruits_tuple = ("apple", "banana", "cherry")
-# fruits_tuple[0] = "avocado" # This would cause an error!
-print("Tuple (immutable):", fruits_tuple)
-print()
-
-# 3. DICTIONARIES
-print("=== 3. Dictionaries ===")
-person = {
-    "name": "Bob",
-    "age": 25,
-    "city": "New York",
-    "hobbies": ["reading", "hiking", "coding"]
-}
-print("Original dict:", person)
-person["job"] = "Developer" # Add a new key-value pair
-print("Age from dict:", person["age"])
-print("Updated dict:", person)
-print()
-
-# 4. CONTROL FLOW (if/elif/else)
-print("=== 4. Control Flow ===")
-temperature = 18
-if temperature > 30:
-    print("It's hot outside. Stay hydrated!")
-elif 20 <= temperature <= 30:
-    print("It's a perfect day!")
-else:
-    print("It's a bit chilly. Bring a jacket.")
-print()
 
 # 5. LOOPS (for and while)
-print("=== 5. Loops ===")
-print("For loop over list:")
-for index, fruit in enumerate(fruits_list): # enumerate gives index and value
-    print(f"  {index}: {fruit}")
-
-print("\nWhile loop:")
-countdown = 3
-while countdown > 0:
-    print(f"  Countdown: {countdown}")
-    countdown -= 1
-print("  Blast off!")
-print()
+@demo_section
+def section_loops(out=print):
+    out("=== 5. Loops ===")
+    out("For loop over list:")
+    for index, fruit in enumerate(_fruits_list()): # enumerate gives index and value
+        out(f"  {index}: {fruit}")
+
+    out("\nWhile loop:")
+    countdown = 3
+    while countdown > 0:
+        out(f"  Countdown: {countdown}")
+        countdown -= 1
+    out("  Blast off!")
+    out()
+
 
 # 6. FUNCTIONS
-print("=== 6. Functions ===")
-def calculate_area(length, width=1):
-    """Calculates the area of a rectangle or square."""
-    area = length * width
-    return area
+@demo_section
+def section_functions(out=print):
+    out("=== 6. Functions ===")
+    # Using the function
+    square_area = calculate_area(5)
+    rectangle_area = calculate_area(4, 6)
+    out(f"Area of square (side 5): {square_area}")
+    out(f"Area of rectangle (4x6): {rectangle_area}")
+    out()
 
-# Using the function
-square_area = calculate_area(5)
-rectangle_area = calculate_area(4, 6)
-print(f"Area of square (side 5): {square_area}")
-print(f"Area of rectangle (4x6): {rectangle_area}")
-print()
 
 # 7. LIST COMPREHENSIONS
-print("=== 7. List Comprehensions ===")
-numbers = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
-# Create a list of squares for even numbers only
-even_squares = [x**2 for x in numbers if x % 2 == 0]
-print("Original numbers:", numbers)
-print("Squares of evens:", even_squares)
-print()
+@demo_section
+def section_list_comprehensions(out=print):
+    out("=== 7. List Comprehensions ===")
+    numbers = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    # Create a list of squares for even numbers only
+    even_squares = [x**2 for x in numbers if x % 2 == 0]
+    out("Original numbers:", numbers)
+    out("Squares of evens:", even_squares)
+    out()
+
 
 # 8. FILE HANDLING
-print("=== 8. File Handling ===")
-filename = "sample_data.txt"
-# Write to a file
-try:
-    with open(filename, 'w') as file:
-        file.write("Hello, File World!\n")
-        file.write("This is line 2.\n")
-        file.write("And this is line 3.\n")
-    print(f"Successfully wrote to {filename}")
-
-    # Read from the same file
-    with open(filename, 'r') as file:
-        content = file.read()
-    print(f"Contents of {filename}:")
-    print(content)
-
-except IOError as e:
-    print(f"An error occurred with the file: {e}")
-print()
+@demo_section
+def section_file_handling(out=print, filename="sample_data.txt"):
+    out("=== 8. File Handling ===")
+    from file_handling import iter_lines, write_lines
 
-# 9. ERROR HANDLING
-print("=== 9. Error Handling ===")
-def safe_divide(a, b):
+    # Write to a file (atomically: a crash never leaves half a file behind)
     try:
-        result = a / b
-        print(f"{a} / {b} = {result}")
-    except ZeroDivisionError:
-        print("Error: You can't divide by zero!")
-    except TypeError:
-        print("Error: Please provide numbers!")
-    else:
-        print("Division performed successfully!")
-    finally:
-        print("This 'finally' block always runs.\n")
-
-# Test the function
-safe_divide(10, 2)
-safe_divide(10, 0)
-safe_divide(10, 'a') # This will cause a TypeError
-print()
-
-# 10. CLASSES AND OBJECTS (OOP)
-print("=== 10. Classes and Objects ===")
-class Book:
-    # Class Attribute (shared by all instances)
-    library_name = "Python Public Library"
-
-    # Constructor
-    def __init__(self, title, author, pages):
-        # Instance Attributes (unique to each object)
-        self.title = title
-        self.author = author
-        self.pages = pages
-        self.is_checked_out = False
-
-    # Instance Method
-    def check_out(self):
-        if not self.is_checked_out:
-            self.is_checked_out = True
-            return f"'{self.title}' has been checked out."
-        else:
-            return f"Sorry, '{self.title}' is already checked out."
-
-    # Another Method
-    def book_info(self):
-        status = "Checked Out" if self.is_checked_out else "Available"
-        return f"'{self.title}' by {self.author}. {self.pages} pages. Status: {status}"
+        write_lines(filename, [
+            "Hello, File World!\n",
+            "This is line 2.\n",
+            "And this is line 3.\n",
+        ])
+        out(f"Successfully wrote to {filename}")
 
-# Create objects (instances of the Book class)
-book1 = Book("The Pythonic Way", "A. Developer", 350)
-book2 = Book("Data Science Essentials", "B. Analyst", 275)
-
-# Use the objects and their methods
-print(book1.book_info())
-print(book2.check_out())
-print(book2.check_out()) # Try to check it out again
-print(f"Both books are at the {Book.library_name}")
-print()
-
-# 11. USING EXTERNAL MODULES
-print("=== 11. Using External Modules ===")
-# We'll simulate common imports. (Uncomment the real imports to use them)
-# import math
-# from datetime import datetime
+        # Read from the same file, streaming line by line
+        content = "".join(iter_lines(filename))
+        out(f"Contents of {filename}:")
+        out(content)
 
-# Simulating the output without actually importing
-print("Simulating module usage:")
-print("math.sqrt(16) would return: 4.0")
-#print(math.sqrqt(16)) # Uncomment this if you have the math module
-print("Current datetime would be:", "2023-10-27 14:30:00") 
-#print(datetime.now()) # Uncomment this if you want the real time
+    except IOError as e:
+        out(f"An error occurred with the file: {e}")
+    out()
 
-print("\n" + "="*50)
-print("Program finished successfully!")
-
-
-# ==============================
-# A COMPREHENSIVE PYTHON EXAMPLE
-# ==============================
-
-# 1. VARIABLES AND BASIC DATA TYPES
-print("=== 1. Variables and Basic Types ===")
-name = "Alice"          # String
-age = 30                # Integer
-height = 1.75           # Float
-is_programmer = True    # Boolean
-favorite_language = None # NoneType
-
-print(f"Name: {name}, Type: {type(name)}")
-print(f"Age: {age}, Type: {type(age)}")
-print(f"Height: {height}, Type: {type(height)}")
-print(f"Is Programmer: {is_programmer}, Type: {type(is_programmer)}")
-print(f"Favorite Language: {favorite_language}, Type: {type(favorite_language)}")
-print()
-
-# 2. LISTS AND TUPLES
-print("=== 2. Lists and Tuples ===")
-# List - Mutable
-fruits_list = ["apple", "banana", "cherry"]
-fruits_list.append("orange")
-fruits_list[0] = "avocado"
-print("List (mutable):", fruits_list)
-
-# Tuple - Immutable
-fruits_tuple = ("apple", "banana", "cherry")
-# fruits_tuple[0] = "avocado" # This would cause an error!
-print("Tuple (immutable):", fruits_tuple)
-print()
-
-# 3. DICTIONARIES
-print("=== 3. Dictionaries ===")
-person = {
-    "name": "Bob",
-    "age": 25,
-    "city": "New York",
-    "hobbies": ["reading", "hiking", "coding"]
-}
-print("Original dict:", person)
-person["job"] = "Developer" # Add a new key-value pair
-print("Age from dict:", person["age"])
-print("Updated dict:", person)
-print()
-
-# 4. CONTROL FLOW (if/elif/else)
-print("=== 4. Control Flow ===")
-temperature = 18
-if temperature > 30:
-    print("It's hot outside. Stay hydrated!")
-elif 20 <= temperature <= 30:
-    print("It's a perfect day!")
-else:
-    print("It's a bit chilly. Bring a jacket.")
-print()
-
-# 5. LOOPS (for and while)
-print("=== 5. Loops ===")
-print("For loop over list:")
-for index, fruit in enumerate(fruits_list): # enumerate gives index and value
-    print(f"  {index}: {fruit}")
-
-print("\nWhile loop:")
-countdown = 3
-while countdown > 0:
-    print(f"  Countdown: {countdown}")
-    countdown -= 1
-print("  Blast off!")
-print()
-
-# 6. FUNCTIONS
-print("=== 6. Functions ===")
-def calculate_area(length, width=1):
-    """Calculates the area of a rectangle or square."""
-    area = length * width
-    return area
-
-# Using the function
-square_area = calculate_area(5)
-rectangle_area = calculate_area(4, 6)
-print(f"Area of square (side 5): {square_area}")
-print(f"Area of rectangle (4x6): {rectangle_area}")
-print()
-
-# 7. LIST COMPREHENSIONS
-print("=== 7. List Comprehensions ===")
-numbers = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
-# Create a list of squares for even numbers only
-even_squares = [x**2 for x in numbers if x % 2 == 0]
-print("Original numbers:", numbers)
-print("Squares of evens:", even_squares)
-print()
-
-# 8. FILE HANDLING
-print("=== 8. File Handling ===")
-filename = "sample_data.txt"
-# Write to a file
-try:
-    with open(filename, 'w') as file:
-        file.write("Hello, File World!\n")
-        file.write("This is line 2.\n")
-        file.write("And this is line 3.\n")
-    print(f"Successfully wrote to {filename}")
-
-    # Read from the same file
-    with open(filename, 'r') as file:
-        content = file.read()
-    print(f"Contents of {filename}:")
-    print(content)
-
-except IOError as e:
-    print(f"An error occurred with the file: {e}")
-print()
 
 # 9. ERROR HANDLING
-print("=== 9. Error Handling ===")
-def safe_divide(a, b):
-    try:
-        result = a / b
-        print(f"{a} / {b} = {result}")
-    except ZeroDivisionError:
-        print("Error: You can't divide by zero!")
-    except TypeError:
-        print("Error: Please provide numbers!")
-    else:
-        print("Division performed successfully!")
-    finally:
-        print("This 'finally' block always runs.\n")
+@demo_section
+def section_error_handling(out=print):
+    out("=== 9. Error Handling ===")
+    # Test the function
+    safe_divide(10, 2, out)
+    safe_divide(10, 0, out)
+    safe_divide(10, 'a', out) # This will cause a TypeError
+    out()
 
-# Test the function
-safe_divide(10, 2)
-safe_divide(10, 0)
-safe_divide(10, 'a') # This will cause a TypeError
-print()
 
 # 10. CLASSES AND OBJECTS (OOP)
-print("=== 10. Classes and Objects ===")
-class Book:
-    # Class Attribute (shared by all instances)
-    library_name = "Python Public Library"
-
-    # Constructor
-    def __init__(self, title, author, pages):
-        # Instance Attributes (unique to each object)
-        self.title = title
-        self.author = author
-        self.pages = pages
-        self.is_checked_out = False
-
-    # Instance Method
-    def check_out(self):
-        if not self.is_checked_out:
-            self.is_checked_out = True
-            return f"'{self.title}' has been checked out."
-        else:
-            return f"Sorry, '{self.title}' is already checked out."
+@demo_section
+def section_classes(out=print):
+    out("=== 10. Classes and Objects ===")
+    # Create objects (instances of the Book class)
+    book1 = Book("The Pythonic Way", "A. Developer", 350)
+    book2 = Book("Data Science Essentials", "B. Analyst", 275)
 
-    # Another Method
-    def book_info(self):
-        status = "Checked Out" if self.is_checked_out else "Available"
-        return f"'{self.title}' by {self.author}. {self.pages} pages. Status: {status}"
-
-# Create objects (instances of the Book class)
-book1 = Book("The Pythonic Way", "A. Developer", 350)
-book2 = Book("Data Science Essentials", "B. Analyst", 275)
+    # Use the objects and their methods
+    out(book1.book_info())
+    out(book2.check_out())
+    out(book2.check_out()) # Try to check it out again
+    out(f"Both books are at the {Book.library_name}")
+    out()
 
-# Use the objects and their methods
-print(book1.book_info())
-print(book2.check_out())
-print(book2.check_out()) # Try to check it out again
-print(f"Both books are at the {Book.library_name}")
-print()
 
 # 11. USING EXTERNAL MODULES
-print("=== 11. Using External Modules ===")
-# We'll simulate common imports. (Uncomment the real imports to use them)
-# import math
-# from datetime import datetime
-
-# Simulating the output without actually importing
-print("Simulating module usage:")
-print("math.sqrt(16) would return: 4.0")
-#print(math.sqrqt(16)) # Uncomment this if you have the math module
-print("Current datetime would be:", "2023-10-27 14:30:00") 
-#print(datetime.now()) # Uncomment this if you want the real time
-
-print("\n" + "="*50)
-print("Program finished successfully!")
-
-# ==============================
-# A COMPREHENSIVE PYTHON EXAMPLE
-# ==============================
-
-# 1. VARIABLES AND BASIC DATA TYPES
-print("=== 1. Variables and Basic Types ===")
-name = "Alice"          # String
-age = 30                # Integer
-height = 1.75           # Float
-is_programmer = True    # Boolean
-favorite_language = None # NoneType
-
-print(f"Name: {name}, Type: {type(name)}")
-print(f"Age: {age}, Type: {type(age)}")
-print(f"Height: {height}, Type: {type(height)}")
-print(f"Is Programmer: {is_programmer}, Type: {type(is_programmer)}")
-print(f"Favorite Language: {favorite_language}, Type: {type(favorite_language)}")
-print()
-
-# 2. LISTS AND TUPLES
-print("=== 2. Lists and Tuples ===")
-# List - Mutable
-fruits_list = ["apple", "banana", "cherry"]
-fruits_list.append("orange")
-fruits_list[0] = "avocado"
-print("List (mutable):", fruits_list)
-
-# Tuple - Immutable
-fruits_tuple = ("apple", "banana", "cherry")
-# fruits_tuple[0] = "avocado" # This would cause an error!
-print("Tuple (immutable):", fruits_tuple)
-print()
-
-# 3. DICTIONARIES
-print("=== 3. Dictionaries ===")
-person = {
-    "name": "Bob",
-    "age": 25,
-    "city": "New York",
-    "hobbies": ["reading", "hiking", "coding"]
-}
-print("Original dict:", person)
-person["job"] = "Developer" # Add a new key-value pair
-print("Age from dict:", person["age"])
-print("Updated dict:", person)
-print()
-
-# 4. CONTROL FLOW (if/elif/else)
-print("=== 4. Control Flow ===")
-temperature = 18
-if temperature > 30:
-    print("It's hot outside. Stay hydrated!")
-elif 20 <= temperature <= 30:
-    print("It's a perfect day!")
-else:
-    print("It's a bit chilly. Bring a jacket.")
-print()
-
-# 5. LOOPS (for and while)
-print("=== 5. Loops ===")
-print("For loop over list:")
-for index, fruit in enumerate(fruits_list): # enumerate gives index and value
-    print(f"  {index}: {fruit}")
-
-print("\nWhile loop:")
-countdown = 3
-while countdown > 0:
-    print(f"  Countdown: {countdown}")
-    countdown -= 1
-print("  Blast off!")
-print()
-
-# 6. FUNCTIONS
-print("=== 6. Functions ===")
-def calculate_area(length, width=1):
-    """Calculates the area of a rectangle or square."""
-    area = length * width
-    return area
+@demo_section
+def section_external_modules(out=print):
+    out("=== 11. Using External Modules ===")
+    # Imported here rather than at the top of the file, so they are only
+    # loaded when this section actually runs
+    import math
+    from datetime import datetime
+
+    out("math.sqrt(16) returns:", math.sqrt(16))
+    out("Current datetime is:", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+
+
+def _capture(section):
+    sink = OutputSink()
+    section(sink)
+    return section.__name__, sink.getvalue()
+
+
+def run_sections(sections=None, executor=None):
+    """Run ``sections`` (default: all) and return ``[(name, text), ...]``.
+
+    With a ``concurrent.futures`` executor the sections run concurrently
+    (each writes into its own sink, so a process pool works too); the
+    results still come back in section order.
+    """
+    if sections is None:
+        sections = SECTIONS
+    if executor is None:
+        return [_capture(section) for section in sections]
+    return list(executor.map(_capture, sections))
+
+
+def main(argv=None):
+    """Run every demo section in order.
+
+    Output is collected and written once at the end; ``--unbuffered``
+    prints line by line instead, ``--quiet`` discards it and ``--json``
+    writes each section's output as a JSON object.  ``--jobs N`` runs the
+    sections on N threads (or processes with ``--processes``) and prints
+    their output in the usual order.
+
+    ``--instrument PATH`` writes a JSON report of section times, call
+    counts and allocations and ``--profile PATH`` saves ``cProfile`` stats;
+    both can also be turned on through environment variables (see
+    ``instrument``), and neither costs anything when off.
+    """
+    import argparse
+    import os
+
+    parser = argparse.ArgumentParser(prog="functionsV2", description="Run the demo sections.")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--unbuffered", action="store_true", help="print each line as it is produced")
+    mode.add_argument("--quiet", action="store_true", help="discard all output")
+    mode.add_argument("--json", action="store_true", help="print each section's output as JSON")
+    parser.add_argument("--jobs", type=int, default=1, help="run sections concurrently")
+    parser.add_argument("--processes", action="store_true",
+                        help="with --jobs, use a process pool instead of threads")
+    parser.add_argument("--instrument", metavar="PATH",
+                        default=os.environ.get("FUNCTIONSV2_INSTRUMENT"),
+                        help="write a JSON report of section times, call counts and "
+                             "allocations to PATH ('-' for stderr)")
+    parser.add_argument("--profile", metavar="PATH", default=os.environ.get("FUNCTIONSV2_PROFILE"),
+                        help="run under cProfile and save the stats to PATH")
+    args = parser.parse_args(argv)
+    if args.instrument and args.processes:
+        parser.error("--instrument only sees this process; it cannot be used with --processes")
+
+    if args.instrument or args.profile:
+        from instrument import instrumented
+
+        with instrumented(sys.modules[__name__], report=args.instrument, profile=args.profile):
+            _run(args)
+    else:
+        _run(args)
 
-# Using the function
-square_area = calculate_area(5)
-rectangle_area = calculate_area(4, 6)
-print(f"Area of square (side 5): {square_area}")
-print(f"Area of rectangle (4x6): {rectangle_area}")
-print()
 
-# 7. LIST COMPREHENSIONS
-print("=== 7. List Comprehensions ===")
-numbers = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
-# Create a list of squares for even numbers only
-even_squares = [x**2 for x in numbers if x % 2 == 0]
-print("Original numbers:", numbers)
-print("Squares of evens:", even_squares)
-print()
+def _run(args):
+    executor = None
+    if args.jobs > 1:
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
-# 8. FILE HANDLING
-print("=== 8. File Handling ===")
-filename = "sample_data.txt"
-# Write to a file
-try:
-    with open(filename, 'w') as file:
-        file.write("Hello, File World!\n")
-        file.write("This is line 2.\n")
-        file.write("And this is line 3.\n")
-    print(f"Successfully wrote to {filename}")
-
-    # Read from the same file
-    with open(filename, 'r') as file:
-        content = file.read()
-    print(f"Contents of {filename}:")
-    print(content)
-
-except IOError as e:
-    print(f"An error occurred with the file: {e}")
-print()
+        pool = ProcessPoolExecutor if args.processes else ThreadPoolExecutor
+        executor = pool(max_workers=args.jobs)
 
-# 9. ERROR HANDLING
-print("=== 9. Error Handling ===")
-def safe_divide(a, b):
     try:
-        result = a / b
-        print(f"{a} / {b} = {result}")
-    except ZeroDivisionError:
-        print("Error: You can't divide by zero!")
-    except TypeError:
-        print("Error: Please provide numbers!")
-    else:
-        print("Division performed successfully!")
-    finally:
-        print("This 'finally' block always runs.\n")
+        if args.json:
+            import json
 
-# Test the function
-safe_divide(10, 2)
-safe_divide(10, 0)
-safe_divide(10, 'a') # This will cause a TypeError
-print()
-
-# 10. CLASSES AND OBJECTS (OOP)
-print("=== 10. Classes and Objects ===")
-class Book:
-    # Class Attribute (shared by all instances)
-    library_name = "Python Public Library"
+            json.dump(dict(run_sections(executor=executor)), sys.stdout, indent=2)
+            sys.stdout.write("\n")
+            return
 
-    # Constructor
-    def __init__(self, title, author, pages):
-        # Instance Attributes (unique to each object)
-        self.title = title
-        self.author = author
-        self.pages = pages
-        self.is_checked_out = False
-
-    # Instance Method
-    def check_out(self):
-        if not self.is_checked_out:
-            self.is_checked_out = True
-            return f"'{self.title}' has been checked out."
+        out = print if args.unbuffered else OutputSink(quiet=args.quiet)
+        if executor is None:
+            for section in SECTIONS:
+                section(out)
         else:
-            return f"Sorry, '{self.title}' is already checked out."
-
-    # Another Method
-    def book_info(self):
-        status = "Checked Out" if self.is_checked_out else "Available"
-        return f"'{self.title}' by {self.author}. {self.pages} pages. Status: {status}"
+            for _, text in run_sections(executor=executor):
+                out(text, end="")
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
-# Create objects (instances of the Book class)
-book1 = Book("The Pythonic Way", "A. Developer", 350)
-book2 = Book("Data Science Essentials", "B. Analyst", 275)
+    out("\n" + "="*50)
+    out("Program finished successfully!")
+    if out is not print:
+        out.flush()
 
-# Use the objects and their methods
-print(book1.book_info())
-print(book2.check_out())
-print(book2.check_out()) # Try to check it out again
-print(f"Both books are at the {Book.library_name}")
-print()
 
-# 11. USING EXTERNAL MODULES
-print("=== 11. Using External Modules ===")
-# We'll simulate common imports. (Uncomment the real imports to use them)
-# import math
-# from datetime import datetime
-
-# Simulating the output without actually importing
-print("Simulating module usage:")
-print("math.sqrt(16) would return: 4.0")
-#print(math.sqrqt(16)) # Uncomment this if you have the math module
-print("Current datetime would be:", "2023-10-27 14:30:00") 
-#print(datetime.now()) # Uncomment this if you want the real time
-
-print("\n" + "="*50)
-print("Program finished successfully!")
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""Hold queues: a refused checkout waits in line instead of being dropped.
+
+``Book.check_out`` on a book that is already out only says "Sorry".
+``HoldQueues`` lends books from a ``Catalog`` to patrons, and a patron who
+asks for a book that is out is put in that book's hold queue.  Each queue is
+a heap of ``(-priority, sequence, patron)``, so higher priorities go first
+and equal priorities are served in the order the holds were placed.  When
+the book comes back, ``return_book`` pops the next patron and lends it to
+them straight away: O(log n) in the length of that book's queue, whatever
+the size of the catalog.
+
+Cancelled holds stay in the heap and are skipped when they reach the top;
+a book's heap is rebuilt from its live holds once cancelled ones outnumber
+them.
+"""
+import heapq
+from itertools import count
+
+
+class HoldQueues:
+    def __init__(self, catalog):
+        self._catalog = catalog
+        self._queues = {}       # book id -> heap of (-priority, sequence, patron)
+        self._waiting = {}      # (book id, patron) -> sequence of their live hold
+        self._counts = {}       # book id -> number of live holds in its queue
+        self._holders = {}      # book id -> patron it is lent to
+        self._sequence = count()
+
+    def holder(self, book_id):
+        """Patron ``book_id`` is lent to, or None."""
+        return self._holders.get(book_id)
+
+    def queue_length(self, book_id):
+        """Number of live holds on ``book_id``."""
+        return self._counts.get(book_id, 0)
+
+    def queue(self, book_id):
+        """Patrons holding ``book_id``, in the order they will be served."""
+        return [entry[2] for entry in sorted(self._queues.get(book_id, ()))
+                if self._live(book_id, entry)]
+
+    def request(self, book_id, patron, priority=0):
+        """Lend ``book_id`` to ``patron``, or place a hold if it is out.
+
+        Returns True if the book was lent, False if the patron now waits.
+        """
+        book = self._catalog.get(book_id)
+        if not book.is_checked_out:
+            book.is_checked_out = True
+            self._holders[book_id] = patron
+            return True
+        self.place_hold(book_id, patron, priority)
+        return False
+
+    def place_hold(self, book_id, patron, priority=0):
+        """Queue ``patron`` for ``book_id``; returns False if they already hold it.
+
+        A hold on a book that is not out is served at once.
+        """
+        book = self._catalog.get(book_id)
+        key = (book_id, patron)
+        if key in self._waiting:
+            return False
+        sequence = self._waiting[key] = next(self._sequence)
+        heapq.heappush(self._queues.setdefault(book_id, []), (-priority, sequence, patron))
+        self._counts[book_id] = self._counts.get(book_id, 0) + 1
+        if not book.is_checked_out:
+            self._lend_next(book_id, book)
+        return True
+
+    def place_holds(self, holds):
+        """Queue many ``(book id, patron, priority)`` holds; returns how many were new.
+
+        Each book's queue is heapified once rather than pushed to per hold.
+        """
+        waiting, get = self._waiting, self._catalog.get
+        holds = list(holds)
+        for book_id, _, _ in holds:
+            get(book_id)   # KeyError for unknown books, before anything is queued
+        added = {}
+        for book_id, patron, priority in holds:
+            key = (book_id, patron)
+            if key in waiting:
+                continue
+            sequence = waiting[key] = next(self._sequence)
+            added.setdefault(book_id, []).append((-priority, sequence, patron))
+        for book_id, entries in added.items():
+            queue = self._queues.setdefault(book_id, [])
+            self._counts[book_id] = self._counts.get(book_id, 0) + len(entries)
+            if len(entries) > len(queue):
+                queue.extend(entries)
+                heapq.heapify(queue)
+            else:
+                for entry in entries:
+                    heapq.heappush(queue, entry)
+            book = get(book_id)
+            if not book.is_checked_out:
+                self._lend_next(book_id, book)
+        return sum(len(entries) for entries in added.values())
+
+    def cancel_hold(self, book_id, patron):
+        """Drop ``patron``'s hold on ``book_id``; returns False if there was none."""
+        if self._waiting.pop((book_id, patron), None) is None:
+            return False
+        live = self._counts[book_id] = self._counts[book_id] - 1
+        if len(self._queues[book_id]) > 2 * live:
+            self._rebuild(book_id)
+        return True
+
+    def return_book(self, book_id):
+        """Take ``book_id`` back and lend it to the next patron in its queue.
+
+        Returns that patron, or None if nobody was waiting and the book is
+        available again.
+        """
+        if book_id not in self._holders:
+            raise KeyError(f"book {book_id} is not lent out")
+        del self._holders[book_id]
+        book = self._catalog.get(book_id)
+        book.is_checked_out = False
+        return self._lend_next(book_id, book)
+
+    def _lend_next(self, book_id, book):
+        """Lend the available ``book`` to its first live holder, if any."""
+        queue = self._queues.get(book_id)
+        while queue:
+            entry = heapq.heappop(queue)
+            if self._live(book_id, entry):
+                patron = entry[2]
+                del self._waiting[(book_id, patron)]
+                self._counts[book_id] -= 1
+                book.is_checked_out = True
+                self._holders[book_id] = patron
+                return patron
+        self._queues.pop(book_id, None)
+        self._counts.pop(book_id, None)
+        return None
+
+    def _rebuild(self, book_id):
+        """Drop the cancelled holds from ``book_id``'s heap."""
+        queue = [entry for entry in self._queues[book_id] if self._live(book_id, entry)]
+        if queue:
+            heapq.heapify(queue)
+            self._queues[book_id] = queue
+        else:
+            del self._queues[book_id], self._counts[book_id]
+
+    def _live(self, book_id, entry):
+        return self._waiting.get((book_id, entry[2])) == entry[1]
@@ -0,0 +1,151 @@
+"""Opt-in instrumentation for the ``functionsV2`` demo.
+
+Nothing here is imported unless it is asked for, with ``--instrument`` /
+``--profile`` or the ``FUNCTIONSV2_INSTRUMENT`` / ``FUNCTIONSV2_PROFILE``
+environment variables, so an ordinary run pays for two environment
+lookups and nothing else: no wrappers are installed and no tracing is on.
+
+When enabled, ``instrumented()`` temporarily replaces the demo sections and
+the counted functions and ``Book`` methods with wrappers that record
+
+* wall time per section,
+* call counts for ``calculate_area``, ``divide``, ``safe_divide`` and the
+  ``Book`` methods,
+* per section, through ``tracemalloc``: memory blocks and bytes still
+  allocated when it returns, and its peak traced memory,
+
+and writes them as a JSON report.  ``profile`` runs the same code under
+``cProfile`` and saves the stats for ``pstats``.  Allocation figures are
+process-wide, so they are only per-section when sections run one at a time.
+"""
+import cProfile
+import json
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from functools import wraps
+
+COUNTED_FUNCTIONS = ("calculate_area", "divide", "safe_divide")
+COUNTED_METHODS = ("__init__", "check_out", "book_info")
+
+# Allocations made by the instrumentation itself are left out of the report
+_OWN_FILES = {__file__, tracemalloc.__file__}
+
+
+class Instrumentation:
+    def __init__(self, module, trace_allocations=True):
+        self.module = module
+        self.trace_allocations = trace_allocations
+        self.sections = {}
+        self.calls = {}
+        self._lock = threading.Lock()
+        self._undo = []
+        self._started = None
+        self.total_seconds = None
+
+    def install(self):
+        """Wrap the sections, functions and methods of ``module``."""
+        module = self.module
+        for name in COUNTED_FUNCTIONS:
+            self._count_calls(module, name, name)
+        for name in COUNTED_METHODS:
+            self._count_calls(module.Book, name, f"Book.{name}")
+        sections = module.SECTIONS
+        saved = sections[:]
+        sections[:] = [self._timed(section) for section in saved]
+        self._undo.append(lambda: sections.__setitem__(slice(None), saved))
+        if self.trace_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._undo.append(tracemalloc.stop)
+        self._started = time.perf_counter()
+
+    def uninstall(self):
+        """Put back everything ``install`` replaced."""
+        self.total_seconds = time.perf_counter() - self._started
+        while self._undo:
+            self._undo.pop()()
+
+    def report(self):
+        """Everything recorded so far, as a JSON-serializable dict."""
+        return {
+            "total_seconds": self.total_seconds,
+            "sections": self.sections,
+            "calls": dict(sorted(self.calls.items())),
+        }
+
+    def _count_calls(self, owner, name, key):
+        original = owner.__dict__[name]
+        lock = self._lock
+        calls = self.calls
+        calls[key] = 0
+
+        @wraps(original)
+        def counted(*args, **kwargs):
+            with lock:
+                calls[key] += 1
+            return original(*args, **kwargs)
+
+        setattr(owner, name, counted)
+        self._undo.append(lambda: setattr(owner, name, original))
+
+    def _timed(self, section):
+        tracing = self.trace_allocations
+        results = self.sections
+
+        @wraps(section)
+        def timed(*args, **kwargs):
+            if tracing:
+                before = tracemalloc.take_snapshot()
+                base = tracemalloc.get_traced_memory()[0]
+                tracemalloc.reset_peak()
+            start = time.perf_counter()
+            try:
+                return section(*args, **kwargs)
+            finally:
+                stats = {"seconds": time.perf_counter() - start}
+                if tracing:
+                    peak = tracemalloc.get_traced_memory()[1]
+                    diff = [stat for stat in tracemalloc.take_snapshot().compare_to(before, "filename")
+                            if stat.traceback[0].filename not in _OWN_FILES]
+                    stats["new_blocks"] = sum(s.count_diff for s in diff if s.count_diff > 0)
+                    stats["new_bytes"] = sum(s.size_diff for s in diff if s.size_diff > 0)
+                    stats["peak_bytes"] = peak - base
+                results[section.__name__] = stats
+
+        return timed
+
+
+@contextmanager
+def instrumented(module, report=None, profile=None):
+    """Instrument the demo in ``module`` for the duration of the block.
+
+    ``report`` is the path of the JSON report (``"-"`` for stderr);
+    ``profile`` is where to save the ``cProfile`` stats.  Either may be None.
+    """
+    instrumentation = Instrumentation(module) if report else None
+    profiler = cProfile.Profile() if profile else None
+    if instrumentation is not None:
+        instrumentation.install()
+    if profiler is not None:
+        profiler.enable()
+    try:
+        yield instrumentation
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(profile)
+        if instrumentation is not None:
+            instrumentation.uninstall()
+            _write_report(report, instrumentation.report())
+
+
+def _write_report(path, report):
+    if path == "-":
+        json.dump(report, sys.stderr, indent=2)
+        sys.stderr.write("\n")
+        return
+    with open(path, "w") as file:
+        json.dump(report, file, indent=2)
+        file.write("\n")
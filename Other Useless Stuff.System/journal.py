@@ -0,0 +1,180 @@
+"""Crash-safe checkout state: a catalog snapshot plus an append-only journal.
+
+Rewriting the whole catalog on every checkout does not scale, so
+``CheckoutJournal`` keeps two files in a directory:
+
+* ``snapshot.<generation>.bin`` -- the catalog, in the ``catalog_file``
+  format;
+* ``journal.log`` -- a header naming the snapshot generation it applies
+  to, then one fixed-width record per checkout or return since that
+  snapshot.
+
+Opening the directory loads the newest snapshot and replays the journal.
+Each event sets a state rather than toggling it, and only the last event
+per book counts.  A torn record at the end of the journal (a crash
+mid-append) is ignored.
+
+``compact()`` writes and fsyncs snapshot ``generation + 1`` (and its
+directory entry) before it resets the journal to that generation, and only
+then deletes the old snapshot.  A crash before the new snapshot is durable
+reopens the old snapshot with its journal intact.  A crash after it
+reopens the new snapshot, and a journal still tagged with the old
+generation is discarded: its events are already in the snapshot, and under
+the old ids.
+
+Book ids are positions in the snapshot.  Books added to the catalog are
+only persisted by the next ``compact()``, which also renumbers ids if books
+were removed; until then they cannot be checked out through the journal.
+"""
+import os
+import re
+import struct
+
+from catalog import Catalog
+from catalog_file import CatalogFile, save_catalog
+from file_handling import FSYNC_FULL
+
+SNAPSHOT = "snapshot.{}.bin"
+SNAPSHOT_NAME = re.compile(r"snapshot\.(\d+)\.bin")
+JOURNAL = "journal.log"
+JOURNAL_MAGIC = b"CKJRNL1\0"
+# magic, snapshot generation
+JOURNAL_HEADER = struct.Struct("<8sQ")
+EVENT = struct.Struct("<BI")
+CHECK_OUT = 1
+RETURN = 0
+
+
+class CheckoutJournal:
+    def __init__(self, directory, books=(), compact_every=None):
+        """Open the store in ``directory``, creating it from ``books`` if empty.
+
+        With ``compact_every``, the journal is folded into a new snapshot
+        each time it reaches that many events.
+        """
+        self.directory = directory
+        self.compact_every = compact_every
+        self._journal_path = os.path.join(directory, JOURNAL)
+        os.makedirs(directory, exist_ok=True)
+
+        snapshots = _snapshots(directory)
+        if snapshots:
+            self.generation = max(snapshots)
+            with CatalogFile(self._snapshot_path(self.generation)) as snapshot:
+                self.catalog = Catalog(snapshot)
+            self._snapshot_size = len(self.catalog)
+            self.pending_events = self._replay()
+        else:
+            self.generation = 0
+            self.catalog = Catalog(books)
+            self._snapshot_size = len(self.catalog)
+            self.pending_events = None
+            save_catalog(self._snapshot_path(0), self.catalog, fsync=FSYNC_FULL)
+        self._journal = open(self._journal_path, "ab")
+        if self.pending_events is None:
+            self._reset_journal()
+        else:
+            # Cut off a torn record so new events start on a record boundary
+            self._journal.truncate(JOURNAL_HEADER.size + self.pending_events * EVENT.size)
+        for generation in snapshots:
+            if generation < self.generation:
+                os.unlink(self._snapshot_path(generation))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def check_out(self, book_id):
+        """Check out a book and journal it; return True if it was available."""
+        book = self._snapshotted(book_id)
+        if book.is_checked_out:
+            return False
+        book.is_checked_out = True
+        self._append(CHECK_OUT, book_id)
+        return True
+
+    def return_book(self, book_id):
+        """Return a book and journal it; return True if it was checked out."""
+        book = self._snapshotted(book_id)
+        if not book.is_checked_out:
+            return False
+        book.is_checked_out = False
+        self._append(RETURN, book_id)
+        return True
+
+    def flush(self, fsync=False):
+        """Push buffered events to the OS (and to disk with ``fsync=True``)."""
+        self._journal.flush()
+        if fsync:
+            os.fsync(self._journal.fileno())
+
+    def compact(self):
+        """Fold the journal into a new snapshot and start an empty journal."""
+        self._journal.flush()
+        catalog = Catalog(self.catalog)   # ids become snapshot positions again
+        old, generation = self.generation, self.generation + 1
+        save_catalog(self._snapshot_path(generation), catalog, fsync=FSYNC_FULL)
+        # From here on a reopen loads the new snapshot and discards the
+        # journal, whose header still names the old generation
+        self.catalog, self.generation = catalog, generation
+        self._snapshot_size = len(catalog)
+        self._reset_journal()
+        os.unlink(self._snapshot_path(old))
+
+    def close(self):
+        self._journal.close()
+
+    def _append(self, kind, book_id):
+        self._journal.write(EVENT.pack(kind, book_id))
+        self.pending_events += 1
+        if self.compact_every and self.pending_events >= self.compact_every:
+            self.compact()
+
+    def _snapshotted(self, book_id):
+        book = self.catalog.get(book_id)
+        if book_id >= self._snapshot_size:
+            raise KeyError(f"book {book_id} was added after the last snapshot; "
+                           "compact() first")
+        return book
+
+    def _snapshot_path(self, generation):
+        return os.path.join(self.directory, SNAPSHOT.format(generation))
+
+    def _reset_journal(self):
+        """Empty the journal and tag it with the current generation, durably."""
+        self._journal.truncate(0)
+        self._journal.write(JOURNAL_HEADER.pack(JOURNAL_MAGIC, self.generation))
+        self.flush(fsync=True)
+        self.pending_events = 0
+
+    def _replay(self):
+        """Apply the journal; returns its event count, or None if it is stale."""
+        if not os.path.exists(self._journal_path):
+            return None
+        with open(self._journal_path, "rb") as file:
+            data = file.read()
+        if len(data) < JOURNAL_HEADER.size:
+            return None
+        magic, generation = JOURNAL_HEADER.unpack_from(data)
+        if magic != JOURNAL_MAGIC:
+            raise ValueError(f"{self._journal_path!r} is not a checkout journal")
+        if generation > self.generation:
+            raise ValueError(f"{self._journal_path!r} is newer than its snapshot")
+        if generation < self.generation:
+            return None
+        events = memoryview(data)[JOURNAL_HEADER.size:]
+        usable = len(events) - len(events) % EVENT.size   # drop a torn last record
+        # Only the last event per book matters
+        final = {book_id: kind for kind, book_id in EVENT.iter_unpack(events[:usable])}
+        get = self.catalog.get
+        for book_id, kind in final.items():
+            get(book_id).is_checked_out = kind == CHECK_OUT
+        return usable // EVENT.size
+
+
+def _snapshots(directory):
+    """Generations of the snapshots in ``directory``."""
+    return sorted(int(match[1]) for match in map(SNAPSHOT_NAME.fullmatch, os.listdir(directory))
+                  if match)
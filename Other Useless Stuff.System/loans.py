@@ -0,0 +1,181 @@
+"""Due dates for checkouts, and overdue detection without scanning.
+
+``Book.check_out`` only flips a flag.  ``Loans`` checks books out of a
+``Catalog`` with a due timestamp and keeps the loans that are not yet
+overdue in a heap ordered by due date, so the next loan to fall due is
+always at the top:
+
+* ``next_due()`` is O(1) (plus skipping stale entries, see below);
+* ``overdue()`` pops every loan whose due date has passed, O(log n) per
+  loan and only once per loan: a loan found overdue moves to a dict of
+  late loans, so the heap never has to be walked again for it;
+* ``on_overdue`` callbacks fire once per loan, the first time it is seen
+  overdue, and ``watch()`` is an asyncio task that sleeps until the next
+  due date and fires them on time.
+
+Returning or renewing a book leaves its old heap entry behind; entries
+that no longer match the loan are skipped when they reach the top, and
+the heap is rebuilt if they pile up.
+"""
+import heapq
+import time
+
+# Default loan period in seconds
+DEFAULT_LOAN_PERIOD = 14 * 24 * 3600
+
+
+class Loans:
+    def __init__(self, catalog, loan_period=DEFAULT_LOAN_PERIOD, clock=time.time):
+        self._catalog = catalog
+        self.loan_period = loan_period
+        self.clock = clock
+        self._due = {}        # book id -> due timestamp, for every book on loan
+        self._heap = []       # (due, book id) for loans not yet found overdue
+        self._late = {}       # book id -> due timestamp, loans found overdue
+        self._callbacks = []
+        self._wakeup = None   # asyncio.Event of a running watch()
+
+    def __len__(self):
+        return len(self._due)
+
+    def __contains__(self, book_id):
+        return book_id in self._due
+
+    def due(self, book_id):
+        """Due timestamp of the loan of ``book_id``, or None if it is not on loan."""
+        return self._due.get(book_id)
+
+    def check_out(self, book_id, due=None):
+        """Check out a book until ``due`` (default: a loan period from now).
+
+        Returns the due timestamp, or None if the book is already out.
+        """
+        book = self._catalog.get(book_id)
+        if book.is_checked_out:
+            return None
+        book.is_checked_out = True
+        return self._lend(book_id, self.clock() + self.loan_period if due is None else due)
+
+    def check_out_many(self, book_ids, due=None):
+        """Check out every available book in ``book_ids``; returns their ids.
+
+        Builds the heap in one pass when it grows by more than it holds.
+        """
+        if due is None:
+            due = self.clock() + self.loan_period
+        get = self._catalog.get
+        lent = []
+        for book_id in book_ids:
+            book = get(book_id)
+            if not book.is_checked_out:
+                book.is_checked_out = True
+                self._due[book_id] = due
+                lent.append(book_id)
+        entries = [(due, book_id) for book_id in lent]
+        if len(entries) > len(self._heap):
+            self._heap.extend(entries)
+            heapq.heapify(self._heap)
+        else:
+            for entry in entries:
+                heapq.heappush(self._heap, entry)
+        if lent:
+            self._wake(due)
+        return lent
+
+    def renew(self, book_id, due=None):
+        """Extend a loan to ``due`` (default: a loan period from now); returns it."""
+        if book_id not in self._due:
+            raise KeyError(f"book {book_id} is not on loan")
+        self._late.pop(book_id, None)
+        due = self._lend(book_id, self.clock() + self.loan_period if due is None else due)
+        if len(self._heap) > 2 * len(self._due) + 64:
+            self._rebuild()
+        return due
+
+    def return_book(self, book_id):
+        """End the loan of ``book_id``; return True if it was on loan."""
+        if self._due.pop(book_id, None) is None:
+            return False
+        self._late.pop(book_id, None)
+        self._catalog.get(book_id).is_checked_out = False
+        if len(self._heap) > 2 * len(self._due) + 64:
+            self._rebuild()
+        return True
+
+    def next_due(self):
+        """``(due, book id)`` of the earliest loan not yet found overdue, or None."""
+        heap = self._heap
+        while heap and not self._current(*heap[0]):
+            heapq.heappop(heap)
+        return heap[0] if heap else None
+
+    def overdue(self, now=None):
+        """Every loan past due at ``now`` (default: the clock) as sorted ``(due, book id)``."""
+        if now is None:
+            now = self.clock()
+        self.collect(now)
+        return sorted((due, book_id) for book_id, due in self._late.items() if due <= now)
+
+    def collect(self, now=None):
+        """Move the loans that fell due by ``now`` out of the heap.
+
+        Fires the ``on_overdue`` callbacks for each and returns how many.
+        """
+        if now is None:
+            now = self.clock()
+        heap, late, callbacks = self._heap, self._late, self._callbacks
+        found = 0
+        while heap and heap[0][0] <= now:
+            due, book_id = heapq.heappop(heap)
+            if self._current(due, book_id):
+                late[book_id] = due
+                found += 1
+                for callback in callbacks:
+                    callback(book_id, due)
+        return found
+
+    def on_overdue(self, callback):
+        """Call ``callback(book_id, due)`` once for each loan that becomes overdue."""
+        self._callbacks.append(callback)
+        return callback
+
+    async def watch(self):
+        """Fire the overdue callbacks as due dates pass, until cancelled.
+
+        Run it as a task in the event loop that makes the checkouts, e.g.
+        ``asyncio.create_task(loans.watch())``.
+        """
+        import asyncio
+
+        self._wakeup = wakeup = asyncio.Event()
+        try:
+            while True:
+                self.collect()
+                upcoming = self.next_due()
+                delay = None if upcoming is None else max(0.0, upcoming[0] - self.clock())
+                wakeup.clear()
+                try:
+                    await asyncio.wait_for(wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._wakeup = None
+
+    def _lend(self, book_id, due):
+        self._due[book_id] = due
+        heapq.heappush(self._heap, (due, book_id))
+        self._wake(due)
+        return due
+
+    def _wake(self, due):
+        # A running watch() sleeps until the old earliest due date
+        if self._wakeup is not None and self._heap and self._heap[0][0] == due:
+            self._wakeup.set()
+
+    def _current(self, due, book_id):
+        return self._due.get(book_id) == due and book_id not in self._late
+
+    def _rebuild(self):
+        late = self._late
+        self._heap = [(due, book_id) for book_id, due in self._due.items() if book_id not in late]
+        heapq.heapify(self._heap)
@@ -0,0 +1,234 @@
+"""Compact, indexed store for person records like the dict in section 3.
+
+Section 3 of ``functionsV2`` models a person as a dict with ``name``,
+``age``, ``city``, a ``hobbies`` list and (added later) ``job``.  Millions
+of such dicts cost hundreds of bytes each and every filter is a full scan.
+``PersonStore`` keeps them column by column instead, the way ``BookTable``
+keeps books: names as packed UTF-8, ages in an ``array('H')``, cities, jobs
+and hobbies dictionary-encoded, and each person's hobbies as a run of codes.
+
+Every field is indexed: a value maps to the ascending ids of the people
+that have it (a person appears under each of their hobbies).  ``match``
+turns one of those id lists into a bitmap, kept as a Python ``int`` with
+one bit per record, so queries combine with ``&``, ``|`` and ``-`` at
+machine-word speed, however many people they cover::
+
+    store.match("city", "New York") & store.match("hobbies", "coding")
+    store.where(city="New York", hobbies=("coding", "hiking"))
+
+Bitmaps of shared values are built on first use and cached, least
+recently used first out, until their value gets a new record; a value
+held by one record is just ``1 << id`` and is never cached.
+"""
+import re
+from array import array
+from collections import OrderedDict
+
+FIELDS = ("name", "age", "city", "hobbies", "job")
+# Bitmaps kept by match(); each can be as large as the store / 8 bytes
+BITMAP_CACHE_SIZE = 256
+
+# Bit positions set in each byte value, for decoding bitmaps
+_BITS = [tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256)]
+_NONZERO = re.compile(b"[^\x00]")
+
+
+class PersonStore:
+    def __init__(self, people=()):
+        self._name_data = bytearray()
+        self._name_offsets = array("Q", [0])   # record i is data[off[i]:off[i + 1]]
+        self._ages = array("H")
+        self._values = []          # code -> city, job or hobby (shared dictionary)
+        self._codes = {}           # value -> code
+        self._cities = array("I")
+        self._jobs = array("I")
+        self._hobby_codes = array("I")
+        self._hobby_offsets = array("Q", [0])
+        # field -> value -> id, or an array of ids once the value is shared
+        self._index = {field: {} for field in FIELDS}
+        self._bitmaps = OrderedDict()   # (field, value) -> (ids covered, bitmap), LRU order
+        self.extend(people)
+
+    def __len__(self):
+        return len(self._ages)
+
+    def __getitem__(self, person_id):
+        """The record as a dict shaped like the one in section 3."""
+        if person_id < 0:
+            person_id += len(self._ages)
+        if not 0 <= person_id < len(self._ages):
+            raise IndexError("person store index out of range")
+        offsets, values = self._hobby_offsets, self._values
+        person = {"name": self.name(person_id), "age": self._ages[person_id]}
+        city = values[self._cities[person_id]]
+        if city is not None:
+            person["city"] = city
+        person["hobbies"] = [values[code] for code in
+                             self._hobby_codes[offsets[person_id]:offsets[person_id + 1]]]
+        job = values[self._jobs[person_id]]
+        if job is not None:
+            person["job"] = job
+        return person
+
+    def __iter__(self):
+        for person_id in range(len(self._ages)):
+            yield self[person_id]
+
+    def add(self, person):
+        """Store a person dict and return its id.
+
+        ``name`` and ``age`` are required; ``city``, ``hobbies`` and ``job``
+        may be missing.
+        """
+        unknown = set(person) - set(FIELDS)
+        if unknown:
+            raise ValueError(f"unknown person fields: {sorted(unknown)}")
+        person_id = len(self._ages)
+        name, age = person["name"], person["age"]
+        city, job = person.get("city"), person.get("job")
+        hobbies = list(dict.fromkeys(person.get("hobbies", ())))
+
+        encoded = name.encode()
+        self._ages.append(age)   # validates the age before anything else is stored
+        self._name_data += encoded
+        self._name_offsets.append(len(self._name_data))
+        self._cities.append(self._encode(city))
+        self._jobs.append(self._encode(job))
+        self._hobby_codes.extend(self._encode(hobby) for hobby in hobbies)
+        self._hobby_offsets.append(len(self._hobby_codes))
+
+        index = self._index
+        for field, value in (("name", name), ("age", age), ("city", city), ("job", job)):
+            _post(index[field], value, person_id)
+        for hobby in hobbies:
+            _post(index["hobbies"], hobby, person_id)
+        return person_id
+
+    def extend(self, people):
+        """Add every person in ``people`` and return their ids."""
+        return [self.add(person) for person in people]
+
+    def name(self, person_id):
+        offsets = self._name_offsets
+        return self._name_data[offsets[person_id]:offsets[person_id + 1]].decode()
+
+    def ids(self, field, value):
+        """Ids of the records whose ``field`` is (or, for hobbies, includes) ``value``."""
+        return list(_ids(self._index[field], value))
+
+    def count(self, field, value):
+        return len(_ids(self._index[field], value))
+
+    def values(self, field):
+        """Distinct values of ``field`` that occur in the store."""
+        return list(self._index[field])
+
+    def match(self, field, value):
+        """``Selection`` of the records whose ``field`` is or includes ``value``."""
+        if field not in self._index:
+            raise KeyError(f"unknown person field: {field!r}")
+        ids = self._index[field].get(value, ())
+        if type(ids) is int:
+            return Selection(self, 1 << ids)
+        bitmaps = self._bitmaps
+        key = (field, value)
+        cached = bitmaps.get(key)
+        if cached is not None and cached[0] == len(ids):
+            bitmaps.move_to_end(key)
+            return Selection(self, cached[1])
+        bitmap = _bitmap(ids, len(self._ages))
+        if len(ids) > 1:
+            bitmaps[key] = (len(ids), bitmap)
+            bitmaps.move_to_end(key)
+            if len(bitmaps) > BITMAP_CACHE_SIZE:
+                bitmaps.popitem(last=False)
+        return Selection(self, bitmap)
+
+    def where(self, **criteria):
+        """Records matching every criterion; a tuple, list or set means any of.
+
+        ``where(city="Paris", hobbies=("chess", "go"))`` is people in Paris
+        with chess or go among their hobbies.
+        """
+        selection = Selection(self, (1 << len(self._ages)) - 1)
+        for field, wanted in criteria.items():
+            if isinstance(wanted, (tuple, list, set, frozenset)):
+                either = Selection(self, 0)
+                for value in wanted:
+                    either |= self.match(field, value)
+                selection &= either
+            else:
+                selection &= self.match(field, wanted)
+        return selection
+
+    def _encode(self, value):
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self._values)
+            self._values.append(value)
+        return code
+
+
+class Selection:
+    """A set of record ids in a ``PersonStore``, held as a bitmap."""
+
+    __slots__ = ("_store", "bitmap")
+
+    def __init__(self, store, bitmap):
+        self._store = store
+        self.bitmap = bitmap
+
+    def __and__(self, other):
+        return Selection(self._store, self.bitmap & other.bitmap)
+
+    def __or__(self, other):
+        return Selection(self._store, self.bitmap | other.bitmap)
+
+    def __sub__(self, other):
+        return Selection(self._store, self.bitmap & ~other.bitmap)
+
+    def __len__(self):
+        return self.bitmap.bit_count()
+
+    def __bool__(self):
+        return self.bitmap != 0
+
+    def __iter__(self):
+        """Matching ids in ascending order."""
+        data = self.bitmap.to_bytes((self.bitmap.bit_length() + 7) // 8, "little")
+        for match in _NONZERO.finditer(data):
+            base = match.start() * 8
+            for bit in _BITS[data[match.start()]]:
+                yield base + bit
+
+    def ids(self):
+        return list(self)
+
+    def records(self):
+        """The matching records as dicts."""
+        store = self._store
+        return [store[person_id] for person_id in self]
+
+
+def _post(index, value, person_id):
+    # Most names are unique, so a lone id is stored as is rather than in
+    # an array of its own
+    ids = index.get(value)
+    if ids is None:
+        index[value] = person_id
+    elif type(ids) is int:
+        index[value] = array("I", (ids, person_id))
+    else:
+        ids.append(person_id)
+
+
+def _ids(index, value):
+    ids = index.get(value, ())
+    return (ids,) if type(ids) is int else ids
+
+
+def _bitmap(ids, size):
+    bits = bytearray((size + 7) // 8)
+    for person_id in ids:
+        bits[person_id >> 3] |= 1 << (person_id & 7)
+    return int.from_bytes(bits, "little")
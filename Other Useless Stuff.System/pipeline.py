@@ -0,0 +1,165 @@
+"""Lazy filter -> map -> reduce pipelines, built from the list-comprehension demo.
+
+``[x**2 for x in numbers if x % 2 == 0]`` builds the whole list up front.
+``Pipeline(numbers).filter(is_even).map(square)`` describes the same thing
+but only does work as values are pulled, so it can run over unbounded
+sources (``itertools.count()``), files (``Pipeline.from_lines``) and stop
+early (``take``).
+
+When NumPy is installed, the source is an array or a ``range`` and every
+stage has an ``array_kernel`` (as ``is_even`` and ``square`` do), the stages
+are fused into whole-chunk array operations instead of one Python call per
+element.
+"""
+from functools import reduce
+from itertools import islice
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+# Elements per array chunk when stages are fused
+CHUNK_SIZE = 1 << 18
+# Largest magnitudes whose squares fit in int64 and uint64
+INT64_SQUARE_BOUND = 3_037_000_499
+UINT64_SQUARE_BOUND = 4_294_967_295
+
+
+def array_kernel(kernel):
+    """Attach ``kernel``, the whole-array equivalent of the decorated function."""
+    def attach(func):
+        func.array_kernel = kernel
+        return func
+    return attach
+
+
+@array_kernel(lambda values: values % 2 == 0)
+def is_even(x):
+    return x % 2 == 0
+
+
+def _square_array(values):
+    """``values * values`` without wrapping around.
+
+    Integers are widened to 64 bits first, and to Python ints (an object
+    array) when the largest magnitude could overflow even that.
+    """
+    kind = values.dtype.kind
+    if kind not in "iu" or not len(values):
+        return values * values
+    wide = values.astype(np.uint64 if kind == "u" else np.int64, copy=False)
+    bound = max(abs(int(wide.min())), abs(int(wide.max())))
+    if bound > (UINT64_SQUARE_BOUND if kind == "u" else INT64_SQUARE_BOUND):
+        wide = wide.astype(object)
+    return wide * wide
+
+
+@array_kernel(_square_array)
+def square(x):
+    return x**2
+
+
+class Pipeline:
+    def __init__(self, source, stages=()):
+        self._source = source
+        self._stages = tuple(stages)
+
+    @classmethod
+    def from_lines(cls, path, parse=int):
+        """Pipeline over the lines of a text file, each converted with ``parse``."""
+        from file_handling import iter_lines
+
+        return cls(iter_lines(path)).map(parse)
+
+    def filter(self, predicate):
+        return Pipeline(self._source, self._stages + (("filter", predicate),))
+
+    def map(self, func):
+        return Pipeline(self._source, self._stages + (("map", func),))
+
+    def __iter__(self):
+        chunks = self._array_chunks()
+        if chunks is not None:
+            return (value for chunk in chunks for value in chunk.tolist())
+        iterator = iter(self._source)
+        for kind, func in self._stages:
+            iterator = filter(func, iterator) if kind == "filter" else map(func, iterator)
+        return iterator
+
+    def take(self, k):
+        """The first ``k`` results; stops pulling from the source after that."""
+        chunks = self._array_chunks()
+        if chunks is None:
+            return list(islice(self, k))
+        result = []
+        for chunk in chunks:
+            result.extend(chunk[:k - len(result)].tolist())
+            if len(result) >= k:
+                break
+        return result
+
+    def to_list(self):
+        return list(self)
+
+    def reduce(self, func, initial):
+        return reduce(func, self, initial)
+
+    def sum(self):
+        chunks = self._array_chunks()
+        if chunks is None:
+            return sum(self)
+        return sum(_exact_sum(chunk) for chunk in chunks)
+
+    def count(self):
+        chunks = self._array_chunks()
+        if chunks is None:
+            return sum(1 for _ in self)
+        return sum(len(chunk) for chunk in chunks)
+
+    def _array_chunks(self):
+        """Result chunks as arrays, or None if the stages cannot be fused."""
+        if np is None:
+            return None
+        kernels = [(kind, getattr(func, "array_kernel", None)) for kind, func in self._stages]
+        if any(kernel is None for _, kernel in kernels):
+            return None
+
+        source = self._source
+        if isinstance(source, np.ndarray):
+            blocks = (source[i:i + CHUNK_SIZE] for i in range(0, len(source), CHUNK_SIZE))
+        elif isinstance(source, range):
+            blocks = (np.arange(part.start, part.stop, part.step, dtype=np.int64)
+                      for part in (source[i:i + CHUNK_SIZE]
+                                   for i in range(0, len(source), CHUNK_SIZE)))
+        else:
+            return None
+        return (_apply(block, kernels) for block in blocks)
+
+
+def even_squares(source):
+    """Lazy equivalent of ``[x**2 for x in source if x % 2 == 0]``."""
+    return Pipeline(source).filter(is_even).map(square)
+
+
+def _apply(block, kernels):
+    for kind, kernel in kernels:
+        block = block[kernel(block)] if kind == "filter" else kernel(block)
+    return block
+
+
+def _exact_sum(values):
+    """Sum an array chunk as a Python number, without int64 overflow.
+
+    Integers are split into high and low 32-bit halves whose partial sums
+    cannot overflow for chunks of up to 2**31 elements.
+    """
+    if not len(values):
+        return 0
+    if values.dtype.kind in "iu":
+        high = int((values >> 32).sum())
+        low = int((values & 0xFFFFFFFF).sum())
+        return (high << 32) + low
+    if values.dtype.kind == "O":
+        return sum(values.tolist())
+    return values.sum().item()
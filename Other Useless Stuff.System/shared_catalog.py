@@ -0,0 +1,226 @@
+"""A catalog published once into shared memory and read by many processes.
+
+Handing a list of ``Book`` objects to worker processes pickles every book
+and rebuilds all of them in every worker.  ``SharedCatalog.publish`` instead
+writes the catalog once into a ``multiprocessing.shared_memory`` block as
+columns (title and author string ids, page counts) plus a string table, the
+same encoding ``catalog_file`` uses on disk.  A worker attaches to the block
+by name and reads the columns through typed ``memoryview`` casts, so
+attaching is O(1) and nothing is copied; every process maps the same pages.
+
+The columns are never written after publishing.  Checkout state is a byte
+per book in the same block, changed only under striped ``multiprocessing``
+locks (book ``i`` is guarded by ``locks[i % stripes]``, as in
+``CheckoutService``), so ``check_out`` and ``return_book`` are atomic
+across processes.  Rows come back as ``BookRow`` views.
+
+A ``SharedCatalog`` can be passed to a ``multiprocessing.Process`` (or a
+pool initializer); it pickles as its block name and locks and re-attaches
+in the child.  The publishing process unlinks the block when it closes.
+Attaching never registers the block with a resource tracker the publisher
+does not share, so an attached process exiting does not unlink it.
+"""
+import os
+import struct
+import sys
+from array import array
+from multiprocessing import resource_tracker, shared_memory
+
+from book_table import BookRow
+
+MAGIC = b"SHMCAT1\0"
+# magic, books, strings, bytes of string data
+HEADER = struct.Struct("=8sQQQ")
+
+
+class SharedCatalog:
+    def __init__(self, shm, locks, owner=False, tracker=None):
+        """View of a published block; use ``publish`` or ``attach`` instead."""
+        self._shm = shm
+        self._locks = locks
+        # Only the publishing process unlinks, not children forked with a copy
+        self._owner_pid = os.getpid() if owner else None
+        self._tracker = tracker
+        buf = shm.buf
+        magic, count, n_strings, n_bytes = HEADER.unpack_from(buf)
+        if magic != MAGIC:
+            shm.close()
+            raise ValueError(f"shared memory block {shm.name!r} is not a published catalog")
+        self._count = count
+        views = _layout(buf, count, n_strings, n_bytes)
+        (self._string_offsets, self._titles, self._authors, self._pages,
+         self._flags, self._string_data) = views
+        self._views = views
+
+    @classmethod
+    def publish(cls, books, stripes=64, context=None):
+        """Copy ``books`` into a new shared memory block and return its owner.
+
+        The locks come from ``context`` (default: ``multiprocessing``), which
+        must be the context the workers are started with.
+        """
+        if context is None:
+            import multiprocessing as context
+
+        string_ids = {}
+        strings = []
+        titles, authors, pages, flags = array("I"), array("I"), array("I"), bytearray()
+        for book in books:
+            for text, column in ((book.title, titles), (book.author, authors)):
+                string_id = string_ids.get(text)
+                if string_id is None:
+                    string_id = string_ids[text] = len(strings)
+                    strings.append(text)
+                column.append(string_id)
+            pages.append(book.pages)
+            flags.append(book.is_checked_out)
+        encoded = [text.encode() for text in strings]
+        offsets = array("Q", [0])
+        for data in encoded:
+            offsets.append(offsets[-1] + len(data))
+
+        count, size = len(pages), _size(len(pages), len(strings), offsets[-1])
+        shm = shared_memory.SharedMemory(create=True, size=size)
+        try:
+            HEADER.pack_into(shm.buf, 0, MAGIC, count, len(strings), offsets[-1])
+            views = _layout(shm.buf, count, len(strings), offsets[-1])
+            for view, values in zip(views, (offsets, titles, authors, pages, flags,
+                                            b"".join(encoded))):
+                view[:] = memoryview(values)
+                view.release()
+        except BaseException:
+            shm.close()
+            shm.unlink()
+            raise
+        return cls(shm, [context.Lock() for _ in range(stripes)], owner=True,
+                   tracker=_tracker_id())
+
+    @classmethod
+    def attach(cls, name, locks, tracker=None):
+        """Attach to the block published as ``name``, without copying it.
+
+        ``tracker`` identifies the publisher's resource tracker; pickling
+        passes it along.  Unless this process feeds that same tracker (as
+        the publisher's ``multiprocessing`` children do), the block is
+        unregistered from the tracker it was just registered with.
+        """
+        if sys.version_info >= (3, 13):
+            return cls(shared_memory.SharedMemory(name=name, track=False), locks, tracker=tracker)
+        shm = shared_memory.SharedMemory(name=name)
+        if os.name == "posix" and (tracker is None or tracker != _tracker_id()):
+            resource_tracker.unregister(shm._name, "shared_memory")
+        return cls(shm, locks, tracker=tracker)
+
+    @property
+    def name(self):
+        """Name of the shared memory block, for ``attach``."""
+        return self._shm.name
+
+    def __reduce__(self):
+        return SharedCatalog.attach, (self._shm.name, self._locks, self._tracker)
+
+    def close(self):
+        """Detach; the publishing process also frees the block.
+
+        A block someone else already unlinked is not an error.
+        """
+        for view in self._views:
+            view.release()
+        self._shm.close()
+        if self._owner_pid == os.getpid():
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                # unlink() stops before unregistering; do it so the tracker
+                # does not try again at exit
+                if os.name == "posix":
+                    resource_tracker.unregister(self._shm._name, "shared_memory")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("shared catalog index out of range")
+        return BookRow(self, index)
+
+    def __iter__(self):
+        for index in range(self._count):
+            yield BookRow(self, index)
+
+    # Column access by row index, as in BookTable (0 <= index < len(catalog))
+    def title(self, index):
+        return self._string(self._titles[index])
+
+    def author(self, index):
+        return self._string(self._authors[index])
+
+    def pages(self, index):
+        return self._pages[index]
+
+    def page_counts(self):
+        """Read-only, zero-copy view of the whole pages column.
+
+        ``numpy.frombuffer`` accepts it as is.
+        """
+        return self._pages.toreadonly()
+
+    def is_checked_out(self, index):
+        return bool(self._flags[index])
+
+    def set_checked_out(self, index, value):
+        with self._locks[index % len(self._locks)]:
+            self._flags[index] = bool(value)
+
+    def check_out(self, index):
+        """Check out one book; return True if this call checked it out."""
+        with self._locks[index % len(self._locks)]:
+            if self._flags[index]:
+                return False
+            self._flags[index] = 1
+            return True
+
+    def return_book(self, index):
+        """Return one book; return True if it was checked out."""
+        with self._locks[index % len(self._locks)]:
+            if not self._flags[index]:
+                return False
+            self._flags[index] = 0
+            return True
+
+    def _string(self, string_id):
+        offsets = self._string_offsets
+        return str(self._string_data[offsets[string_id]:offsets[string_id + 1]], "utf-8")
+
+
+def _tracker_id():
+    """Identity of this process's resource tracker: the pipe that feeds it."""
+    if os.name != "posix":
+        return None
+    stat = os.fstat(resource_tracker.getfd())
+    return stat.st_dev, stat.st_ino
+
+
+def _size(count, n_strings, n_bytes):
+    return HEADER.size + 8 * (n_strings + 1) + 12 * count + count + n_bytes
+
+
+def _layout(buf, count, n_strings, n_bytes):
+    """Views of the sections of a block: the 8-byte column first, bytes last."""
+    sections = [("Q", n_strings + 1), ("I", count), ("I", count), ("I", count),
+                ("B", count), ("B", n_bytes)]
+    views = []
+    position = HEADER.size
+    for typecode, length in sections:
+        end = position + struct.calcsize(typecode) * length
+        views.append(buf[position:end].cast(typecode))
+        position = end
+    return views
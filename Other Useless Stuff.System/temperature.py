@@ -0,0 +1,112 @@
+"""Banding of temperature readings, generalized from the control-flow demo.
+
+Section 4 of ``functionsV2`` classifies one reading with an if/elif chain:
+hot above 30, perfect from 20 to 30, chilly below 20.  ``TemperatureBands``
+describes the same thing as sorted edges, so a reading's band is the number
+of edges at or below it: one ``bisect`` for a single reading, one
+``numpy.searchsorted`` pass for a whole array.  Every batch it classifies is
+added to running per-band counts, and ``stream`` does this chunk by chunk
+over an iterator of readings of any length.
+
+A band includes its lower edge.  ``above(x)`` is the edge for "strictly
+above x", which is how the default bands keep 30 in "perfect".
+
+A NaN reading fails every comparison, so section 4 sends it down its
+``else`` branch to "chilly"; here too it goes to the first (lowest) band.
+"""
+import math
+from bisect import bisect_right
+from itertools import islice
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+# Readings per chunk in ``stream``
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+
+def above(x):
+    """Edge for a band that starts strictly above ``x``."""
+    return math.nextafter(x, math.inf)
+
+
+# The thresholds of functionsV2.section_control_flow
+DEFAULT_EDGES = (20, above(30))
+DEFAULT_LABELS = ("chilly", "perfect", "hot")
+
+
+class TemperatureBands:
+    def __init__(self, edges=DEFAULT_EDGES, labels=DEFAULT_LABELS):
+        """Bands split at ``edges`` (ascending); one more label than edges."""
+        edges, labels = tuple(edges), tuple(labels)
+        if len(labels) != len(edges) + 1:
+            raise ValueError(f"{len(edges)} edges need {len(edges) + 1} labels, got {len(labels)}")
+        if any(low >= high for low, high in zip(edges, edges[1:])):
+            raise ValueError(f"edges must be strictly increasing: {edges}")
+        self.edges = edges
+        self.labels = labels
+        self.counts = [0] * len(labels)
+        self._edge_array = None if np is None else np.asarray(edges, dtype=np.float64)
+
+    def band(self, reading):
+        """Index of the band ``reading`` falls in (not counted)."""
+        if reading != reading:   # NaN
+            return 0
+        return bisect_right(self.edges, reading)
+
+    def classify(self, reading):
+        """Label of the band ``reading`` falls in (not counted)."""
+        return self.labels[self.band(reading)]
+
+    def bucket(self, readings):
+        """Band index of every reading, added to the running counts.
+
+        Returns an ndarray when NumPy is available, otherwise a list.
+        """
+        if np is not None:
+            readings = np.asarray(readings)
+            bands = np.searchsorted(self._edge_array, readings, side="right")
+            if readings.dtype.kind == "f":
+                nan = np.isnan(readings)
+                if nan.any():
+                    bands[nan] = 0
+            counts = np.bincount(bands, minlength=len(self.labels)).tolist()
+        else:
+            edges = self.edges
+            bands = [bisect_right(edges, reading) if reading == reading else 0
+                     for reading in readings]
+            counts = [0] * len(self.labels)
+            for band in bands:
+                counts[band] += 1
+        self.counts = [total + n for total, n in zip(self.counts, counts)]
+        return bands
+
+    def stream(self, readings, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Yield the band indices of an iterable of readings, one chunk at a time.
+
+        Only ``chunk_size`` readings are held at once; the running counts are
+        up to date after each chunk.
+        """
+        if np is not None and isinstance(readings, np.ndarray):
+            for start in range(0, len(readings), chunk_size):
+                yield self.bucket(readings[start:start + chunk_size])
+            return
+
+        iterator = iter(readings)
+        while True:
+            if np is not None:
+                chunk = np.fromiter(islice(iterator, chunk_size), np.float64)
+            else:
+                chunk = list(islice(iterator, chunk_size))
+            if not len(chunk):
+                return
+            yield self.bucket(chunk)
+
+    def totals(self):
+        """Running counts so far as ``{label: count}``."""
+        return dict(zip(self.labels, self.counts))
+
+    def reset(self):
+        self.counts = [0] * len(self.labels)
@@ -0,0 +1,120 @@
+"""Full-text search over book titles and authors.
+
+``TextIndex`` is an inverted index: every normalized token maps to the ids
+of the books whose title or author contains it, with a per-book weight
+(title matches count double).  A query only touches the postings of its
+own tokens, so its cost depends on how common those tokens are, not on the
+size of the catalog.  Results are ranked by TF-IDF and only the top ``k``
+are sorted.
+
+Prefix queries go through a sorted list of the vocabulary.  Like the pages
+index in ``Catalog``, it is built on first use and then kept sorted as
+tokens come and go.
+
+Ids are the caller's, so an index built from ``Catalog.items()`` stays in
+step with the catalog as long as books are added and removed in both::
+
+    index = TextIndex(catalog.items())
+    index.add(catalog.add(book), book)
+"""
+import heapq
+import math
+import re
+import unicodedata
+from bisect import bisect_left, insort
+
+TITLE_WEIGHT = 2
+AUTHOR_WEIGHT = 1
+
+_WORD = re.compile(r"\w+")
+
+
+def tokenize(text):
+    """Lower-case, accent-free word tokens of ``text``."""
+    text = unicodedata.normalize("NFKD", text.casefold())
+    if not text.isascii():
+        text = "".join(c for c in text if not unicodedata.combining(c))
+    return _WORD.findall(text)
+
+
+class TextIndex:
+    def __init__(self, items=()):
+        self._postings = {}       # token -> {book id: weight}
+        self._tokens = {}         # book id -> tokens it was indexed under
+        self._vocabulary = None   # sorted tokens, built by the first prefix query
+        for book_id, book in items:
+            self.add(book_id, book)
+
+    def __len__(self):
+        return len(self._tokens)
+
+    def __contains__(self, book_id):
+        return book_id in self._tokens
+
+    def add(self, book_id, book):
+        """Index ``book`` under ``book_id``."""
+        if book_id in self._tokens:
+            raise ValueError(f"book id {book_id} is already indexed")
+        weights = {}
+        for token in tokenize(book.title):
+            weights[token] = weights.get(token, 0) + TITLE_WEIGHT
+        for token in tokenize(book.author):
+            weights[token] = weights.get(token, 0) + AUTHOR_WEIGHT
+        for token, weight in weights.items():
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = {}
+                if self._vocabulary is not None:
+                    insort(self._vocabulary, token)
+            postings[book_id] = weight
+        self._tokens[book_id] = tuple(weights)
+
+    def remove(self, book_id):
+        """Drop ``book_id`` from the index; raises ``KeyError`` if unknown."""
+        for token in self._tokens.pop(book_id):
+            postings = self._postings[token]
+            del postings[book_id]
+            if not postings:
+                del self._postings[token]
+                if self._vocabulary is not None:
+                    del self._vocabulary[bisect_left(self._vocabulary, token)]
+
+    def prefix(self, prefix, limit=None):
+        """Indexed tokens starting with ``prefix`` (normalized), in sorted order."""
+        tokens = tokenize(prefix)
+        if len(tokens) != 1:
+            return []
+        prefix = tokens[0]
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        vocabulary = self._vocabulary
+        found = []
+        for i in range(bisect_left(vocabulary, prefix), len(vocabulary)):
+            if not vocabulary[i].startswith(prefix) or len(found) == limit:
+                break
+            found.append(vocabulary[i])
+        return found
+
+    def search(self, query, k=10, prefix=False):
+        """The ``k`` best ``(book id, score)`` matches for ``query``, best first.
+
+        A book matches if it contains any query token; books containing
+        more (and rarer) tokens score higher.  With ``prefix=True`` the last
+        token also matches every indexed token it is a prefix of, for
+        search-as-you-type.
+        """
+        tokens = tokenize(query)
+        if prefix and tokens:
+            tokens[-1:] = self.prefix(tokens[-1])
+        n = len(self._tokens)
+        scores = {}
+        for token in dict.fromkeys(tokens):
+            postings = self._postings.get(token)
+            if not postings:
+                continue
+            idf = math.log(1 + n / len(postings))
+            get = scores.get
+            for book_id, weight in postings.items():
+                scores[book_id] = get(book_id, 0.0) + weight * idf
+        # Ties go to the lower id
+        return heapq.nsmallest(k, scores.items(), key=lambda item: (-item[1], item[0]))